@@ -15,6 +15,7 @@ from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 import json
+import os
 
 router = APIRouter()
 security = HTTPBearer()
@@ -67,12 +68,51 @@ class ArticleResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class ArticleSummary(BaseModel):
+    """목록용 요약. fullContent / email은 빼고, image는 URL일 때만 담습니다 (base64는 상세에서)."""
+    id: int
+    title: str
+    content: str
+    date: str
+    reporter: Optional[str] = None
+    department: Optional[str] = None
+    image: Optional[str] = None
+    hasImage: bool = False
+    tags: Optional[List[str]] = None
+    views: int
+    status: str
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+class ArticlePage(BaseModel):
+    articles: List[ArticleSummary]  # fields= 지정 시 해당 필드만
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달 (없으면 마지막 페이지)
+
 class StatusUpdate(BaseModel):
     status: str
 
 class ViewsResponse(BaseModel):
     views: int
 
+# ============================================
+# 데이터베이스 의존성
+# ============================================
+
+def get_db():
+    """
+    데이터베이스 세션을 생성합니다.
+    backend_main의 저장소 계층(sql_storage)과 같은 엔진 / 연결 풀(DATABASE_URL, SQLite는 WAL)을 사용합니다.
+    articles / users 테이블과 인덱스는 sql_storage에 정의되어 있고 엔진 생성 시 만들어집니다.
+    """
+    from sql_storage import shared_engine
+    from storage import DEFAULT_DATABASE_URL
+
+    db = Session(shared_engine(os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL)))
+    try:
+        yield db
+    finally:
+        db.close()
+
 # ============================================
 # 인증 의존성 (JWT 토큰 검증)
 # ============================================
@@ -94,20 +134,68 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
 # API 엔드포인트
 # ============================================
 
-@router.get("/articles", response_model=List[ArticleResponse])
+@router.get("/articles", response_model=ArticlePage)
 async def get_articles(
-    skip: int = 0,
     limit: int = 100,
     status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     db: Session = Depends(get_db)  # 데이터베이스 세션 의존성
 ):
     """
-    기사 목록을 가져옵니다.
+    기사 목록을 최근 수정순으로 가져옵니다.
+    offset()은 건너뛸 행을 모두 읽어야 해서 깊은 페이지일수록 느려지므로,
+    (updated_at, id) 키셋 커서로 인덱스에서 바로 다음 위치를 찾습니다.
+
+    fullContent / image는 deferred 컬럼이라 목록 쿼리에서는 SELECT 하지 않고,
+    image가 URL인지 여부(image_url)와 존재 여부(has_image)만 SQL에서 계산해 가져옵니다.
+    fields=title,views 처럼 필요한 컬럼만 고를 수도 있습니다 (article_projection.parse_fields).
     """
     # TODO: 데이터베이스에서 기사 목록 조회
-    # 예: articles = db.query(Article).filter(...).offset(skip).limit(limit).all()
+    # 예 (ix_articles_status_updated_id 인덱스 사용):
+    # from sqlalchemy import and_, or_
+    # from article_store import decode_cursor, encode_cursor, from_micros, sort_key
+    #
+    # from sqlalchemy.orm import load_only, undefer
+    # from fastapi.encoders import jsonable_encoder
+    # from fastapi.responses import JSONResponse
+    # from article_projection import SUMMARY_FIELDS, parse_fields, project
+    #
+    # selected = parse_fields(fields)  # 알 수 없는 필드는 400
+    # query = db.query(Article)
+    # if selected is None:
+    #     query = query.options(undefer(Article.has_image), undefer(Article.image_url))
+    # else:
+    #     # 지정한 컬럼만 로드 (무거운 컬럼도 명시했을 때만)
+    #     columns = [getattr(Article, f) for f in selected if f != "hasImage"]
+    #     query = query.options(load_only(*columns, Article.updated_at))
+    # if status:
+    #     query = query.filter(Article.status == status)
+    # if cursor:
+    #     micros, last_id = decode_cursor(cursor)  # 잘못된 커서는 400
+    #     last_updated = from_micros(micros)  # 커서는 updated_at의 epoch 마이크로초 (정수라 오차 없음)
+    #     query = query.filter(or_(
+    #         Article.updated_at < last_updated,
+    #         and_(Article.updated_at == last_updated, Article.id < last_id),
+    #     ))
+    # rows = query.order_by(Article.updated_at.desc(), Article.id.desc()).limit(limit + 1).all()
+    # next_cursor = None
+    # if len(rows) > limit:
+    #     rows = rows[:limit]
+    #     next_cursor = encode_cursor(sort_key({"id": rows[-1].id, "updated_at": rows[-1].updated_at}))
+    # def to_item(row):
+    #     if selected is None:
+    #         item = project(row.__dict__, SUMMARY_FIELDS)
+    #         item.update(image=row.image_url, hasImage=row.has_image)
+    #         return item
+    #     return project(row.__dict__, selected)
+    #
+    # return JSONResponse(jsonable_encoder({
+    #     "articles": [to_item(row) for row in rows],
+    #     "next_cursor": next_cursor,
+    # }))
     # 여기서는 예시 응답 반환
-    return []
+    return ArticlePage(articles=[])
 
 @router.get("/articles/{article_id}", response_model=ArticleResponse)
 async def get_article(
@@ -236,17 +324,18 @@ async def increment_views(
     """
     기사 조회수를 1 증가시킵니다.
     인증 없이도 호출 가능 (조회수는 공개 데이터)
+
+    조회마다 query → += 1 → commit → refresh 하지 않고,
+    view_counter(샤드 메모리 카운터)에 쌓았다가 주기적으로 배치 UPDATE 합니다.
     """
-    # TODO: 데이터베이스에서 기사 조회 및 조회수 증가
+    # TODO: 데이터베이스에서 기사 조회수 읽기 + 증가분 누적
     # 예:
-    # db_article = db.query(Article).filter(Article.id == article_id).first()
-    # if not db_article:
+    # views = db.query(Article.views).filter(Article.id == article_id).scalar()
+    # if views is None:
     #     raise HTTPException(status_code=404, detail="기사를 찾을 수 없습니다")
     # 
-    # db_article.views += 1
-    # db.commit()
-    # db.refresh(db_article)
-    # return ViewsResponse(views=db_article.views)
+    # pending = view_counter.incr(article_id)
+    # return ViewsResponse(views=views + pending)
     
     # 임시 응답
     return ViewsResponse(views=1)
@@ -280,28 +369,32 @@ async def update_article_status(
     raise HTTPException(status_code=404, detail="기사를 찾을 수 없습니다")
 
 # ============================================
-# 데이터베이스 의존성 (예시)
+# 조회수 배치 반영 (예시)
 # ============================================
-
-def get_db():
-    """
-    데이터베이스 세션을 생성합니다.
-    실제 구현은 백엔드의 데이터베이스 설정에 맞게 수정하세요.
-    """
-    # 예: 
-    # from app.db.database import SessionLocal
-    # db = SessionLocal()
-    # try:
-    #     yield db
-    # finally:
-    #     db.close()
-    pass
+# from sqlalchemy import bindparam, update
+# from view_counter import ViewCounter
+#
+# def flush_view_deltas(deltas: dict):
+#     """{id: 증가분}을 트랜잭션 하나의 executemany UPDATE로 반영합니다."""
+#     stmt = (
+#         update(Article.__table__)
+#         .where(Article.__table__.c.id == bindparam("b_id"))
+#         .values(views=Article.__table__.c.views + bindparam("b_delta"))
+#     )
+#     with SessionLocal() as db:
+#         db.execute(stmt, [{"b_id": k, "b_delta": v} for k, v in deltas.items()])
+#         db.commit()
+#
+# view_counter = ViewCounter.from_env(flush_view_deltas)
+# 앱 lifespan에서 view_counter.start() / await view_counter.stop() 호출 (종료 시 남은 증가분 반영)
 
 # ============================================
-# 데이터베이스 모델 예시 (SQLAlchemy)
+# 데이터베이스 모델 예시 (SQLAlchemy ORM)
 # ============================================
+# 같은 스키마의 테이블 / 인덱스는 sql_storage.articles (SQLAlchemy Core)에 정의되어 있습니다.
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index, case
+from sqlalchemy.orm import column_property, deferred
 from app.db.database import Base
 
 class Article(Base):
@@ -310,16 +403,27 @@ class Article(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     content = Column(Text)  # 미리보기
-    fullContent = Column(Text)  # 전체 본문
+    fullContent = deferred(Column(Text))  # 전체 본문 (상세 조회 시에만 로드)
     date = Column(String)
     reporter = Column(String)
     department = Column(String)
     email = Column(String)
-    image = Column(Text)  # 이미지 URL 또는 base64
+    image = deferred(Column(Text))  # 이미지 URL 또는 base64 (상세 조회 시에만 로드)
     tags = Column(JSON)  # 또는 Text로 JSON 문자열 저장
     views = Column(Integer, default=0)
     status = Column(String, default="draft")  # draft, review, published, archived
     author_id = Column(Integer, nullable=False)  # 작성자 ID
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    __table_args__ = (
+        # 목록 키셋 페이지네이션용 (전체 목록은 ix_articles_updated_id)
+        Index("ix_articles_status_updated_id", "status", "updated_at", "id"),
+        Index("ix_articles_updated_id", "updated_at", "id"),
+    )
+
+# 목록용 계산 컬럼 (무거운 image 값을 가져오지 않고 DB에서 계산, 기본은 로드하지 않음)
+_image = Article.__table__.c.image
+Article.has_image = column_property(_image.isnot(None), deferred=True)
+Article.image_url = column_property(case((_image.like("data:%"), None), else_=_image), deferred=True)
 """
@@ -0,0 +1,58 @@
+"""
+기사 목록용 필드 투영(projection)
+목록 응답에서 본문 전체(fullContent)와 base64 이미지처럼 무거운 필드를 빼고
+필요한 필드만 담은 가벼운 dict를 만듭니다.
+
+- 기본(요약): SUMMARY_FIELDS + hasImage. image는 URL일 때만 포함하고 data: URI(base64)는 생략
+- fields=title,views 처럼 지정하면 해당 필드만 (id는 항상 포함)
+- 저장소가 hasImage를 미리 계산해 넘기면(SQL 요약 조회는 image 열을 읽지 않음) 그 값을 씁니다.
+"""
+
+from typing import Iterable, Optional, Tuple
+
+# 상세(ArticleResponse)에 있는 전체 필드
+ARTICLE_FIELDS = (
+    "id", "title", "content", "fullContent", "date", "reporter", "department", "email",
+    "image", "tags", "views", "status", "created_at", "updated_at",
+)
+# 목록 화면에 필요 없는 무거운 필드
+HEAVY_FIELDS = ("fullContent", "image")
+SUMMARY_FIELDS = tuple(f for f in ARTICLE_FIELDS if f not in HEAVY_FIELDS and f != "email")
+# 계산 필드: 이미지 존재 여부 (상세를 다시 불러올지 판단용)
+COMPUTED_FIELDS = ("hasImage",)
+
+
+def is_inline_image(image: Optional[str]) -> bool:
+    """base64 data: URI처럼 본문에 박힌 이미지인지 확인합니다."""
+    return bool(image) and image.startswith("data:")
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    "title,views" 형태의 sparse fieldset을 검증된 필드 튜플로 바꿉니다.
+    지정이 없으면 None(요약 투영), 알 수 없는 필드가 있으면 ValueError.
+    """
+    if not fields:
+        return None
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in ARTICLE_FIELDS and name not in COMPUTED_FIELDS]
+    if unknown:
+        raise ValueError(", ".join(unknown))
+    if "id" not in names:
+        names.insert(0, "id")
+    return tuple(dict.fromkeys(names))
+
+
+def project(article: dict, fields: Optional[Iterable[str]] = None) -> dict:
+    """기사 레코드에서 응답에 담을 필드만 골라 새 dict를 만듭니다."""
+    image = article.get("image")
+    has_image = bool(article["hasImage"]) if "hasImage" in article else bool(image)
+    if fields is None:
+        summary = {name: article.get(name) for name in SUMMARY_FIELDS}
+        summary["image"] = None if is_inline_image(image) else image
+        summary["hasImage"] = has_image
+        return summary
+    projected = {}
+    for name in fields:
+        projected[name] = has_image if name == "hasImage" else article.get(name)
+    return projected
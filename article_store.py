@@ -0,0 +1,261 @@
+"""
+기사 인메모리 저장소
+id 해시 인덱스와 status / author_id 보조 인덱스를 유지하여
+조회·수정·삭제를 기사 수와 무관하게 O(1)로 처리합니다.
+
+목록은 (updated_at, id) 정렬 인덱스(전체 + 상태별)로 키셋(커서) 페이지네이션을 지원합니다.
+몇 번째 페이지든 bisect 한 번 + limit개 복사로 끝나므로 깊은 페이지도 첫 페이지와 비용이 같습니다.
+정렬 인덱스는 sortedcontainers.SortedList라서 삽입·삭제도 O(log n)입니다.
+sortedcontainers가 없으면 정렬된 list로 대신하며, 이때 쓰기는 O(n) 원소 이동이 생깁니다.
+"""
+
+from bisect import bisect_left, insort
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import base64
+import threading
+
+from storage import ArticleRepository
+
+try:
+    from sortedcontainers import SortedList
+    SORTEDCONTAINERS_AVAILABLE = True
+except ImportError:
+    SortedList = None
+    SORTEDCONTAINERS_AVAILABLE = False
+
+# 정렬 키: (updated_at의 epoch 마이크로초, id)
+# 정수라서 SQL 백엔드에서 datetime으로 되돌려도 오차 없이 같은 위치를 가리킵니다.
+SortKey = Tuple[int, int]
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_micros(value) -> int:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if not isinstance(value, datetime):
+        return 0
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def from_micros(micros: int) -> datetime:
+    return _EPOCH + micros * _MICROSECOND
+
+
+def sort_key(article: dict) -> SortKey:
+    return to_micros(article.get("updated_at")), article["id"]
+
+
+def encode_cursor(key: SortKey) -> str:
+    """정렬 키를 클라이언트에 넘길 불투명한 커서 문자열로 만듭니다."""
+    raw = f"{key[0]}:{key[1]}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> SortKey:
+    """encode_cursor의 역. 형식이 잘못되면 ValueError."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        micros, article_id = raw.split(":")
+        return int(micros), int(article_id)
+    except Exception as e:
+        raise ValueError(f"invalid cursor: {cursor!r}") from e
+
+
+class _SortedKeys(list):
+    """sortedcontainers가 없을 때 쓰는 SortedList 대용 (add / discard / bisect_left만)"""
+
+    def add(self, key: SortKey):
+        insort(self, key)
+
+    def discard(self, key: SortKey):
+        i = bisect_left(self, key)
+        if i < len(self) and self[i] == key:
+            del self[i]
+
+    def bisect_left(self, key: SortKey) -> int:
+        return bisect_left(self, key)
+
+
+def _sorted_keys():
+    return SortedList() if SORTEDCONTAINERS_AVAILABLE else _SortedKeys()
+
+
+class ArticleStore(ArticleRepository):
+    """
+    기사 레코드(dict)를 보관하는 인메모리 저장소 (STORAGE_BACKEND=memory, 테스트용).
+
+    - _by_id: id -> 레코드 (기본 인덱스)
+    - _by_status / _by_author: 값 -> {id: 레코드} (보조 인덱스)
+      dict는 삽입 순서를 보존하므로 목록 순서가 유지되고, 삭제도 O(1)입니다.
+    - _ordered: None(전체) / status -> 오름차순 정렬된 (updated_at, id) 키 목록 (페이지네이션용)
+    """
+
+    def __init__(self):
+        self._by_id: Dict[int, dict] = {}
+        self._by_status: Dict[str, Dict[int, dict]] = defaultdict(dict)
+        self._by_author: Dict[int, Dict[int, dict]] = defaultdict(dict)
+        self._ordered: Dict[Optional[str], "SortedList"] = defaultdict(_sorted_keys)
+        self._next_id = 1
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, article_id: int) -> bool:
+        return article_id in self._by_id
+
+    # ============================================
+    # 인덱스 관리
+    # ============================================
+
+    @staticmethod
+    def _partitions(article: dict) -> tuple:
+        # None은 전체 목록 파티션이므로 status가 없는 기사는 전체 목록에만 넣음
+        status = article.get("status")
+        return (None,) if status is None else (None, status)
+
+    def _index(self, article: dict):
+        self._by_status[article.get("status")][article["id"]] = article
+        self._by_author[article.get("author_id")][article["id"]] = article
+        key = sort_key(article)
+        for partition in self._partitions(article):
+            self._ordered[partition].add(key)
+
+    def _unindex(self, article: dict):
+        for index, key in ((self._by_status, article.get("status")),
+                           (self._by_author, article.get("author_id"))):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(article["id"], None)
+                if not bucket:
+                    del index[key]
+        key = sort_key(article)
+        for partition in self._partitions(article):
+            keys = self._ordered.get(partition)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if partition is not None and not keys:
+                del self._ordered[partition]
+
+    # ============================================
+    # CRUD
+    # ============================================
+
+    def add(self, data: dict) -> dict:
+        """새 id를 할당하고 기사를 저장합니다."""
+        with self._lock:
+            article = dict(data)
+            article["id"] = self._next_id
+            self._next_id += 1
+            self._by_id[article["id"]] = article
+            self._index(article)
+            return article
+
+    def get(self, article_id: int) -> Optional[dict]:
+        return self._by_id.get(article_id)
+
+    def update(self, article_id: int, changes: dict) -> Optional[dict]:
+        """필드를 갱신합니다. status / author_id / updated_at이 바뀌면 보조·정렬 인덱스도 옮깁니다."""
+        with self._lock:
+            article = self._by_id.get(article_id)
+            if article is None:
+                return None
+            reindex = any(k in changes for k in ("status", "author_id", "updated_at"))
+            if reindex:
+                self._unindex(article)
+            article.update(changes)
+            article["id"] = article_id
+            if reindex:
+                self._index(article)
+            return article
+
+    def delete(self, article_id: int) -> Optional[dict]:
+        with self._lock:
+            article = self._by_id.pop(article_id, None)
+            if article is not None:
+                self._unindex(article)
+            return article
+
+    def increment_views(self, article_id: int, amount: int = 1) -> Optional[int]:
+        """조회수를 증가시키고 새 값을 반환합니다. 기사가 없으면 None."""
+        with self._lock:
+            article = self._by_id.get(article_id)
+            if article is None:
+                return None
+            article["views"] = article.get("views", 0) + amount
+            return article["views"]
+
+    def apply_view_deltas(self, deltas: Dict[int, int]) -> int:
+        """
+        {id: 증가분}을 잠금 한 번으로 반영합니다 (ViewCounter의 배치 flush용).
+        이미 삭제된 기사는 건너뛰고, 반영한 기사 수를 반환합니다.
+        """
+        applied = 0
+        with self._lock:
+            for article_id, amount in deltas.items():
+                article = self._by_id.get(article_id)
+                if article is not None:
+                    article["views"] = article.get("views", 0) + amount
+                    applied += 1
+        return applied
+
+    # ============================================
+    # 목록 조회
+    # ============================================
+
+    def iter(self, status: Optional[str] = None) -> Iterator[dict]:
+        """전체 또는 특정 상태의 기사를 삽입 순서대로 순회합니다."""
+        if status is None:
+            return iter(self._by_id.values())
+        return iter(self._by_status.get(status, {}).values())
+
+    def list(self, status: Optional[str] = None, skip: int = 0, limit: Optional[int] = None) -> List[dict]:
+        """필터 결과 전체를 복사하지 않고 필요한 구간만 잘라 반환합니다."""
+        stop = None if limit is None else skip + limit
+        return list(islice(self.iter(status), skip, stop))
+
+    def page(
+        self,
+        status: Optional[str] = None,
+        limit: int = 20,
+        after: Optional[SortKey] = None,
+        skip: int = 0,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Tuple[List[dict], Optional[SortKey]]:
+        """
+        (updated_at, id) 내림차순(최신 수정순) 한 페이지와 다음 페이지 키를 반환합니다.
+        after가 있으면 그 키 바로 다음부터, 없으면 맨 앞에서 skip개를 건너뛴 위치부터 시작합니다.
+        다음 페이지가 없으면 다음 키는 None.
+        레코드를 복사하지 않고 그대로 돌려주므로 fields는 쓰지 않습니다.
+        """
+        with self._lock:
+            keys = self._ordered.get(status)
+            if keys is None:
+                return [], None
+            end = keys.bisect_left(after) if after is not None else len(keys) - skip
+            end = max(0, end)
+            start = max(0, end - limit)
+            page_keys = keys[start:end]
+            page_keys.reverse()
+            articles = [self._by_id[article_id] for _, article_id in page_keys]
+            next_key = page_keys[-1] if start > 0 and page_keys else None
+            return articles, next_key
+
+    def by_status(self, status: str) -> List[dict]:
+        return list(self._by_status.get(status, {}).values())
+
+    def by_author(self, author_id: int) -> List[dict]:
+        return list(self._by_author.get(author_id, {}).values())
+
+    def count(self, status: Optional[str] = None) -> int:
+        if status is None:
+            return len(self._by_id)
+        return len(self._by_status.get(status, {}))
@@ -3,36 +3,84 @@ Render 배포용 FastAPI 백엔드 메인 파일
 CORS 및 JWT 인증이 포함된 완전한 백엔드 예시
 """
 
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import JSONResponse
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel
 from datetime import datetime, timedelta
+from contextlib import asynccontextmanager
 import jwt
-from passlib.context import CryptContext
 import os
-import requests
-from bs4 import BeautifulSoup
-import re
+import httpx
+import warnings
 
-# Playwright는 선택적 의존성 (설치되어 있으면 사용)
-try:
-    from playwright.async_api import async_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+from article_projection import ARTICLE_FIELDS, parse_fields, project
+from article_store import decode_cursor, encode_cursor, sort_key
+from broadcast import Broadcaster
+from browser_pool import BrowserPool
+from compression import CompressionMiddleware
+from extraction_rules import stats as extraction_rule_stats
+from fast_json import FastJSONResponse
+from game_analytics import NUMPY_AVAILABLE, GameAnalytics
+from game_data import GameDataStore
+from game_snapshot import GameSnapshot
+from http_cache import SnapshotETag, conditional_json, make_etag
+from http_client import http_client
+from kbo_scraper import DEFAULT_SERIES, SERIES, crawl_kbo_season
+from kv_store import SharedLoader
+from play_index import HALF_CODES, LEVERAGE_BANDS, RESULT_TYPES, PlayIndex
+from password_service import PasswordService, PasswordServiceBusy
+from refresh_cache import RefreshingCache
+from scrape_parsers import parse_kbo_schedule, parse_naver_articles
+from schedule_feed import ScheduleChangeFeed
+from single_flight import SingleFlight
+from standings import StandingsAggregator
+from storage import create_storage
+from token_cache import TokenCache
+from user_store import DuplicateUserError
+from view_counter import ViewCounter
 
 # JWT 설정
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-# 비밀번호 해싱
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 검증된 토큰 캐시 (반복 요청의 jwt.decode 비용 제거)
+token_cache = TokenCache(
+    maxsize=int(os.getenv("TOKEN_CACHE_SIZE", 10000)),
+    ttl=float(os.getenv("TOKEN_CACHE_TTL", 300)),
+)
+
+# 비밀번호 해싱 (bcrypt는 워커 풀에서 실행)
+password_service = PasswordService.from_env()
+
+# 스크래퍼용 Playwright 브라우저 풀 (Playwright가 없으면 비활성)
+browser_pool = BrowserPool.from_env()
 
-app = FastAPI(title="Sports Platform API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    password_service.start()
+    view_counter.start()
+    await browser_pool.start()
+    http_client.start()
+    kbo_schedule_cache.start()
+    naver_articles_cache.start()
+    events.start()
+    game_snapshot.start()
+    yield
+    await events.stop()
+    await naver_articles_cache.stop()
+    await kbo_schedule_cache.stop()
+    await browser_pool.stop()
+    await http_client.aclose()
+    await view_counter.stop()
+    await game_snapshot.stop()
+    storage.close()
+    password_service.shutdown()
+
+app = FastAPI(title="Sports Platform API", lifespan=lifespan)
 
 # ============================================
 # CORS 설정 (프론트엔드 도메인 허용)
@@ -47,6 +95,17 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified"],
+)
+
+# ============================================
+# 응답 압축 (COMPRESSION_MIN_SIZE 바이트 이상, brotli 설치 시 br 우선)
+# ============================================
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("COMPRESSION_MIN_SIZE", 1024)),
+    gzip_level=int(os.getenv("GZIP_LEVEL", 6)),
+    brotli_quality=int(os.getenv("BROTLI_QUALITY", 4)),
 )
 
 # ============================================
@@ -128,6 +187,26 @@ class ArticleResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class ArticleSummary(BaseModel):
+    """목록용 요약. fullContent / email은 빼고, image는 URL일 때만 담습니다 (base64는 상세에서)."""
+    id: int
+    title: str
+    content: str
+    date: str
+    reporter: Optional[str] = None
+    department: Optional[str] = None
+    image: Optional[str] = None
+    hasImage: bool = False
+    tags: Optional[List[str]] = None
+    views: int
+    status: str
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+class ArticlePage(BaseModel):
+    articles: List[ArticleSummary]  # fields= 지정 시 해당 필드만
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달 (없으면 마지막 페이지)
+
 class TokenResponse(BaseModel):
     access_token: str
     user: UserResponse
@@ -151,62 +230,113 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
 
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     token = credentials.credentials
+    principal = token_cache.get(token)
+    if principal is not None:
+        return principal
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id: int = payload.get("sub")
         if user_id is None:
             raise HTTPException(status_code=401, detail="Invalid token")
-        return {"user_id": user_id}
+        principal = {"user_id": user_id}
+        token_cache.put(token, principal, exp=payload.get("exp"))
+        return principal
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+def rotate_secret_key(new_secret: str):
+    """JWT 비밀키를 교체합니다. 이전 키로 검증된 캐시 항목은 모두 버립니다."""
+    global SECRET_KEY
+    SECRET_KEY = new_secret
+    token_cache.clear()
+
+def _password_service_busy():
+    return HTTPException(
+        status_code=503,
+        detail="Server busy, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+async def hash_password(password: str) -> str:
+    try:
+        return await password_service.hash(password)
+    except PasswordServiceBusy:
+        raise _password_service_busy()
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return await password_service.verify(plain_password, hashed_password)
+    except PasswordServiceBusy:
+        raise _password_service_busy()
 
 # ============================================
-# 임시 데이터베이스 (실제로는 SQLAlchemy 사용)
+# 저장소 (STORAGE_BACKEND=sqlite|memory, DATABASE_URL)
 # ============================================
-# 실제 운영 시에는 데이터베이스를 사용하세요
-users_db = []
-articles_db = []
-next_user_id = 1
-next_article_id = 1
+# 기본은 SQLite 파일(WAL)이라 재시작 후에도 데이터가 남고 워커끼리 공유됩니다.
+# ID는 DB autoincrement로 발급되므로 --workers N으로 띄워도 워커끼리 겹치지 않습니다.
+storage = create_storage()
+users_db = storage.users
+articles_db = storage.articles
+
+if not storage.shared and int(os.getenv("WEB_CONCURRENCY", 1)) > 1:
+    warnings.warn("STORAGE_BACKEND=memory는 워커마다 데이터가 따로 생깁니다. 여러 워커에서는 sqlite를 사용하세요.")
+
+# 조회수는 샤드 카운터에 모았다가 주기적으로 한 번에 반영 (VIEW_FLUSH_INTERVAL초, 종료 시 남은 값 반영)
+view_counter = ViewCounter.from_env(articles_db.apply_view_deltas)
+
+def with_pending_views(article: dict, copy: bool = True) -> dict:
+    """아직 반영되지 않은 조회수 증가분을 더한 응답용 기사 (copy=False면 주어진 dict를 직접 수정)"""
+    pending = view_counter.pending(article["id"])
+    if not pending or "views" not in article:
+        return article
+    if copy:
+        article = dict(article)
+    article["views"] = (article["views"] or 0) + pending
+    return article
+
+# 삭제된 사용자의 토큰은 캐시에서 즉시 제거
+users_db.on_delete(lambda user: token_cache.invalidate_user(user["id"]))
+
+DUPLICATE_USER_DETAILS = {
+    "email": "Email already registered",
+    "username": "Username already taken",
+    "kakaoId": "Kakao account already registered",
+}
 
 # ============================================
 # 인증 관련 엔드포인트
 # ============================================
+# 저장소(users_db / articles_db / storage.kv)는 동기 API라서(SQLAlchemy, SQLite 잠금 대기 최대 busy_timeout)
+# 이벤트 루프에서 직접 부르지 않습니다. await가 필요한 엔드포인트는 run_in_threadpool로 감싸고,
+# 저장소만 쓰는 엔드포인트는 def로 선언해 FastAPI가 스레드풀에서 실행하게 합니다.
 
 @app.post("/api/register", response_model=TokenResponse)
 async def register(user: UserCreate):
     """회원가입"""
-    # 중복 체크
-    if any(u["email"] == user.email for u in users_db):
+    # 중복 체크 (해싱 비용을 쓰기 전에 빠르게 거절)
+    if await run_in_threadpool(users_db.get_by_email, user.email):
         raise HTTPException(status_code=400, detail="Email already registered")
-    if any(u["username"] == user.username for u in users_db):
+    if await run_in_threadpool(users_db.get_by_username, user.username):
         raise HTTPException(status_code=400, detail="Username already taken")
     
     # 비밀번호 해싱
-    hashed_password = hash_password(user.password)
+    hashed_password = await hash_password(user.password)
     
-    # 사용자 생성
-    global next_user_id
-    new_user = {
-        "id": next_user_id,
-        "first_name": user.first_name,
-        "last_name": user.last_name,
-        "email": user.email,
-        "phone": user.phone,
-        "username": user.username,
-        "password": hashed_password,
-        "department": "",
-    }
-    users_db.append(new_user)
-    next_user_id += 1
+    # 사용자 생성 (동시 가입 대비: 저장소가 삽입 시점에 다시 고유성 검사)
+    try:
+        new_user = await run_in_threadpool(users_db.add, {
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "email": user.email,
+            "phone": user.phone,
+            "username": user.username,
+            "password": hashed_password,
+            "department": "",
+        })
+    except DuplicateUserError as e:
+        raise HTTPException(status_code=400, detail=DUPLICATE_USER_DETAILS[e.field])
     
     # JWT 토큰 생성
     access_token = create_access_token(data={"sub": new_user["id"]})
@@ -225,12 +355,12 @@ async def register(user: UserCreate):
 async def login(credentials: UserLogin):
     """로그인"""
     # 사용자 찾기
-    user = next((u for u in users_db if u["username"] == credentials.username), None)
+    user = await run_in_threadpool(users_db.get_by_username, credentials.username)
     if not user:
         raise HTTPException(status_code=401, detail="Invalid username or password")
     
     # 비밀번호 확인
-    if not verify_password(credentials.password, user["password"]):
+    if not await verify_password(credentials.password, user["password"]):
         raise HTTPException(status_code=401, detail="Invalid username or password")
     
     # JWT 토큰 생성
@@ -250,13 +380,8 @@ async def login(credentials: UserLogin):
 async def kakao_login(kakao_user: KakaoUser):
     """카카오 로그인"""
     # 카카오 사용자 찾기 또는 생성
-    user = next((u for u in users_db if u.get("kakaoId") == kakao_user.kakaoId), None)
-    
-    if not user:
-        # 새 사용자 생성
-        global next_user_id
-        new_user = {
-            "id": next_user_id,
+    def new_kakao_user():
+        return {
             "email": kakao_user.email or f"kakao_{kakao_user.kakaoId}@kakao.com",
             "nickname": kakao_user.nickname,
             "first_name": kakao_user.nickname[:1] if kakao_user.nickname else "",
@@ -264,9 +389,11 @@ async def kakao_login(kakao_user: KakaoUser):
             "kakaoId": kakao_user.kakaoId,
             "department": "",
         }
-        users_db.append(new_user)
-        user = new_user
-        next_user_id += 1
+
+    try:
+        user = await run_in_threadpool(users_db.get_or_create, "kakaoId", kakao_user.kakaoId, new_kakao_user)
+    except DuplicateUserError as e:
+        raise HTTPException(status_code=400, detail=DUPLICATE_USER_DETAILS[e.field])
     
     # JWT 토큰 생성
     access_token = create_access_token(data={"sub": user["id"]})
@@ -282,10 +409,10 @@ async def kakao_login(kakao_user: KakaoUser):
     }
 
 @app.get("/api/users/me", response_model=UserResponse)
-async def get_current_user(current_user: dict = Depends(verify_token)):
+def get_current_user(current_user: dict = Depends(verify_token)):
     """현재 사용자 정보 가져오기"""
     user_id = current_user["user_id"]
-    user = next((u for u in users_db if u["id"] == user_id), None)
+    user = users_db.get(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -300,35 +427,61 @@ async def get_current_user(current_user: dict = Depends(verify_token)):
 # 기사 관련 엔드포인트
 # ============================================
 
-@app.get("/api/articles", response_model=List[ArticleResponse])
-async def get_articles(
+@app.get("/api/articles", response_model=ArticlePage, response_class=FastJSONResponse)
+def get_articles(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
 ):
-    """기사 목록 가져오기"""
-    articles = articles_db
-    if status:
-        articles = [a for a in articles if a.get("status") == status]
-    return articles[skip:skip+limit]
-
-@app.get("/api/articles/{article_id}", response_model=ArticleResponse)
-async def get_article(article_id: int):
-    """기사 상세 가져오기"""
-    article = next((a for a in articles_db if a["id"] == article_id), None)
+    """
+    기사 목록 가져오기 (최근 수정순)
+    응답의 next_cursor를 cursor로 넘기면 다음 페이지를 가져옵니다.
+    상태별 정렬 인덱스를 쓰므로 깊은 페이지도 첫 페이지와 비용이 같습니다.
+
+    기본은 요약(ArticleSummary)이며, fields=title,views,fullContent 처럼 필요한 필드만 고를 수 있습니다.
+    ETag는 페이지에 담긴 기사들의 (id, updated_at, 조회수)로 정해지며, If-None-Match가 같으면 304.
+    """
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    try:
+        selected = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {e}")
+    limit = max(1, min(limit, 500))
+    articles, next_key = articles_db.page(status or None, limit=limit, after=after, skip=max(0, skip), fields=selected)
+    items = [with_pending_views(project(a, selected), copy=False) for a in articles]
+    next_cursor = encode_cursor(next_key) if next_key else None
+    etag = make_etag(
+        selected, next_cursor,
+        [(a["id"], sort_key(a)[0], item.get("views")) for a, item in zip(articles, items)],
+    )
+    # 투영한 dict를 바로 직렬화 (저장소 데이터라 응답 모델 재검증을 거치지 않음)
+    return conditional_json(request, {"articles": items, "next_cursor": next_cursor}, etag)
+
+@app.get("/api/articles/{article_id}", response_model=ArticleResponse, response_class=FastJSONResponse)
+def get_article(article_id: int, request: Request):
+    """기사 상세 가져오기 (ETag = updated_at + 조회수 버전, 바뀌지 않았으면 304)"""
+    article = articles_db.get(article_id)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
-    return article
+    # ArticleResponse 필드만 골라 바로 직렬화 (author_id 등 내부 필드 제외)
+    content = with_pending_views(project(article, ARTICLE_FIELDS), copy=False)
+    return conditional_json(request, content, make_etag(article_id, sort_key(article)[0], content["views"]))
 
 @app.post("/api/articles", response_model=ArticleResponse, status_code=status.HTTP_201_CREATED)
-async def create_article(
+def create_article(
     article: ArticleCreate,
     current_user: dict = Depends(verify_token)
 ):
     """기사 생성"""
-    global next_article_id
-    new_article = {
-        "id": next_article_id,
+    new_article = articles_db.add({
         "title": article.title,
         "content": article.content,
         "fullContent": article.fullContent,
@@ -343,19 +496,17 @@ async def create_article(
         "author_id": current_user["user_id"],
         "created_at": datetime.now(),
         "updated_at": datetime.now(),
-    }
-    articles_db.append(new_article)
-    next_article_id += 1
+    })
     return new_article
 
 @app.put("/api/articles/{article_id}", response_model=ArticleResponse)
-async def update_article(
+def update_article(
     article_id: int,
     article_update: ArticleUpdate,
     current_user: dict = Depends(verify_token)
 ):
     """기사 수정"""
-    article = next((a for a in articles_db if a["id"] == article_id), None)
+    article = articles_db.get(article_id)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     
@@ -365,19 +516,16 @@ async def update_article(
     
     # 업데이트
     update_data = article_update.dict(exclude_unset=True)
-    for key, value in update_data.items():
-        article[key] = value
-    article["updated_at"] = datetime.now()
-    
-    return article
+    update_data["updated_at"] = datetime.now()
+    return with_pending_views(articles_db.update(article_id, update_data))
 
 @app.delete("/api/articles/{article_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_article(
+def delete_article(
     article_id: int,
     current_user: dict = Depends(verify_token)
 ):
     """기사 삭제"""
-    article = next((a for a in articles_db if a["id"] == article_id), None)
+    article = articles_db.get(article_id)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     
@@ -385,27 +533,27 @@ async def delete_article(
     if article.get("author_id") != current_user["user_id"]:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    articles_db.remove(article)
+    articles_db.delete(article_id)
+    view_counter.discard(article_id)
     return None
 
 @app.post("/api/articles/{article_id}/views", response_model=ViewsResponse)
-async def increment_views(article_id: int):
-    """조회수 증가 (인증 불필요)"""
-    article = next((a for a in articles_db if a["id"] == article_id), None)
-    if not article:
+def increment_views(article_id: int):
+    """조회수 증가 (인증 불필요). 저장소 반영은 view_counter가 모아서 처리합니다."""
+    article = articles_db.get(article_id)
+    if article is None:
         raise HTTPException(status_code=404, detail="Article not found")
-    
-    article["views"] = article.get("views", 0) + 1
-    return {"views": article["views"]}
+    pending = view_counter.incr(article_id)
+    return {"views": article.get("views", 0) + pending}
 
 @app.patch("/api/articles/{article_id}/status", response_model=ArticleResponse)
-async def update_article_status(
+def update_article_status(
     article_id: int,
     status_update: StatusUpdate,
     current_user: dict = Depends(verify_token)
 ):
     """기사 상태 변경"""
-    article = next((a for a in articles_db if a["id"] == article_id), None)
+    article = articles_db.get(article_id)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     
@@ -413,9 +561,10 @@ async def update_article_status(
     if article.get("author_id") != current_user["user_id"]:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    article["status"] = status_update.status
-    article["updated_at"] = datetime.now()
-    return article
+    return with_pending_views(articles_db.update(article_id, {
+        "status": status_update.status,
+        "updated_at": datetime.now(),
+    }))
 
 # ============================================
 # 헬스 체크
@@ -429,385 +578,477 @@ async def root():
 async def health():
     return {"status": "healthy"}
 
+@app.get("/api/metrics")
+def metrics():
+    """내부 캐시/풀 상태 (히트·미스 카운터 등)"""
+    return {
+        "token_cache": token_cache.stats(),
+        "browser_pool": browser_pool.stats(),
+        "kbo_schedule_cache": kbo_schedule_cache.stats(),
+        "kbo_schedule_loader": kbo_schedule_loader.stats(),
+        "kbo_schedule_feed": kbo_schedule_feed.stats(),
+        "naver_articles_cache": naver_articles_cache.stats(),
+        "events": events.stats(),
+        "kbo_season_flight": kbo_season_flight.stats(),
+        "scrape_flight": scrape_flight.stats(),
+        "http_client": http_client.stats(),
+        "view_counter": view_counter.stats(),
+        "storage": storage.stats(),
+        "game_data": game_data.stats(),
+        "game_snapshot": game_snapshot.stats(),
+        "game_analytics": game_analytics.stats(),
+        "standings": standings.stats(),
+        "play_index": play_index.stats(),
+        "extraction_rules": extraction_rule_stats(),
+        "password_service": {
+            "workers": password_service.workers,
+            "pending": password_service.pending,
+            "max_pending": password_service.max_pending,
+        },
+    }
+
+# ============================================
+# 스크래핑 요청 합치기 (업스트림 URL 기준 single-flight + 짧은 TTL 캐시)
+# ============================================
+# 성공 결과는 storage.kv에도 두어 다른 워커가 같은 URL을 다시 스크래핑하지 않게 합니다.
+scrape_flight = SingleFlight(
+    ttl=float(os.getenv("SCRAPE_RESULT_TTL_SECONDS", 60)),
+    is_good=lambda payload: payload.get("success", False),
+    store=storage.kv,
+    namespace="scrape:",
+)
+
 # ============================================
 # 네이버 스포츠 야구 뉴스 API
 # ============================================
 
-@app.get("/api/naver-baseball-articles")
-async def get_naver_baseball_articles():
+NAVER_BASEBALL_NEWS_URL = os.getenv("NAVER_BASEBALL_NEWS_URL", "https://m.sports.naver.com/kbaseball/news")
+
+async def fetch_naver_baseball_articles(url: str) -> dict:
     """
-    네이버 스포츠 야구 뉴스 페이지에서 최신 기사를 가져옵니다.
+    네이버 스포츠 야구 뉴스 페이지에서 최신 기사를 스크래핑합니다.
     https://m.sports.naver.com/kbaseball/news
     """
-    url = "https://m.sports.naver.com/kbaseball/news"
     html_content = None
     
     # Playwright 사용 시도 (JavaScript 렌더링 필요)
-    if PLAYWRIGHT_AVAILABLE:
+    if browser_pool.available:
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    viewport={'width': 1920, 'height': 1080}
-                )
-                page = await context.new_page()
-                await page.goto(url, wait_until='networkidle', timeout=30000)
-                # 기사 목록이 로드될 때까지 대기
-                try:
-                    await page.wait_for_selector('a[href*="sports.news"], a[href*="news.naver"], .news_item, .article_item', timeout=5000)
-                except:
-                    pass
-                html_content = await page.content()
-                await browser.close()
+            # 기사 목록이 로드될 때까지 대기
+            html_content = await browser_pool.render(
+                url,
+                wait_selector='a[href*="sports.news"], a[href*="news.naver"], .news_item, .article_item',
+            )
         except Exception as e:
-            # Playwright 실패 시 requests로 fallback
+            # Playwright 실패(또는 풀 포화) 시 HTTP 요청으로 fallback
             pass
     
-    # Playwright가 없거나 실패한 경우 requests 사용
+    # Playwright가 없거나 실패한 경우 공용 HTTP 클라이언트 사용
     if not html_content:
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-            }
-            response = requests.get(url, headers=headers, timeout=15)
+            response = await http_client.get(url, timeout=15)
             response.encoding = "utf-8"
             if response.status_code == 200:
                 html_content = response.text
         except Exception as e:
-            return JSONResponse({
+            return {
                 "success": False,
                 "articles": [],
                 "error": f"네이버 스포츠 접근 실패: {str(e)}",
-            })
+            }
     
     if not html_content:
-        return JSONResponse({
+        return {
             "success": False,
             "articles": [],
             "error": "HTML 콘텐츠를 가져올 수 없습니다.",
-        })
+        }
     
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
-        articles = []
-        
-        # 여러 방법으로 기사 찾기
-        # 방법 1: 기사 링크가 있는 a 태그 찾기
-        for a in soup.find_all("a", href=True):
-            href = a.get("href", "")
-            # 네이버 스포츠 기사 URL 패턴
-            if "sports.news" in href or "news.naver" in href or "/kbaseball/news/" in href or "sports.naver.com/news" in href:
-                if href.startswith("//"):
-                    href = "https:" + href
-                elif href.startswith("/"):
-                    href = "https://m.sports.naver.com" + href
-                
-                # 제목 추출 (여러 방법 시도)
-                title = ""
-                title_el = a.find(class_=re.compile("title|headline|tit|text|subject", re.I))
-                if title_el:
-                    title = title_el.get_text(strip=True)
-                else:
-                    # 직접 텍스트 추출
-                    title = a.get_text(strip=True)
-                
-                if not title or len(title) < 5:
-                    continue
-                
-                # 이미지 추출
-                img = a.find("img")
-                image = ""
-                if img:
-                    image = img.get("src") or img.get("data-src") or img.get("data-lazy-src") or ""
-                if image and not image.startswith("http"):
-                    image = "https:" + image if image.startswith("//") else "https://m.sports.naver.com" + image
-                
-                # 날짜 추출
-                date_el = a.find(class_=re.compile("date|time|info|date_time", re.I))
-                date_text = date_el.get_text(strip=True) if date_el else ""
-                
-                articles.append({
-                    "title": title[:200],
-                    "link": href,
-                    "image": image or "",
-                    "date": date_text or "",
-                    "source": "네이버 스포츠",
-                })
-        
-        # 방법 2: 기사 리스트 아이템 찾기
-        news_items = soup.find_all(class_=re.compile("news_item|article_item|list_item|news_list", re.I))
-        for item in news_items:
-            link_elem = item.find("a", href=True)
-            if not link_elem:
-                continue
-            
-            href = link_elem.get("href", "")
-            if not href or ("sports.news" not in href and "news.naver" not in href):
-                continue
-            
-            if href.startswith("//"):
-                href = "https:" + href
-            elif href.startswith("/"):
-                href = "https://m.sports.naver.com" + href
-            
-            title_elem = item.find(class_=re.compile("title|headline|tit|subject", re.I))
-            title = title_elem.get_text(strip=True) if title_elem else link_elem.get_text(strip=True)
-            
-            if not title or len(title) < 5:
-                continue
-            
-            img_elem = item.find("img")
-            image = ""
-            if img_elem:
-                image = img_elem.get("src") or img_elem.get("data-src") or img_elem.get("data-lazy-src") or ""
-            if image and not image.startswith("http"):
-                image = "https:" + image if image.startswith("//") else "https://m.sports.naver.com" + image
-            
-            date_elem = item.find(class_=re.compile("date|time|info", re.I))
-            date_text = date_elem.get_text(strip=True) if date_elem else ""
-            
-            articles.append({
-                "title": title[:200],
-                "link": href,
-                "image": image or "",
-                "date": date_text or "",
-                "source": "네이버 스포츠",
-            })
-        # 제목 기준 중복 제거, 최대 10개
-        seen = set()
-        unique = []
-        for art in articles:
-            key = art["title"][:80]
-            if key not in seen and len(unique) < 10:
-                seen.add(key)
-                unique.append(art)
+        unique, debug_info = parse_naver_articles(html_content)
+        debug_info["html_length"] = len(html_content)
+        debug_info["playwright_used"] = browser_pool.available and html_content is not None
         
-        # 디버깅 정보
-        debug_info = {
-            "html_length": len(html_content),
-            "total_links_found": len(soup.find_all("a", href=True)),
-            "articles_found": len(articles),
-            "unique_articles": len(unique),
-            "playwright_used": PLAYWRIGHT_AVAILABLE and html_content is not None
-        }
-        
-        return JSONResponse({
+        return {
             "success": True if unique else False,
             "articles": unique,
             "count": len(unique),
             "date": datetime.now().strftime("%Y-%m-%d"),
             "debug": debug_info if not unique else None,
             "error": "기사를 찾을 수 없습니다. 네이버 스포츠 페이지 구조가 변경되었을 수 있습니다." if not unique else None
-        })
-    except requests.exceptions.RequestException as e:
-        return JSONResponse({
+        }
+    except httpx.HTTPError as e:
+        return {
             "success": False,
             "articles": [],
             "error": f"네트워크 오류: {str(e)}",
-        })
+        }
     except Exception as e:
-        return JSONResponse({
+        return {
             "success": False,
             "articles": [],
             "error": f"스크래핑 오류: {str(e)}",
-        })
+        }
+
+NAVER_ARTICLES_REFRESH_SECONDS = float(os.getenv("NAVER_ARTICLES_REFRESH_SECONDS", 300))
+
+# 기사 목록도 백그라운드에서 갱신하고 요청은 캐시에서 응답 (폴링이 스크래핑을 일으키지 않음).
+# 새 기사가 생기면 /api/events 구독자에게 푸시합니다.
+naver_articles_loader = SharedLoader(
+    storage.kv,
+    "naver_articles",
+    lambda: scrape_flight.do(NAVER_BASEBALL_NEWS_URL, lambda: fetch_naver_baseball_articles(NAVER_BASEBALL_NEWS_URL)),
+    ttl=NAVER_ARTICLES_REFRESH_SECONDS,
+    is_good=lambda payload: payload.get("success", False),
+)
+naver_articles_cache = RefreshingCache(
+    naver_articles_loader,
+    interval=NAVER_ARTICLES_REFRESH_SECONDS,
+    is_good=lambda payload: payload.get("success", False),
+)
+
+naver_articles_etag = SnapshotETag()
+
+@app.get("/api/naver-baseball-articles", response_class=FastJSONResponse)
+async def get_naver_baseball_articles(request: Request):
+    """
+    네이버 스포츠 야구 뉴스 최신 기사를 반환합니다.
+    NAVER_ARTICLES_REFRESH_SECONDS마다 백그라운드에서 갱신한 마지막 정상 결과를 제공합니다.
+    결과 내용이 같으면 ETag도 같아 If-None-Match 요청은 304를 받습니다.
+    """
+    payload, _ = await naver_articles_cache.get()
+    return conditional_json(request, payload, naver_articles_etag(payload))
+
 
 # ============================================
 # KBO 일정 API
 # ============================================
 
-@app.get("/api/kbo-schedule")
-async def get_kbo_schedule():
+KBO_SCHEDULE_URL = os.getenv("KBO_SCHEDULE_URL", "https://www.koreabaseball.com/Schedule/Schedule.aspx")
+KBO_SCHEDULE_REFRESH_SECONDS = float(os.getenv("KBO_SCHEDULE_REFRESH_SECONDS", 1800))
+
+async def fetch_kbo_schedule() -> dict:
     """
-    KBO 경기 일정을 가져옵니다.
-    Playwright가 있으면 사용하고, 없으면 requests로 시도합니다.
+    KBO 경기 일정을 스크래핑합니다.
+    Playwright가 있으면 사용하고, 없으면 HTTP 요청으로 시도합니다.
+    KBO_SCHEDULE_URL로 업스트림을 로컬 픽스처 서버 등으로 바꿀 수 있습니다.
     """
-    url = "https://www.koreabaseball.com/Schedule/Schedule.aspx"
+    url = KBO_SCHEDULE_URL
     html_content = None
     
     # Playwright 사용 시도
-    if PLAYWRIGHT_AVAILABLE:
+    if browser_pool.available:
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    viewport={'width': 1920, 'height': 1080}
-                )
-                page = await context.new_page()
-                await page.goto(url, wait_until='networkidle', timeout=30000)
-                try:
-                    await page.wait_for_selector('table, .schedule, [class*="schedule"], [id*="schedule"]', timeout=5000)
-                except:
-                    pass
-                html_content = await page.content()
-                await browser.close()
+            html_content = await browser_pool.render(
+                url,
+                wait_selector='table, .schedule, [class*="schedule"], [id*="schedule"]',
+            )
         except Exception as e:
-            # Playwright 실패 시 requests로 fallback
+            # Playwright 실패(또는 풀 포화) 시 HTTP 요청으로 fallback
             pass
     
-    # Playwright가 없거나 실패한 경우 requests 사용
+    # Playwright가 없거나 실패한 경우 공용 HTTP 클라이언트 사용
     if not html_content:
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-            }
-            response = requests.get(url, headers=headers, timeout=15)
+            response = await http_client.get(url, timeout=15)
             response.encoding = 'utf-8'
             if response.status_code == 200:
                 html_content = response.text
         except Exception as e:
-            return JSONResponse({
+            return {
                 "success": False,
                 "games": [],
                 "error": f"웹사이트 접근 실패: {str(e)}"
-            })
+            }
     
     if not html_content:
-        return JSONResponse({
+        return {
             "success": False,
             "games": [],
             "error": "HTML 콘텐츠를 가져올 수 없습니다."
-        })
+        }
     
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        games = []
-        
-        # KBO 웹사이트의 경기 일정 테이블 찾기 (여러 방법 시도)
-        schedule_table = soup.find('table', {'id': 'scheduleTable'}) or \
-                        soup.find('table', class_=re.compile('schedule', re.I)) or \
-                        soup.find('div', class_=re.compile('schedule', re.I)) or \
-                        soup.find('div', id=re.compile('schedule', re.I)) or \
-                        soup.find('table') or \
-                        soup.find('tbody') or \
-                        soup.find('ul', class_=re.compile('schedule|game|match', re.I))
+        games, debug_info = parse_kbo_schedule(html_content)
         
-        debug_info = {
-            "html_length": len(html_content),
-            "found_table": schedule_table is not None,
-            "table_name": schedule_table.name if schedule_table else None
-        }
-        
-        if schedule_table:
-            # 테이블이 있으면 행 찾기
-            if schedule_table.name == 'table':
-                rows = schedule_table.find_all('tr')
-            else:
-                # div인 경우 경기 항목 찾기
-                rows = schedule_table.find_all(['div', 'li'], class_=re.compile('game|match|schedule', re.I))
-            
-            for row in rows[1:] if schedule_table.name == 'table' else rows:  # 헤더 제외
-                try:
-                    if schedule_table.name == 'table':
-                        cells = row.find_all(['td', 'th'])
-                        if len(cells) < 2:
-                            continue
-                        
-                        date_text = cells[0].get_text(strip=True) if len(cells) > 0 else ''
-                        time_text = cells[1].get_text(strip=True) if len(cells) > 1 else ''
-                        game_text = cells[2].get_text(strip=True) if len(cells) > 2 else ''
-                        stadium_text = cells[-1].get_text(strip=True) if len(cells) > 3 else ''
-                    else:
-                        # div 구조인 경우
-                        date_text = row.find(class_=re.compile('date', re.I))
-                        date_text = date_text.get_text(strip=True) if date_text else ''
-                        time_text = row.find(class_=re.compile('time', re.I))
-                        time_text = time_text.get_text(strip=True) if time_text else ''
-                        game_text = row.find(class_=re.compile('game|match|vs', re.I))
-                        game_text = game_text.get_text(strip=True) if game_text else ''
-                        stadium_text = row.find(class_=re.compile('stadium|venue', re.I))
-                        stadium_text = stadium_text.get_text(strip=True) if stadium_text else ''
-                    
-                    # 날짜 파싱 (예: "01.27(월)" 또는 "2025.01.27")
-                    date_match = re.search(r'(\d{2,4})\.(\d{2})\.?(\d{2})?', date_text)
-                    if date_match:
-                        if date_match.group(3):  # YYYY.MM.DD 형식
-                            year = int(date_match.group(1))
-                            month = int(date_match.group(2))
-                            day = int(date_match.group(3))
-                        else:  # MM.DD 형식
-                            year = datetime.now().year
-                            month = int(date_match.group(1))
-                            day = int(date_match.group(2))
-                        
-                        try:
-                            date_obj = datetime(year, month, day)
-                            
-                            # 경기 팀 추출
-                            teams_match = re.search(r'([가-힣A-Z\s]+)\s*(?:vs|VS|대)\s*([가-힣A-Z\s]+)', game_text)
-                            home = teams_match.group(1).strip() if teams_match else ''
-                            away = teams_match.group(2).strip() if teams_match else ''
-                            
-                            games.append({
-                                "date": date_obj.strftime("%Y-%m-%d"),
-                                "dateText": date_text,
-                                "time": time_text,
-                                "timeText": time_text,
-                                "play": game_text,
-                                "playText": game_text,
-                                "stadium": stadium_text,
-                                "home": home,
-                                "away": away
-                            })
-                        except ValueError:
-                            continue
-                except Exception:
-                    continue
-        
-        # 데이터가 없으면 빈 배열 반환 (디버깅 정보 포함)
-        if not games:
-            if schedule_table:
-                if schedule_table.name == 'table':
-                    rows = schedule_table.find_all('tr')
-                    debug_info["rows_found"] = len(rows)
-                    debug_info["parsing_attempts"] = len(rows[1:]) if len(rows) > 1 else 0
-                    # 첫 번째 행 샘플 확인
-                    if len(rows) > 1:
-                        first_row_cells = rows[1].find_all(['td', 'th'])
-                        debug_info["first_row_cells"] = len(first_row_cells)
-                        debug_info["first_row_text"] = rows[1].get_text(strip=True)[:100] if rows[1] else None
-                else:
-                    rows = schedule_table.find_all(['div', 'li'], class_=re.compile('game|match|schedule', re.I))
-                    debug_info["rows_found"] = len(rows)
-                    debug_info["parsing_attempts"] = len(rows)
-            else:
-                debug_info["rows_found"] = 0
-                debug_info["parsing_attempts"] = 0
-                # HTML 샘플 확인 (처음 500자)
-                debug_info["html_sample"] = html_content[:500] if html_content else None
-                # 테이블 태그가 있는지 확인
-                all_tables = soup.find_all('table')
-                debug_info["total_tables_found"] = len(all_tables)
-                if all_tables:
-                    debug_info["first_table_id"] = all_tables[0].get('id', 'no-id')
-                    debug_info["first_table_class"] = all_tables[0].get('class', [])
-        
-        return JSONResponse({
+        return {
             "success": True if games else False,
             "games": games,
             "count": len(games),
             "debug": debug_info if not games else None,
             "error": "경기 일정을 찾을 수 없습니다. KBO 웹사이트 구조가 변경되었을 수 있습니다." if not games else None
-        })
+        }
         
-    except requests.exceptions.RequestException as e:
-        return JSONResponse({
+    except httpx.HTTPError as e:
+        return {
             "success": False,
             "games": [],
             "error": f"네트워크 오류: {str(e)}"
-        })
+        }
     except Exception as e:
-        return JSONResponse({
+        return {
             "success": False,
             "games": [],
             "error": f"스크래핑 오류: {str(e)}"
-        })
+        }
+
+# 수집할 때마다 직전 일정과 비교해 바뀐 경기만 버전별로 기록 (/api/kbo-schedule/changes)
+kbo_schedule_feed = ScheduleChangeFeed(storage.kv, history=int(os.getenv("KBO_SCHEDULE_HISTORY", 100)))
+
+async def load_kbo_schedule() -> dict:
+    """일정을 가져오고 변경 피드에 기록합니다. 응답의 version은 변경 피드의 버전입니다."""
+    payload = await scrape_flight.do(KBO_SCHEDULE_URL, fetch_kbo_schedule)
+    if payload.get("success"):
+        payload = {**payload, "version": await run_in_threadpool(kbo_schedule_feed.record, payload["games"])}
+    return payload
+
+# 일정은 하루 몇 번만 바뀌므로 스냅샷을 백그라운드에서 갱신하고 요청은 항상 캐시에서 응답.
+# 워커마다 갱신 루프가 돌지만 리스를 잡은 한 워커만 스크래핑하고 나머지는 공유 결과를 읽습니다.
+kbo_schedule_loader = SharedLoader(
+    storage.kv,
+    "kbo_schedule",
+    load_kbo_schedule,
+    ttl=KBO_SCHEDULE_REFRESH_SECONDS,
+    is_good=lambda payload: payload.get("success", False),
+)
+kbo_schedule_cache = RefreshingCache(
+    kbo_schedule_loader,
+    interval=KBO_SCHEDULE_REFRESH_SECONDS,
+    is_good=lambda payload: payload.get("success", False),
+)
+
+kbo_schedule_etag = SnapshotETag()
+
+@app.get("/api/kbo-schedule", response_class=FastJSONResponse)
+async def get_kbo_schedule(request: Request):
+    """
+    KBO 경기 일정을 반환합니다.
+    마지막으로 성공한 스크래핑 결과를 제공하며, fetched_at에 수집 시각이 담깁니다.
+    ETag는 일정 내용 해시(재수집해도 내용이 같으면 유지), Last-Modified는 수집 시각입니다.
+    """
+    payload, fetched_at = await kbo_schedule_cache.get()
+    return conditional_json(
+        request,
+        {**payload, "fetched_at": fetched_at.isoformat() if fetched_at else None},
+        kbo_schedule_etag(payload),
+        last_modified=fetched_at,
+    )
+
+@app.get("/api/kbo-schedule/changes", response_class=FastJSONResponse)
+async def get_kbo_schedule_changes(request: Request, since: int = 0):
+    """
+    since 버전 이후 바뀐 경기만 반환합니다 (added / removed / time_changed / rainout / updated).
+    클라이언트는 응답의 version을 다음 since로 씁니다. reset이 true이면 /api/kbo-schedule을 다시 받으세요.
+    """
+    await kbo_schedule_cache.get()  # 오래된 스냅샷이면 백그라운드 갱신 시작
+    feed = await run_in_threadpool(kbo_schedule_feed.changes, since)
+    return conditional_json(request, feed, make_etag("kbo_schedule_changes", since, feed["version"]))
+
+# 시즌 전체 일정: (시리즈, 월) 페이지를 호스트별 속도 제한(KBO_CRAWL_RATE) 안에서 동시에 가져와 합침.
+# 결과는 storage.kv에 공유되어 다른 워커는 다시 수집하지 않습니다.
+# 실패한 수집도 KBO_SEASON_FAILURE_TTL초 동안은 그대로 돌려줘, 같은 요청이 업스트림을 반복해서 긁지 않도록 합니다.
+KBO_SEASON_FAILURE_TTL = int(os.getenv("KBO_SEASON_FAILURE_TTL", 60))
+KBO_FIRST_SEASON = 1982  # KBO 리그 원년
+kbo_season_flight = SingleFlight(
+    ttl=KBO_SCHEDULE_REFRESH_SECONDS,
+    is_good=lambda payload: payload.get("success", False),
+    store=storage.kv,
+    namespace="kbo_season:",
+    failure_ttl=KBO_SEASON_FAILURE_TTL,
+)
+kbo_season_etag = SnapshotETag(exclude=("partitions", "elapsed_ms"))
+
+@app.get("/api/kbo-schedule/season", response_class=FastJSONResponse)
+async def get_kbo_season_schedule(
+    request: Request,
+    year: int = Query(..., ge=KBO_FIRST_SEASON),
+    series: str = ",".join(DEFAULT_SERIES),
+):
+    """
+    한 시즌의 전체 일정 (중복 제거, 날짜순). series는 쉼표로 구분 (exhibition, regular, postseason).
+    year는 1982(원년)부터 내년까지. partitions에 페이지별 경기 수 / 소요 시간 / 오류가 담깁니다.
+    """
+    # 상한은 요청 시점의 연도로 (워커가 해를 넘겨 떠 있어도 새 시즌을 받도록)
+    if year > datetime.now().year + 1:
+        raise HTTPException(status_code=422, detail=f"year must be between {KBO_FIRST_SEASON} and {datetime.now().year + 1}")
+    names = sorted({name.strip() for name in series.split(",") if name.strip()})
+    unknown = [name for name in names if name not in SERIES]
+    if unknown or not names:
+        raise HTTPException(status_code=400, detail=f"series must be one or more of: {', '.join(SERIES)}")
+    payload = await kbo_season_flight.do(
+        f"{year}:{','.join(names)}",
+        lambda: crawl_kbo_season(year, names, base_url=KBO_SCHEDULE_URL),
+    )
+    return conditional_json(request, payload, kbo_season_etag(payload))
+
+
+# ============================================
+# 푸시 채널 (SSE)
+# ============================================
+# 백그라운드 갱신이 새 스냅샷을 만들면 연결된 클라이언트 전체에 한 번에 보냅니다.
+# 구독자별 큐는 SSE_QUEUE_SIZE개로 제한하며, 밀린 클라이언트는 끊겨 다시 연결합니다.
+events = Broadcaster.from_env()
+_pushed_schedule = {"version": None}
+
+async def push_schedule(payload: dict):
+    """마지막으로 보낸 일정 버전 이후의 변경분(/api/kbo-schedule/changes와 같은 형식)을 보냅니다."""
+    version = payload.get("version", 0)
+    since = _pushed_schedule["version"]
+    if since is None:
+        delta = {"version": version, "since": None, "reset": True, "changes": []}
+    else:
+        delta = await run_in_threadpool(kbo_schedule_feed.changes, since)
+    _pushed_schedule["version"] = version
+    events.publish("schedule", delta)
+
+def push_articles(payload: dict):
+    events.publish("articles", {"etag": naver_articles_etag(payload), "articles": payload["articles"]})
+
+kbo_schedule_cache.on_update(push_schedule)
+naver_articles_cache.on_update(push_articles)
+
+@app.get("/api/events")
+async def get_events():
+    """
+    SSE 스트림 (EventSource로 구독).
+    - hello: 연결 직후 현재 일정 버전과 기사 ETag (가진 것과 다르면 전체를 한 번 받기)
+    - schedule: 일정 변경분 {version, changes, reset}
+    - articles: 새 기사 목록 {etag, articles}
+    """
+    schedule = kbo_schedule_cache.value
+    articles = naver_articles_cache.value
+    hello = {
+        "schedule_version": schedule.get("version") if schedule else None,
+        "articles_etag": naver_articles_etag(articles) if articles else None,
+    }
+    return events.response(initial=[("hello", hello)])
+
+
+# ============================================
+# 경기 기록 API (public/data CSV → 열 단위 테이블)
+# ============================================
+# 새 경기 파일은 GAME_DATA_SCAN_INTERVAL초마다 확인하며, 바뀐 파일만 다시 읽습니다.
+# 확인 / 적재는 파일 I/O와 CSV 파싱이라 핸들러를 def로 두어 스레드풀에서 game_data.fresh() 안에서 읽습니다.
+# 시작할 때 바이너리 스냅샷(GAME_DATA_SNAPSHOT)이 있으면 CSV 대신 mmap으로 붙이고,
+# 파일을 다시 읽으면 GAME_SNAPSHOT_SAVE_DELAY초 뒤 리스를 가진 워커 하나가 백그라운드에서 새로 저장합니다.
+game_data = GameDataStore.from_env()
+game_snapshot = GameSnapshot.from_env(storage.kv)
+game_snapshot.attach(game_data)
+
+@app.get("/api/games", response_class=FastJSONResponse)
+def get_games():
+    """적재된 경기 목록 (구장 / 관중 / 경기시간과 팀별 점수)"""
+    with game_data.fresh():
+        lines = game_data.linescores
+        games = []
+        for game_id in game_data.game_ids:
+            game = dict(game_data.games[game_id])
+            game["teams"] = [
+                {"team": row["team"], "result": row["result"], "runs": row["runs"], "hits": row["hits"]}
+                for row in lines.rows(lines.game_rows(game_data.game_index(game_id)))
+            ]
+            games.append(game)
+    return FastJSONResponse({"games": games})
+
+# 결장.csv 열 전체에 대한 NumPy 벡터 연산 (plays 테이블이 바뀔 때만 배열을 다시 만듦)
+game_analytics = GameAnalytics(game_data)
+
+def _require_numpy():
+    if not NUMPY_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Analytics requires NumPy (pip install numpy)")
+
+@app.get("/api/games/{game_id}/analytics", response_class=FastJSONResponse)
+def get_game_analytics(game_id: str, request: Request, top: int = 5):
+    """
+    경기 분석: 결정적 장면(|WPa| 상위 top개), 선수별 누적 WPA, 타자별 RE24.
+    데이터가 바뀌지 않았으면 ETag가 같아 304로 응답합니다.
+    """
+    _require_numpy()
+    top = max(1, min(top, 50))
+    with game_data.fresh():
+        result = game_analytics.game(game_id, top=top)
+        version = game_data.plays.version
+    if result is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    return conditional_json(request, result, make_etag(game_id, top, version))
+
+@app.get("/api/season/analytics", response_class=FastJSONResponse)
+def get_season_analytics(request: Request, top: int = 10):
+    """적재된 모든 경기에 대한 같은 분석 (시즌 누적 WPA / RE24 순위)"""
+    _require_numpy()
+    top = max(1, min(top, 100))
+    with game_data.fresh():
+        result = game_analytics.season(top=top)
+        version = game_data.plays.version
+    return conditional_json(request, result, make_etag("season", top, version))
+
+# 리뷰.csv 라인스코어를 경기 단위로 더해 가는 순위표 (새 경기 적재 시 그 경기분만 반영)
+standings = StandingsAggregator(game_data)
+
+@app.get("/api/standings", response_class=FastJSONResponse)
+def get_standings(request: Request):
+    """팀 순위 (승률, 게임차, 득실점 차, 이닝별 득·실점). 새 경기가 없으면 304"""
+    with game_data.fresh():
+        snapshot = standings.snapshot()
+    return conditional_json(
+        request,
+        {"version": snapshot["version"], "games": snapshot["games"], "standings": snapshot["standings"]},
+        make_etag("standings", snapshot["version"]),
+    )
+
+@app.get("/api/standings/innings", response_class=FastJSONResponse)
+def get_inning_scoring(request: Request):
+    """리그 전체 이닝별 득점 분포 (득점 이닝 비율, 0~5+점 히스토그램)"""
+    with game_data.fresh():
+        snapshot = standings.snapshot()
+    return conditional_json(
+        request,
+        {"version": snapshot["version"], "games": snapshot["games"], "innings": snapshot["innings"]},
+        make_etag("innings", snapshot["version"]),
+    )
+
+
+# 결장.csv 이벤트 역색인 (선수 / 이닝 / 주자·아웃 / 결과 유형 / 레버리지 → 행 번호)
+play_index = PlayIndex(game_data)
+
+@app.get("/api/plays/search", response_class=FastJSONResponse)
+def search_plays(
+    request: Request,
+    batter: Optional[str] = None,
+    pitcher: Optional[str] = None,
+    game: Optional[str] = None,
+    inning: Optional[int] = None,
+    half: Optional[Literal[tuple(HALF_CODES)]] = None,
+    outs: Optional[int] = None,
+    bases: Optional[int] = None,
+    risp: Optional[bool] = None,
+    result: Optional[Literal[RESULT_TYPES]] = None,
+    leverage: Optional[Literal[LEVERAGE_BANDS]] = None,
+    min_lev: Optional[float] = None,
+    limit: int = 50,
+):
+    """
+    플레이 검색. 예: 양의지의 득점권 고레버리지 타석
+    /api/plays/search?batter=양의지&risp=true&leverage=high
+    bases는 주자 비트(1루 1, 2루 2, 3루 4), half는 초 / 말 (또는 0 / 1),
+    result는 홈런 / 2루타 / 실책 등, leverage는 high / medium / low. 그 밖의 값은 422
+    """
+    query = {
+        "batter": batter, "pitcher": pitcher, "game": game, "inning": inning, "half": half,
+        "outs": outs, "bases": bases, "risp": risp, "result": result, "leverage": leverage,
+    }
+    with game_data.fresh():
+        total, rows = play_index.search(query, min_lev=min_lev, limit=max(1, min(limit, 500)))
+        plays = game_data.plays.rows(rows)
+        for play in plays:
+            play["game"] = game_data.game_ids[play["game"]]
+        version = game_data.plays.version
+    return conditional_json(
+        request,
+        {"total": total, "plays": plays},
+        make_etag(sorted(query.items()), min_lev, limit, version),
+    )
+
 
 if __name__ == "__main__":
     import uvicorn
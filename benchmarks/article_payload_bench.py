@@ -0,0 +1,100 @@
+"""
+기사 목록 응답 크기 / 직렬화 시간 벤치마크
+본문과 base64 이미지가 들어 있는 기사 한 페이지를
+기존 방식(ArticleResponse 전체 검증 + 직렬화)과 요약 투영(ArticleSummary 필드만), sparse fieldset으로 비교합니다.
+
+실행: python -m benchmarks.article_payload_bench [--page 100] [--image-kb 150] [--body-kb 8]
+"""
+
+from datetime import datetime
+from typing import List
+import argparse
+import base64
+import json
+import os
+import time
+
+from fastapi.encoders import jsonable_encoder
+
+os.environ.setdefault("STORAGE_BACKEND", "memory")  # 스키마만 필요하므로 DB 파일을 만들지 않음
+
+from article_projection import parse_fields, project  # noqa: E402
+from backend_main import ArticleResponse  # noqa: E402
+
+
+def make_page(size: int, image_kb: int, body_kb: int) -> List[dict]:
+    page = []
+    for i in range(size):
+        # 절반은 base64 이미지, 일부는 URL 이미지, 나머지는 이미지 없음
+        if i % 2 == 0:
+            image = "data:image/jpeg;base64," + base64.b64encode(os.urandom(image_kb * 768)).decode()
+        elif i % 4 == 1:
+            image = f"https://imgnews.pstatic.net/image/{i}.jpg"
+        else:
+            image = None
+        now = datetime.now()
+        page.append({
+            "id": i + 1,
+            "title": f"KBO 리그 경기 리뷰 {i}",
+            "content": "미리보기 문장 " * 10,
+            "fullContent": "본문 문단입니다. " * (body_kb * 1024 // 24),
+            "date": now.isoformat(),
+            "reporter": "기자",
+            "department": "스포츠부",
+            "email": "reporter@example.com",
+            "image": image,
+            "tags": ["KBO", "리뷰"],
+            "views": i,
+            "status": "published",
+            "author_id": 1,
+            "created_at": now,
+            "updated_at": now,
+        })
+    return page
+
+
+def serialize_full(page: List[dict]) -> bytes:
+    # FastAPI response_model 경로: 모델 검증 → jsonable_encoder → json.dumps
+    validated = [ArticleResponse.model_validate(a).model_dump() for a in page]
+    return json.dumps(jsonable_encoder({"articles": validated}), ensure_ascii=False).encode()
+
+
+def serialize_projected(page: List[dict], fields=None) -> bytes:
+    items = [project(a, fields) for a in page]
+    return json.dumps(jsonable_encoder({"articles": items}), ensure_ascii=False).encode()
+
+
+def timed(fn, repeat: int) -> tuple:
+    body = fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return body, (time.perf_counter() - start) / repeat * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기사 목록 응답 크기 / 직렬화 시간 벤치마크")
+    parser.add_argument("--page", type=int, default=100, help="페이지당 기사 수")
+    parser.add_argument("--image-kb", type=int, default=150, help="base64 이미지 원본 크기(KB)")
+    parser.add_argument("--body-kb", type=int, default=8, help="fullContent 크기(KB)")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    page = make_page(args.page, args.image_kb, args.body_kb)
+    cases = (
+        ("full ArticleResponse (old)", lambda: serialize_full(page)),
+        ("ArticleSummary (default)", lambda: serialize_projected(page)),
+        ("fields=id,title,views", lambda: serialize_projected(page, parse_fields("title,views"))),
+    )
+    print(f"{args.page} articles per page, base64 image {args.image_kb} KB on half, fullContent {args.body_kb} KB")
+    print(f"{'case':<28} | {'payload':>12} | {'serialize (ms)':>14}")
+    print("-" * 62)
+    baseline = None
+    for name, fn in cases:
+        body, ms = timed(fn, args.repeat)
+        baseline = baseline or len(body)
+        print(f"{name:<28} | {len(body) / 1024:>9,.0f} KB | {ms:>14.2f}   ({len(body) / baseline:.1%})")
+
+
+if __name__ == "__main__":
+    main()
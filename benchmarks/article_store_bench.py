@@ -0,0 +1,144 @@
+"""
+ArticleStore 마이크로 벤치마크
+저장소 크기를 키워가며 단건 조회 / 조회수 증가 / 삭제+재삽입 지연을 측정하고
+기존 리스트 선형 탐색(next(...), list.remove)과 비교합니다.
+삭제+재삽입은 정렬 인덱스 쓰기도 포함하므로 SortedList(O(log n))와
+sortedcontainers가 없을 때의 정렬 list 대체 구현(O(n) 이동)을 함께 잽니다.
+이어서 published 목록 1페이지 / 500페이지 조회 비용을
+기존 방식(리스트 컴프리헨션 필터 + skip/limit 슬라이스)과 커서 페이지네이션으로 비교합니다.
+
+실행: python -m benchmarks.article_store_bench
+"""
+
+from datetime import datetime, timedelta
+import random
+import time
+
+import article_store
+from article_store import ArticleStore
+
+SIZES = [1_000, 10_000, 100_000, 300_000]
+OPS = 2_000
+
+
+def make_article(i: int) -> dict:
+    return {
+        "title": f"기사 {i}",
+        "content": "미리보기",
+        "views": 0,
+        "status": random.choice(["draft", "review", "published", "archived"]),
+        "author_id": i % 50,
+    }
+
+
+def per_op_us(fn, ids) -> float:
+    start = time.perf_counter()
+    for article_id in ids:
+        fn(article_id)
+    return (time.perf_counter() - start) / len(ids) * 1e6
+
+
+def bench_store(size: int, sorted_list: bool = True) -> dict:
+    article_store.SORTEDCONTAINERS_AVAILABLE = sorted_list
+    store = ArticleStore()
+    for i in range(size):
+        store.add(make_article(i))
+    ids = [random.randint(1, size) for _ in range(OPS)]
+
+    def delete_and_readd(article_id):
+        article = store.delete(article_id)
+        if article is not None:
+            store.add(article)
+
+    try:
+        return {
+            "get": per_op_us(store.get, ids),
+            "views": per_op_us(store.increment_views, ids),
+            "delete": per_op_us(delete_and_readd, ids),
+        }
+    finally:
+        article_store.SORTEDCONTAINERS_AVAILABLE = article_store.SortedList is not None
+
+
+def bench_linear(size: int) -> dict:
+    articles = [dict(make_article(i), id=i + 1) for i in range(size)]
+    # 선형 탐색은 느리므로 연산 수를 줄여 측정합니다.
+    ids = [random.randint(1, size) for _ in range(max(20, OPS // (size // 1_000)))]
+
+    def find(article_id):
+        return next((a for a in articles if a["id"] == article_id), None)
+
+    def views(article_id):
+        article = find(article_id)
+        article["views"] = article.get("views", 0) + 1
+
+    def delete_and_readd(article_id):
+        article = find(article_id)
+        articles.remove(article)
+        articles.append(article)
+
+    return {
+        "get": per_op_us(find, ids),
+        "views": per_op_us(views, ids),
+        "delete": per_op_us(delete_and_readd, ids),
+    }
+
+
+PAGE_SIZE = 20
+PAGE_SIZES = [100_000, 300_000]
+
+
+def bench_pages(size: int) -> dict:
+    store = ArticleStore()
+    articles = []
+    base = datetime(2025, 1, 1)
+    for i in range(size):
+        articles.append(store.add(dict(make_article(i), updated_at=base + timedelta(seconds=i))))
+
+    # 500페이지 직전 커서를 미리 구해 둠 (클라이언트가 next_cursor를 따라온 상황)
+    after = None
+    for _ in range(499):
+        _, after = store.page("published", limit=PAGE_SIZE, after=after)
+
+    def old_list(page: int):
+        filtered = [a for a in articles if a["status"] == "published"]
+        skip = (page - 1) * PAGE_SIZE
+        return filtered[skip:skip + PAGE_SIZE]
+
+    def timed(fn, n=50) -> float:
+        start = time.perf_counter()
+        for _ in range(n):
+            fn()
+        return (time.perf_counter() - start) / n * 1e6
+
+    return {
+        "old p1": timed(lambda: old_list(1), n=5),
+        "old p500": timed(lambda: old_list(500), n=5),
+        "cursor p1": timed(lambda: store.page("published", limit=PAGE_SIZE)),
+        "cursor p500": timed(lambda: store.page("published", limit=PAGE_SIZE, after=after)),
+    }
+
+
+def main():
+    random.seed(0)
+    print(f"{'size':>8} | {'impl':<12} | {'get (us)':>10} | {'views (us)':>10} | {'delete (us)':>11}")
+    print("-" * 64)
+    for size in SIZES:
+        impls = [("linear list", bench_linear), ("sorted list", lambda n: bench_store(n, sorted_list=False))]
+        if article_store.SortedList is not None:
+            impls.insert(0, ("SortedList", bench_store))
+        for name, bench in impls:
+            r = bench(size)
+            print(f"{size:>8} | {name:<12} | {r['get']:>10.2f} | {r['views']:>10.2f} | {r['delete']:>11.2f}")
+
+    print()
+    print(f"published listing, {PAGE_SIZE} per page (us per request)")
+    print(f"{'size':>8} | {'old p1':>10} | {'old p500':>10} | {'cursor p1':>10} | {'cursor p500':>11}")
+    print("-" * 60)
+    for size in PAGE_SIZES:
+        r = bench_pages(size)
+        print(f"{size:>8} | {r['old p1']:>10.1f} | {r['old p500']:>10.1f} | {r['cursor p1']:>10.1f} | {r['cursor p500']:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
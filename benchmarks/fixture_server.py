@@ -0,0 +1,117 @@
+"""
+로컬 HTML 픽스처 서버
+저장된 KBO 일정 / 네이버 뉴스 HTML을 실제 사이트와 같은 경로로 제공합니다.
+스크래퍼 업스트림을 이 서버로 바꿔 캐시·파서·HTTP 클라이언트를 테스트할 수 있습니다.
+
+실행: python -m benchmarks.fixture_server [--port 8765] [--delay 0.2]
+예:   KBO_SCHEDULE_URL=http://127.0.0.1:8765/Schedule/Schedule.aspx uvicorn backend_main:app
+
+시즌 크롤러용 GetScheduleList(POST)는 일정 픽스처(4월) 행을 실제 AJAX 응답 형태의 JSON으로 바꿔 돌려주고,
+폼의 gameMonth가 있으면 날짜를 그 달로 바꿉니다. gameMonth가 없으면 실제 사이트처럼 기본 달(4월)을 줍니다.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List, Tuple
+from urllib.parse import parse_qs
+import argparse
+import json
+import re
+import threading
+import time
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# 요청 경로 -> 픽스처 파일
+ROUTES = {
+    "/Schedule/Schedule.aspx": "kbo_schedule.html",
+    "/kbaseball/news": "naver_news.html",
+    "/kbaseball/index": "naver_news.html",
+}
+
+SCHEDULE_LIST_PATH = "/ws/Schedule.asmx/GetScheduleList"
+
+_ROW = re.compile(r'<tr>(<td class="day">.*?)</tr>', re.S)
+_CELL = re.compile(r'<td(?: class="(\w+)")?>(.*?)</td>', re.S)
+
+
+def schedule_list_rows() -> List[List[dict]]:
+    """일정 픽스처 테이블을 GetScheduleList의 rows 형태로 (날짜 칸은 그날 첫 행에만, 끝에 비고 칸)"""
+    html = (FIXTURES_DIR / "kbo_schedule.html").read_text(encoding="utf-8")
+    rows = []
+    last_day = None
+    for tr in _ROW.findall(html):
+        cells = [{"Text": text, "Class": cls or None} for cls, text in _CELL.findall(tr)]
+        if cells[0]["Text"] == last_day:
+            cells = cells[1:]
+        else:
+            last_day = cells[0]["Text"]
+            cells[0]["Text"] = f"<b>{last_day}</b>"
+        rows.append(cells + [{"Text": "-", "Class": None}])
+    return rows
+
+
+def schedule_list_body(rows: List[List[dict]], month: str) -> bytes:
+    body = json.dumps({"rows": [{"row": row} for row in rows], "result_cd": 100}, ensure_ascii=False)
+    return body.replace(">04.", f">{month[:2]}.").encode()
+
+
+class FixtureServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # 동시 접속 벤치마크에서 SYN 재전송 지연이 생기지 않도록
+
+
+def make_handler(delay: float = 0.0):
+    schedule_rows = schedule_list_rows()
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            name = ROUTES.get(self.path.partition("?")[0])
+            if name is None:
+                self.send_error(404)
+                return
+            if delay:
+                time.sleep(delay)  # 업스트림 지연 흉내
+            self._send(200, "text/html; charset=utf-8", (FIXTURES_DIR / name).read_bytes())
+
+        def do_POST(self):
+            if self.path.partition("?")[0] != SCHEDULE_LIST_PATH:
+                self.send_error(404)
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            form = parse_qs(self.rfile.read(length).decode())
+            if delay:
+                time.sleep(delay)
+            month = form.get("gameMonth", ["04"])[0]
+            self._send(200, "application/json; charset=utf-8", schedule_list_body(schedule_rows, month))
+
+        def _send(self, status: int, content_type: str, body: bytes):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+
+def start_fixture_server(port: int = 0, delay: float = 0.0) -> Tuple[FixtureServer, str]:
+    """백그라운드 스레드에서 서버를 띄우고 (서버, base_url)을 반환합니다. port=0이면 빈 포트 사용."""
+    server = FixtureServer(("127.0.0.1", port), make_handler(delay))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 HTML 픽스처 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.0, help="응답 지연(초)")
+    args = parser.parse_args()
+    server = FixtureServer(("127.0.0.1", args.port), make_handler(args.delay))
+    print(f"serving {FIXTURES_DIR} on http://127.0.0.1:{args.port}")
+    server.serve_forever()
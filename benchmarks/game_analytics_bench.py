@@ -0,0 +1,125 @@
+"""
+경기 분석 벤치마크 (시즌 규모 합성 데이터)
+720경기 × 경기당 300 이벤트(약 21.6만 행)의 plays 테이블을 만들고
+행마다 도는 Python 루프와 NumPy 벡터 연산(game_analytics)의 집계 시간을 비교합니다.
+
+- season: 시즌 전체 결정적 장면 / 선수별 누적 WPA / RE24
+- per-game: 720경기 각각의 분석
+- frame: plays 테이블 → NumPy 배열 복사 (데이터가 바뀔 때만)
+
+실행: python -m benchmarks.game_analytics_bench [--games 720] [--events 300] [--top 10]
+"""
+
+from array import array
+from collections import defaultdict
+import argparse
+import heapq
+import random
+import time
+
+from game_analytics import GameAnalytics, PlayFrame
+from game_data import GameDataStore
+
+
+def make_store(games: int, events: int, players: int = 300, seed: int = 7) -> GameDataStore:
+    """합성 시즌 데이터를 plays 테이블 열에 직접 채웁니다."""
+    rng = random.Random(seed)
+    store = GameDataStore("/nonexistent")
+    table = store.plays
+    for g in range(games):
+        store._game(f"2024-{g:04d}")
+    for p in range(players):
+        table.code("batter", f"타자{p}")
+        table.code("pitcher", f"투수{p}")
+    table.categories["batter"] = [f"타자{p}" for p in range(players)]
+    table.categories["pitcher"] = [f"투수{p}" for p in range(players)]
+
+    rows = games * events
+    c = table.columns
+    c["game"] = array("i", (g for g in range(games) for _ in range(events)))
+    c["inning"] = array("b", (1 + (e * 9) // events for _ in range(games) for e in range(events)))
+    c["half"] = array("b", (e % 2 for _ in range(games) for e in range(events)))
+    c["batter"] = array("i", (rng.randrange(players) for _ in range(rows)))
+    c["pitcher"] = array("i", (rng.randrange(players) for _ in range(rows)))
+    c["result"] = ["안타"] * rows
+    for col in ("pitches", "balls", "strikes", "before_outs", "before_bases", "after_outs", "after_bases"):
+        c[col] = array(table.schema[col], [0]) * rows
+    away = array("i", (rng.randrange(10) for _ in range(rows)))
+    home = array("i", (rng.randrange(10) for _ in range(rows)))
+    c["before_away"], c["before_home"] = away, home
+    c["after_away"] = array("i", (a + (rng.random() < 0.1) for a in away))
+    c["after_home"] = array("i", home)
+    c["lev"] = array("d", (rng.expovariate(1.0) for _ in range(rows)))
+    c["res"] = array("d", (rng.uniform(0, 2.5) for _ in range(rows)))
+    c["rea"] = array("d", (rng.uniform(0, 2.5) for _ in range(rows)))
+    c["wpe"] = array("d", (rng.random() for _ in range(rows)))
+    c["wpa"] = array("d", (rng.gauss(0, 0.04) for _ in range(rows)))
+    table._index_games()
+    table.version += 1
+    return store
+
+
+def loop_summary(store: GameDataStore, rows, top: int) -> dict:
+    """기존 방식처럼 행마다 Python으로 집계 (비교 기준)"""
+    c = store.plays.columns
+    batter_wpa = defaultdict(float)
+    batter_re24 = defaultdict(float)
+    pitcher_wpa = defaultdict(float)
+    moments = []
+    for i in rows:
+        wpa = c["wpa"][i]
+        runs = c["after_away"][i] + c["after_home"][i] - c["before_away"][i] - c["before_home"][i]
+        batter_wpa[c["batter"][i]] += wpa
+        batter_re24[c["batter"][i]] += c["rea"][i] - c["res"][i] + runs
+        pitcher_wpa[c["pitcher"][i]] -= wpa
+        moments.append((abs(wpa), i))
+    return {
+        "decisive": [i for _, i in heapq.nlargest(top, moments)],
+        "batters": sorted(batter_wpa, key=batter_wpa.get, reverse=True)[:top],
+        "pitchers": sorted(pitcher_wpa, key=pitcher_wpa.get, reverse=True)[:top],
+    }
+
+
+def timed(fn, repeat: int):
+    result = fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return result, (time.perf_counter() - start) / repeat * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="경기 분석 벤치마크")
+    parser.add_argument("--games", type=int, default=720)
+    parser.add_argument("--events", type=int, default=300)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    store = make_store(args.games, args.events)
+    print(f"{len(store.plays):,} plays in {args.games} games (synthetic, built in {time.perf_counter() - start:.1f}s)")
+
+    analytics = GameAnalytics(store)
+    _, frame_ms = timed(lambda: PlayFrame(store), args.repeat)
+    analytics.frame()
+    all_rows = range(len(store.plays))
+    game_rows = [store.plays.game_rows(g) for g in range(args.games)]
+
+    loop, loop_season_ms = timed(lambda: loop_summary(store, all_rows, args.top), 1)
+    vec, vec_season_ms = timed(lambda: analytics.season(args.top), args.repeat)
+    _, loop_games_ms = timed(lambda: [loop_summary(store, rows, 5) for rows in game_rows], 1)
+    _, vec_games_ms = timed(lambda: [analytics.game(gid, 5) for gid in store.game_ids], 1)
+
+    names = store.plays.categories["batter"]
+    same = [names[code] for code in loop["batters"]] == [b["player"] for b in vec["batters"]]
+    print(f"{'case':<28} | {'python loop (ms)':>16} | {'numpy (ms)':>10} | {'speedup':>7}")
+    print("-" * 72)
+    print(f"{'season summary':<28} | {loop_season_ms:>16.1f} | {vec_season_ms:>10.1f} | {loop_season_ms / vec_season_ms:>6.1f}x")
+    print(f"{f'per-game x{args.games}':<28} | {loop_games_ms:>16.1f} | {vec_games_ms:>10.1f} | {loop_games_ms / vec_games_ms:>6.1f}x")
+    print(f"{'frame build (on change)':<28} | {'':>16} | {frame_ms:>10.1f} |")
+    print(f"same batter ranking: {same}")
+
+
+if __name__ == "__main__":
+    main()
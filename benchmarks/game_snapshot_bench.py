@@ -0,0 +1,141 @@
+"""
+경기 기록 바이너리 스냅샷 벤치마크 (시즌 규모 합성 CSV)
+720경기 × 300 이벤트의 결장.csv / 리뷰.csv / 경기주요기록.csv를 임시 디렉터리에 만들고
+CSV 파싱(GameDataStore.refresh)과 스냅샷 mmap 불러오기(game_snapshot)를 비교합니다.
+
+- 시작 시간: 빈 저장소 → 모든 테이블 준비 (스냅샷은 불러온 뒤 바뀐 파일 확인까지 포함)
+- 워커 메모리: 워커 N개(spawn)가 동시에 데이터를 올리고 분석 배열까지 만든 뒤의
+  프로세스별 증가량 (Private: 그 프로세스만 쓰는 메모리, PSS: 공유 페이지를 나눠 센 메모리)
+
+실행: python -m benchmarks.game_snapshot_bench [--games 720] [--events 300] [--workers 2]
+"""
+
+from pathlib import Path
+import argparse
+import multiprocessing
+import random
+import tempfile
+import time
+
+from game_data import HIGHLIGHTS_FILE, LINESCORE_FILE, PLAYS_FILE, GameDataStore
+from game_snapshot import GameSnapshot
+
+TEAMS = ("두산", "SSG", "LG", "KT", "KIA", "NC", "삼성", "롯데", "한화", "키움")
+RESULTS = ("우익수 방면 2루타", "중견수 방면 1루타", "유격수 땅볼", "좌익수 뒤 홈런", "삼진", "볼넷")
+SITUATIONS = ("무사 0:0", "1사 1루 1:0", "\"1사 1,3루 1:0\"", "2사 만루 2:1", "\"무사 1,2루 0:0\"")
+
+
+def write_season(root: Path, games: int, events: int, seed: int = 7):
+    rng = random.Random(seed)
+    for g in range(games):
+        directory = root / f"2024-{g:04d}"
+        directory.mkdir(parents=True)
+        lines = ["결정적 장면,,,,,,,,,,,", "이닝초,투수,타자,P,결과,이전상황,이후상황,LEV,REs,REa,WPe,WPa"]
+        for e in range(events):
+            lines.append(
+                f"{1 + e * 9 // events}회{'초말'[e % 2]},투수{rng.randrange(300)},타자{rng.randrange(300)},"
+                f"{rng.randrange(1, 9)}(2-1),{rng.choice(RESULTS)},{rng.choice(SITUATIONS)},{rng.choice(SITUATIONS)},"
+                f"{rng.expovariate(1.0):.2f},{rng.uniform(0, 2.5):.3f},{rng.uniform(0, 2.5):.3f},"
+                f"{rng.uniform(0, 100):.2f}%,{rng.gauss(0, 0.04):.3f}"
+            )
+        (directory / PLAYS_FILE).write_text("\n".join(lines), encoding="utf-8-sig")
+
+        away, home = rng.sample(TEAMS, 2)
+        innings = [[rng.choice((0, 0, 0, 1, 2)) for _ in range(9)] for _ in range(2)]
+        review = ["경기 스코어,", "구장: 잠실 ,\"관중 : 8,822\",개시: 18:30,종료 : 21:35,경기시간 : 3:05",
+                  ",팀," + ",".join(f"{n}회" for n in range(1, 13)) + ",R,H,E,B"]
+        for team, runs in ((away, innings[0]), (home, innings[1])):
+            review.append(f"승,({team})22승 29패 3무," + ",".join(map(str, runs)) + ",-,-,-," + f"{sum(runs)},9,1,3")
+        (directory / LINESCORE_FILE).write_text("\n".join(review), encoding="utf-8-sig")
+        (directory / HIGHLIGHTS_FILE).write_text(
+            "경기 주요 기록,\n결승타,타자1(2회 2사서 좌중월 홈런)\n실책,\"타자2(5회), 타자3(6회)\"\n", encoding="utf-8-sig")
+
+
+def memory_kb() -> dict:
+    values = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                values[parts[0].rstrip(":")] = int(parts[1])
+    return {"rss": values["Rss"], "pss": values["Pss"],
+            "private": values["Private_Clean"] + values["Private_Dirty"]}
+
+
+def worker(mode: str, root: str, snapshot: str, barrier, results):
+    from game_analytics import GameAnalytics
+    before = memory_kb()
+    store = GameDataStore(Path(root))
+    if mode == "snapshot":
+        GameSnapshot(Path(snapshot)).load(store)
+    store.refresh(force=True)
+    GameAnalytics(store).frame()  # 분석용 NumPy 배열까지 (스냅샷은 복사 없이 view)
+    barrier.wait()
+    after = memory_kb()
+    barrier.wait()
+    results.put({key: after[key] - before[key] for key in after})
+
+
+def measure_workers(mode: str, root: Path, snapshot: Path, workers: int) -> list:
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(mode, str(root), str(snapshot), barrier, results)) for _ in range(workers)]
+    for proc in procs:
+        proc.start()
+    measured = [results.get() for _ in procs]
+    for proc in procs:
+        proc.join()
+    return measured
+
+
+def main():
+    parser = argparse.ArgumentParser(description="경기 기록 스냅샷 벤치마크")
+    parser.add_argument("--games", type=int, default=720)
+    parser.add_argument("--events", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "data"
+        write_season(root, args.games, args.events)
+        snapshot_path = Path(tmp) / "game_data.snap"
+
+        start = time.perf_counter()
+        parsed = GameDataStore(root)
+        parsed.refresh(force=True)
+        parse_s = time.perf_counter() - start
+
+        snapshot = GameSnapshot(snapshot_path)
+        snapshot.save(parsed)
+
+        start = time.perf_counter()
+        mapped = GameDataStore(root)
+        assert GameSnapshot(snapshot_path).load(mapped)
+        load_ms = (time.perf_counter() - start) * 1e3
+        start = time.perf_counter()
+        reread = mapped.refresh(force=True)
+        check_ms = (time.perf_counter() - start) * 1e3
+        assert reread == 0 and repr(mapped.plays.rows(range(1000))) == repr(parsed.plays.rows(range(1000)))
+
+        print(f"{len(parsed.plays):,} plays / {len(parsed.linescores):,} line scores / "
+              f"{len(parsed.highlights):,} highlights in {args.games} games")
+        print(f"snapshot: {snapshot_path.stat().st_size / 1024 / 1024:.1f} MB, saved in {snapshot.save_ms:.0f} ms")
+        print(f"{'startup':<34} | {'ms':>9}")
+        print("-" * 48)
+        print(f"{'CSV parse (refresh)':<34} | {parse_s * 1e3:>9.0f}")
+        print(f"{'snapshot mmap load':<34} | {load_ms:>9.1f}")
+        print(f"{'  + unchanged file check':<34} | {check_ms:>9.1f}")
+
+        print()
+        print(f"per-worker memory growth with {args.workers} concurrent workers (MB, after analytics frame)")
+        print(f"{'mode':<10} | {'rss':>7} | {'pss':>7} | {'private':>7}")
+        print("-" * 40)
+        for mode in ("csv", "snapshot"):
+            measured = measure_workers(mode, root, snapshot_path, args.workers)
+            avg = {key: sum(m[key] for m in measured) / len(measured) / 1024 for key in measured[0]}
+            print(f"{mode:<10} | {avg['rss']:>7.1f} | {avg['pss']:>7.1f} | {avg['private']:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
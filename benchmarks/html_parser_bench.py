@@ -0,0 +1,92 @@
+"""
+HTML 파서 백엔드 벤치마크
+저장된 픽스처(KBO 일정, 네이버 뉴스)를 대상으로
+기존 경로(문서 전체 html.parser 파싱)와 백엔드별 서브트리 빠른 경로의
+파싱 시간과 최대 메모리(RSS 증가분)를 비교합니다.
+
+각 측정은 별도 프로세스에서 실행되어 RSS 최대값이 서로 섞이지 않습니다.
+--pad N 으로 페이지 끝에 잡음 요소를 N배 덧붙여 Playwright가 렌더링한 큰 페이지를 흉내낼 수 있습니다.
+
+실행: python -m benchmarks.html_parser_bench [--pad 3] [--repeat 5]
+"""
+
+from pathlib import Path
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+CASES = {
+    "kbo_schedule": ("kbo_schedule.html", "parse_kbo_schedule", "_parse_kbo_schedule_full"),
+    "naver_news": ("naver_news.html", "parse_naver_articles", "_parse_naver_articles_full"),
+}
+NOISE = "".join(
+    f'<div class="noise" id="n{i}"><a href="/x/{i}"><span class="label">잡음 {i}</span></a>'
+    + "<span>셀</span>" * 20 + "</div>"
+    for i in range(400)
+)
+
+
+def load(name: str, pad: int) -> str:
+    html = (FIXTURES_DIR / name).read_text(encoding="utf-8")
+    return html.replace("</body>", NOISE * pad + "</body>") if pad else html
+
+
+def worker(case: str, backend_name: str, pad: int, repeat: int):
+    import html_parsing
+    import scrape_parsers
+
+    filename, fast_fn, full_fn = CASES[case]
+    html = load(filename, pad)
+    if backend_name == "full":
+        run = lambda: getattr(scrape_parsers, full_fn)(html)
+    else:
+        backend = html_parsing.get_backend(backend_name)
+        run = lambda: getattr(scrape_parsers, fast_fn)(html, backend)
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result = run()
+    items = result[0] if fast_fn == "parse_kbo_schedule" or backend_name != "full" else scrape_parsers._dedupe(result[0])
+    start = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    elapsed = (time.perf_counter() - start) / repeat
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({
+        "ms": elapsed * 1000,
+        "peak_kb": peak_rss - base_rss,
+        "items": len(items),
+        "html_kb": len(html.encode()) // 1024,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pad", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--worker", nargs=2, metavar=("CASE", "BACKEND"))
+    args = parser.parse_args()
+    if args.worker:
+        worker(args.worker[0], args.worker[1], args.pad, args.repeat)
+        return
+
+    from html_parsing import BACKENDS
+
+    print(f"{'case':<13} | {'parser':<22} | {'html KB':>7} | {'items':>5} | {'ms/parse':>8} | {'peak +RSS KB':>12}")
+    print("-" * 84)
+    for case in CASES:
+        for backend_name in ["full", *BACKENDS]:
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.html_parser_bench", "--worker", case, backend_name,
+                 "--pad", str(args.pad), "--repeat", str(args.repeat)],
+                capture_output=True, text=True, check=True,
+            )
+            r = json.loads(out.stdout)
+            label = "full html.parser (old)" if backend_name == "full" else f"subtree {backend_name}"
+            print(f"{case:<13} | {label:<22} | {r['html_kb']:>7} | {r['items']:>5} | {r['ms']:>8.2f} | {r['peak_kb']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+비동기 HTTP 클라이언트 벤치마크
+응답이 지연되는 로컬 픽스처 서버에 동시 스크래핑 요청을 보내고,
+async def 안에서 블로킹 호출(기존 requests.get 방식)을 할 때와
+공용 httpx 클라이언트를 쓸 때의 전체 소요 시간을 비교합니다.
+
+실행: python -m benchmarks.http_client_bench [동시 요청 수] [업스트림 지연(초)]
+"""
+
+import asyncio
+import sys
+import time
+import urllib.request
+
+from benchmarks.fixture_server import start_fixture_server
+from http_client import HttpClient
+
+
+async def blocking_fetch(url: str) -> int:
+    # 기존 코드처럼 async 핸들러 안에서 동기 I/O 수행 -> 이벤트 루프가 멈춤
+    with urllib.request.urlopen(url, timeout=15) as response:
+        return len(response.read())
+
+
+async def main():
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+    server, base = start_fixture_server(delay=delay)
+    urls = [f"{base}/Schedule/Schedule.aspx?month={i}" for i in range(concurrency)]
+    print(f"concurrent={concurrency} upstream_delay={delay}s")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(blocking_fetch(u) for u in urls))
+    blocking = time.perf_counter() - start
+    print(f"{'blocking (requests-style)':<28} {blocking:6.2f}s")
+
+    for per_host in (1, 6, concurrency):
+        client = HttpClient(max_per_host=per_host)
+        client.start()
+        start = time.perf_counter()
+        await asyncio.gather(*(client.get(u) for u in urls))
+        elapsed = time.perf_counter() - start
+        await client.aclose()
+        print(f"{f'httpx shared (per_host={per_host})':<28} {elapsed:6.2f}s  speedup x{blocking / elapsed:.1f}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+"""
+JSON 응답 직렬화 벤치마크 (기사 1,000건당)
+저장소에서 꺼낸 기사 dict를 응답 바이트로 만드는 시간을 비교합니다.
+
+- response_model: FastAPI 기본 경로 (List[ArticleResponse] 검증 → 직렬화 → json.dumps)
+- jsonable_encoder: 검증 없이 jsonable_encoder → JSONResponse
+- FastJSONResponse: 검증 없이 orjson으로 바로 직렬화 (fast_json)
+- FastJSONResponse (stdlib): orjson이 없을 때의 fallback
+
+실행: python -m benchmarks.json_response_bench [--articles 1000] [--repeat 20]
+"""
+
+from datetime import datetime, timedelta
+from typing import List
+import argparse
+import os
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+os.environ.setdefault("STORAGE_BACKEND", "memory")  # 스키마만 필요하므로 DB 파일을 만들지 않음
+
+import fast_json  # noqa: E402
+from article_projection import ARTICLE_FIELDS, project  # noqa: E402
+from backend_main import ArticleResponse  # noqa: E402
+from fast_json import FastJSONResponse  # noqa: E402
+
+
+def make_articles(count: int) -> List[dict]:
+    now = datetime.now()
+    return [{
+        "id": i + 1,
+        "title": f"KBO 리그 {i}번째 경기 리뷰: 9회말 끝내기 안타",
+        "content": "미리보기 문장입니다. " * 8,
+        "fullContent": "본문 문단입니다. " * 120,
+        "date": (now - timedelta(minutes=i)).isoformat(),
+        "reporter": "기자",
+        "department": "스포츠부",
+        "email": "reporter@example.com",
+        "image": f"https://imgnews.pstatic.net/image/{i}.jpg" if i % 2 else None,
+        "tags": ["KBO", "리뷰", "야구"],
+        "views": i * 7,
+        "status": "published",
+        "created_at": now - timedelta(minutes=i),
+        "updated_at": now - timedelta(minutes=i),
+    } for i in range(count)]
+
+
+ARTICLE_LIST = TypeAdapter(List[ArticleResponse])
+
+
+def via_response_model(articles: List[dict]) -> bytes:
+    validated = ARTICLE_LIST.validate_python(articles)
+    return JSONResponse(ARTICLE_LIST.dump_python(validated, mode="json")).body
+
+
+def via_jsonable_encoder(articles: List[dict]) -> bytes:
+    return JSONResponse(jsonable_encoder(articles)).body
+
+
+def via_fast(articles: List[dict]) -> bytes:
+    return FastJSONResponse(articles).body
+
+
+def via_fast_stdlib(articles: List[dict]) -> bytes:
+    available, fast_json.ORJSON_AVAILABLE = fast_json.ORJSON_AVAILABLE, False
+    try:
+        return FastJSONResponse(articles).body
+    finally:
+        fast_json.ORJSON_AVAILABLE = available
+
+
+def timed(fn, articles: List[dict], repeat: int) -> tuple:
+    body = fn(articles)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(articles)
+    return body, (time.perf_counter() - start) / repeat * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON 응답 직렬화 벤치마크")
+    parser.add_argument("--articles", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    articles = [project(a, ARTICLE_FIELDS) for a in make_articles(args.articles)]
+    scale = 1000 / args.articles
+    print(f"{args.articles} articles, orjson={'yes' if fast_json.ORJSON_AVAILABLE else 'no'}")
+    print(f"{'path':<28} | {'ms / 1,000 articles':>19} | {'payload':>9}")
+    print("-" * 64)
+    cases = (
+        ("response_model (default)", via_response_model),
+        ("jsonable_encoder", via_jsonable_encoder),
+        ("FastJSONResponse", via_fast),
+        ("FastJSONResponse (stdlib)", via_fast_stdlib),
+    )
+    baseline = None
+    for name, fn in cases:
+        body, ms = timed(fn, articles, args.repeat)
+        baseline = baseline or ms
+        print(f"{name:<28} | {ms * scale:>19.2f} | {len(body) / 1024:>6,.0f} KB   (x{baseline / ms:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+KBO 시즌 일정 크롤러 벤치마크
+로컬 픽스처 서버(페이지마다 --delay초 지연)에서 한 시즌의 (시리즈, 월) 페이지를
+한 장씩 차례로 가져올 때와 crawl_kbo_season으로 동시에 가져올 때를 비교합니다.
+
+실행: python -m benchmarks.kbo_season_crawl_bench [--delay 1.0] [--rates 2,4,8]
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.fixture_server import start_fixture_server
+from http_client import http_client
+from kbo_scraper import (
+    DEFAULT_SERIES, HostRateLimiter, _fetch_partition, crawl_kbo_season, merge_season, season_partitions,
+)
+
+SEASON = 2025
+
+
+async def sequential(base_url: str) -> dict:
+    """기존 방식처럼 페이지를 하나씩 (비교 기준)"""
+    limiter = HostRateLimiter(rate=1e9, burst=1)
+    results = []
+    for name, month in season_partitions(DEFAULT_SERIES):
+        results.append(await _fetch_partition(base_url, SEASON, name, month, limiter))
+    games, duplicates = merge_season(SEASON, results)
+    return {"count": len(games), "duplicates": duplicates, "pages": len(results)}
+
+
+async def run(args):
+    server, base = start_fixture_server(delay=args.delay)
+    url = f"{base}/Schedule/Schedule.aspx"
+    try:
+        print(f"{len(season_partitions(DEFAULT_SERIES))} pages ({', '.join(DEFAULT_SERIES)}), "
+              f"{args.delay:.1f}s per page, {http_client.max_per_host} connections per host")
+        print(f"{'mode':<28} | {'seconds':>7} | {'games':>6} | {'dupes':>5}")
+        print("-" * 58)
+        start = time.perf_counter()
+        base_result = await sequential(url)
+        print(f"{'sequential':<28} | {time.perf_counter() - start:>7.2f} | "
+              f"{base_result['count']:>6} | {base_result['duplicates']:>5}")
+        for rate in args.rates:
+            start = time.perf_counter()
+            result = await crawl_kbo_season(SEASON, base_url=url, limiter=HostRateLimiter(rate, burst=int(rate)))
+            assert result["success"] and result["count"] == base_result["count"]
+            print(f"{f'concurrent ({rate:g} req/s)':<28} | {time.perf_counter() - start:>7.2f} | "
+                  f"{result['count']:>6} | {result['duplicates']:>5}")
+    finally:
+        await http_client.aclose()
+        server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KBO 시즌 일정 크롤러 벤치마크")
+    parser.add_argument("--delay", type=float, default=1.0, help="픽스처 서버 페이지 지연(초)")
+    parser.add_argument("--rates", default="2,4,8", help="호스트당 초당 요청 수 (쉼표 구분)")
+    args = parser.parse_args()
+    args.rates = [float(r) for r in args.rates.split(",")]
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
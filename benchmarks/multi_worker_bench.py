@@ -0,0 +1,179 @@
+"""
+멀티 워커 부하 / 일관성 테스트
+임시 SQLite DB와 로컬 픽스처 서버를 붙여 `uvicorn backend_main:app --workers N`을 띄우고
+워커 수별 처리량(requests/s)과 워커 간 데이터 일관성을 확인합니다.
+
+- 처리량: 기사 목록 / 기사 상세 / KBO 일정 GET을 동시 요청으로 duration초 동안 전송
+- 일관성:
+  - 여러 워커에서 동시에 만든 기사 ID가 겹치지 않는지
+  - 모든 기사가 새 연결(= 임의의 워커)에서 조회되는지
+  - 조회수 증가가 flush 후 합계와 정확히 맞는지
+  - KBO 일정 스크래핑이 워커 수와 관계없이 한 번만 일어나는지 (리스 + 공유 캐시)
+
+실행: python -m benchmarks.multi_worker_bench [--workers 1,2,4] [--duration 5] [--concurrency 64]
+"""
+
+from pathlib import Path
+from typing import List
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.fixture_server import start_fixture_server
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int, db_path: str, upstream: str, port: int) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        STORAGE_BACKEND="sqlite",
+        DATABASE_URL=f"sqlite:///{db_path}",
+        WEB_CONCURRENCY=str(workers),
+        KBO_SCHEDULE_URL=f"{upstream}/Schedule/Schedule.aspx",
+        NAVER_BASEBALL_NEWS_URL=f"{upstream}/kbaseball/news",
+        VIEW_FLUSH_INTERVAL="0.2",
+    )
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend_main:app",
+         "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        cwd=ROOT, env=env,
+    )
+
+
+async def wait_ready(base: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+async def fresh_get(base: str, path: str) -> httpx.Response:
+    # 새 연결마다 커널이 임의의 워커에 배정하므로 워커 간 일관성 확인에 사용
+    async with httpx.AsyncClient(base_url=base) as client:
+        return await client.get(path)
+
+
+async def load(base: str, paths: List[str], duration: float, concurrency: int) -> tuple:
+    done = errors = 0
+    deadline = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base, limits=limits, timeout=30) as client:
+        async def user(offset: int):
+            nonlocal done, errors
+            i = offset
+            while time.monotonic() < deadline:
+                response = await client.get(paths[i % len(paths)])
+                i += 1
+                if response.status_code == 200:
+                    done += 1
+                else:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(user(i) for i in range(concurrency)))
+        return done / (time.perf_counter() - start), errors
+
+
+async def run(workers: int, args, upstream: str) -> dict:
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    with tempfile.TemporaryDirectory() as tmp:
+        server = start_server(workers, os.path.join(tmp, "bench.db"), upstream, port)
+        try:
+            await wait_ready(base)
+            async with httpx.AsyncClient(base_url=base, timeout=30) as client:
+                r = await client.post("/api/register", json=dict(
+                    first_name="b", last_name="b", email="bench@example.com", username="bench", password="bench1234",
+                ))
+                headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+            # 여러 연결에서 동시에 기사 생성 → ID 중복 확인
+            async def create(i: int) -> int:
+                async with httpx.AsyncClient(base_url=base, timeout=30) as c:
+                    r = await c.post("/api/articles", headers=headers, json=dict(
+                        title=f"기사 {i}", content="내용", status="published",
+                    ))
+                    return r.json()["id"]
+
+            ids = await asyncio.gather(*(create(i) for i in range(args.articles)))
+            visible = await asyncio.gather(*(fresh_get(base, f"/api/articles/{i}") for i in ids))
+
+            # 조회수: 기사마다 views번 증가 (여러 연결 = 여러 워커)
+            async def view(article_id: int):
+                async with httpx.AsyncClient(base_url=base, timeout=30) as c:
+                    for _ in range(args.views):
+                        await c.post(f"/api/articles/{article_id}/views")
+
+            await asyncio.gather(*(view(i) for i in ids))
+            await asyncio.sleep(1.0)  # 모든 워커의 write-behind flush 대기
+            views = await asyncio.gather(*(fresh_get(base, f"/api/articles/{i}") for i in ids))
+            total_views = sum(r.json()["views"] for r in views)
+
+            paths = ["/api/articles?limit=20", "/api/kbo-schedule"] + [f"/api/articles/{i}" for i in ids[:8]]
+            rps, errors = await load(base, paths, args.duration, args.concurrency)
+
+            # 워커별 메트릭 수집 (새 연결을 여러 번 열어 가능한 한 모든 워커를 만남)
+            loaders = {}
+            for _ in range(workers * 8):
+                stats = (await fresh_get(base, "/api/metrics")).json()["kbo_schedule_loader"]
+                loaders[stats["worker"]] = stats
+
+            return {
+                "workers": workers,
+                "rps": rps,
+                "errors": errors,
+                "unique_ids": len(set(ids)) == len(ids),
+                "visible": all(r.status_code == 200 for r in visible),
+                "views_ok": total_views == len(ids) * args.views,
+                "scrapes": sum(s["leader_loads"] for s in loaders.values()),
+                "workers_seen": len(loaders),
+            }
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="멀티 워커 부하 / 일관성 테스트")
+    parser.add_argument("--workers", default="1,2,4", help="쉼표로 구분한 워커 수 목록")
+    parser.add_argument("--duration", type=float, default=5.0, help="처리량 측정 시간(초)")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--articles", type=int, default=50)
+    parser.add_argument("--views", type=int, default=10, help="기사당 조회수 증가 횟수")
+    args = parser.parse_args()
+
+    fixture, upstream = start_fixture_server()
+    print(f"cores={os.cpu_count()} concurrency={args.concurrency} duration={args.duration}s")
+    print(f"{'workers':>7} | {'req/s':>8} | {'errors':>6} | {'unique ids':>10} | {'visible':>7} | "
+          f"{'views':>5} | {'scrapes':>7} | {'seen':>4}")
+    print("-" * 78)
+    for workers in (int(w) for w in args.workers.split(",")):
+        r = await run(workers, args, upstream)
+        print(f"{r['workers']:>7} | {r['rps']:>8.0f} | {r['errors']:>6} | {str(r['unique_ids']):>10} | "
+              f"{str(r['visible']):>7} | {str(r['views_ok']):>5} | {r['scrapes']:>7} | {r['workers_seen']:>4}")
+    fixture.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+"""
+비밀번호 서비스 부하 테스트
+동시 로그인(bcrypt 검증)을 실행하면서, 같은 이벤트 루프에서 5ms 주기로 도는
+프로브 작업(= 다른 엔드포인트)의 지연 p99를 측정합니다.
+
+- inline: 기존 방식처럼 이벤트 루프에서 직접 bcrypt 실행
+- thread/process xN: PasswordService 워커 풀 사용
+
+실행: python -m benchmarks.password_load_bench [동시 로그인 수]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import bcrypt
+
+from password_service import PasswordService, PasswordServiceBusy, _verify
+
+PASSWORD = "test1234"
+# 벤치마크 시간을 줄이기 위해 cost 10 해시 사용 (운영 기본값은 12)
+HASHED = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(10)).decode()
+PROBE_INTERVAL = 0.005
+
+
+async def probe(stop: asyncio.Event, lags: list):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append((loop.time() - start - PROBE_INTERVAL) * 1000)
+
+
+async def run(verify, logins: int):
+    stop = asyncio.Event()
+    lags = []
+    probe_task = asyncio.create_task(probe(stop, lags))
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(verify() for _ in range(logins)), return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe_task
+    ok = sum(1 for r in results if r is True)
+    busy = sum(1 for r in results if isinstance(r, PasswordServiceBusy))
+    p99 = statistics.quantiles(lags, n=100)[98] if len(lags) >= 2 else float("nan")
+    return ok / elapsed, p99, busy
+
+
+async def main():
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    cores = os.cpu_count() or 1
+    print(f"cores={cores} concurrent_logins={logins}")
+    print(f"{'mode':<14} | {'logins/s':>9} | {'probe p99 (ms)':>14} | {'503':>4}")
+    print("-" * 50)
+
+    async def inline():
+        return _verify(PASSWORD, HASHED)
+
+    rate, p99, busy = await run(inline, logins)
+    print(f"{'inline':<14} | {rate:>9.1f} | {p99:>14.1f} | {busy:>4}")
+
+    for kind in ("thread", "process"):
+        for workers in sorted({1, 2, 4, cores}):
+            service = PasswordService(kind=kind, workers=workers, max_pending=logins)
+            service.start()
+            # 프로세스 풀은 첫 호출 시 워커가 뜨므로 미리 데워 둡니다.
+            await asyncio.gather(*(service.verify(PASSWORD, HASHED) for _ in range(workers)))
+            rate, p99, busy = await run(lambda: service.verify(PASSWORD, HASHED), logins)
+            service.shutdown()
+            print(f"{f'{kind} x{workers}':<14} | {rate:>9.1f} | {p99:>14.1f} | {busy:>4}")
+
+    # 백프레셔: 한도의 두 배를 한꺼번에 보내면 초과분은 즉시 거절됩니다.
+    service = PasswordService(kind="thread", workers=cores, max_pending=logins // 2)
+    rate, p99, busy = await run(lambda: service.verify(PASSWORD, HASHED), logins)
+    service.shutdown()
+    print(f"{'backpressure':<14} | {rate:>9.1f} | {p99:>14.1f} | {busy:>4}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
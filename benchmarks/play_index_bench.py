@@ -0,0 +1,92 @@
+"""
+플레이 역색인 벤치마크 (시즌 규모 합성 데이터)
+720경기 × 300 이벤트의 plays 테이블에서 조건 검색 시간을
+전체 행 스캔(Python)과 역색인(play_index)으로 비교합니다.
+
+실행: python -m benchmarks.play_index_bench [--games 720] [--events 300]
+"""
+
+from array import array
+import argparse
+import random
+import time
+
+from benchmarks.game_analytics_bench import make_store
+from play_index import RESULT_TYPES, SCORING_POSITION, PlayIndex
+
+QUERIES = (
+    ("batter + risp + high leverage", {"batter": "타자7", "risp": True, "leverage": "high"}),
+    ("pitcher + inning 9 + 홈런", {"pitcher": "투수3", "inning": 9, "result": "홈런"}),
+    ("risp + high leverage (broad)", {"risp": True, "leverage": "high"}),
+    ("2사 만루", {"outs": 2, "bases": 7}),
+)
+
+
+def scan(store, query: dict) -> int:
+    """색인 없이 모든 행을 확인 (비교 기준)"""
+    table = store.plays
+    c = table.columns
+    batter = table.lookup("batter", query["batter"]) if "batter" in query else None
+    pitcher = table.lookup("pitcher", query["pitcher"]) if "pitcher" in query else None
+    found = 0
+    for i in range(len(table)):
+        if batter is not None and c["batter"][i] != batter:
+            continue
+        if pitcher is not None and c["pitcher"][i] != pitcher:
+            continue
+        if "inning" in query and c["inning"][i] != query["inning"]:
+            continue
+        if "outs" in query and c["before_outs"][i] != query["outs"]:
+            continue
+        if "bases" in query and c["before_bases"][i] != query["bases"]:
+            continue
+        if "risp" in query and not c["before_bases"][i] & SCORING_POSITION:
+            continue
+        if "result" in query and query["result"] not in table["result"][i]:
+            continue
+        if "leverage" in query and c["lev"][i] < 1.5:
+            continue
+        found += 1
+    return found
+
+
+def timed(fn, repeat: int):
+    result = fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return result, (time.perf_counter() - start) / repeat * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="플레이 역색인 벤치마크")
+    parser.add_argument("--games", type=int, default=720)
+    parser.add_argument("--events", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    store = make_store(args.games, args.events)
+    rng = random.Random(11)
+    c = store.plays.columns
+    rows = len(store.plays)
+    c["before_bases"] = array("b", (rng.randrange(8) for _ in range(rows)))
+    c["before_outs"] = array("b", (rng.randrange(3) for _ in range(rows)))
+    store.plays.columns["result"] = [f"좌익수 방면 {rng.choice(RESULT_TYPES)}" for _ in range(rows)]
+
+    start = time.perf_counter()
+    index = PlayIndex(store)
+    build_s = time.perf_counter() - start
+    stats = index.stats()
+    print(f"{rows:,} plays, index built in {build_s:.2f}s, "
+          f"{stats['terms']} terms, {stats['postings_bytes'] / 1024 / 1024:.1f} MB postings")
+    print(f"{'query':<32} | {'matches':>7} | {'scan (ms)':>9} | {'index (ms)':>10}")
+    print("-" * 70)
+    for name, query in QUERIES:
+        expected, scan_ms = timed(lambda: scan(store, query), 1)
+        (total, _), index_ms = timed(lambda: index.search(query), args.repeat)
+        assert total == expected, (name, total, expected)
+        print(f"{name:<32} | {total:>7,} | {scan_ms:>9.1f} | {index_ms:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
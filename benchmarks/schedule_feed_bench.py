@@ -0,0 +1,72 @@
+"""
+KBO 일정 변경 피드 벤치마크
+픽스처 일정(130경기)에서 갱신마다 경기 몇 개의 시각 변경 / 우천 취소가 생길 때
+전체 일정을 다시 받는 응답과 /api/kbo-schedule/changes 델타 응답의 크기, 기록 / 조회 시간을 비교합니다.
+
+실행: python -m benchmarks.schedule_feed_bench [--refreshes 20] [--changes 2]
+"""
+
+import argparse
+import copy
+import gzip
+import random
+import time
+
+from benchmarks.fixture_server import FIXTURES_DIR
+from fast_json import dumps
+from kv_store import MemoryKeyValueStore
+from schedule_feed import ScheduleChangeFeed
+from scrape_parsers import parse_kbo_schedule
+
+
+def sizes(payload: dict) -> tuple:
+    body = dumps(payload)
+    return len(body), len(gzip.compress(body, 6))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KBO 일정 변경 피드 벤치마크")
+    parser.add_argument("--refreshes", type=int, default=20)
+    parser.add_argument("--changes", type=int, default=2, help="갱신마다 바뀌는 경기 수")
+    args = parser.parse_args()
+
+    games, _ = parse_kbo_schedule((FIXTURES_DIR / "kbo_schedule.html").read_text(encoding="utf-8"), year=2025)
+    rng = random.Random(3)
+    feed = ScheduleChangeFeed(MemoryKeyValueStore())
+    feed.record(games)
+
+    full_bytes = full_gz = delta_bytes = delta_gz = 0
+    record_s = changes_s = 0.0
+    for _ in range(args.refreshes):
+        since = feed.version
+        games = copy.deepcopy(games)
+        for game in rng.sample(games, args.changes):
+            if rng.random() < 0.5:
+                game["time"] = game["timeText"] = f"{rng.randrange(13, 19)}:00"
+            else:
+                game["play"] = "우천취소"
+        start = time.perf_counter()
+        version = feed.record(games)
+        record_s += time.perf_counter() - start
+        start = time.perf_counter()
+        delta = feed.changes(since)
+        changes_s += time.perf_counter() - start
+
+        full = sizes({"success": True, "games": games, "count": len(games), "version": version})
+        small = sizes(delta)
+        full_bytes += full[0]
+        full_gz += full[1]
+        delta_bytes += small[0]
+        delta_gz += small[1]
+
+    n = args.refreshes
+    print(f"{len(games)} games, {args.changes} changed per refresh, {n} refreshes")
+    print(f"{'response per poll':<24} | {'bytes':>8} | {'gzip':>7}")
+    print("-" * 46)
+    print(f"{'full schedule':<24} | {full_bytes // n:>8,} | {full_gz // n:>7,}")
+    print(f"{'changes?since=':<24} | {delta_bytes // n:>8,} | {delta_gz // n:>7,}")
+    print(f"record: {record_s / n * 1e3:.2f} ms per refresh, changes: {changes_s / n * 1e3:.3f} ms per poll")
+
+
+if __name__ == "__main__":
+    main()
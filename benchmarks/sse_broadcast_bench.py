@@ -0,0 +1,224 @@
+"""
+SSE 푸시 채널 벤치마크 (연결 수천 개의 유휴 클라이언트)
+Broadcaster + /api/events와 같은 SSE 응답을 uvicorn 하위 프로세스로 띄우고,
+클라이언트 N개(기본 5000)를 연결한 뒤 다음을 측정합니다.
+
+- 연결당 서버 메모리: 연결 전후 서버 RSS 차이 / N
+- 브로드캐스트 지연: 발행 요청을 보낸 시각부터 각 클라이언트가 이벤트를 받은 시각까지 (p50 / p99 / 최대)
+- 느린 소비자: 읽지 않는 클라이언트 몇 개에 큰 이벤트를 계속 보내면 큐가 가득 차 끊기는지
+
+실행: python -m benchmarks.sse_broadcast_bench [--clients 5000] [--publishes 5] [--queue-size 16]
+"""
+
+from pathlib import Path
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+SERVER_ENV = "SSE_BENCH_SERVE"
+
+
+# ============================================
+# 서버 (하위 프로세스)
+# ============================================
+
+def serve(port: int, queue_size: int):
+    from contextlib import asynccontextmanager
+
+    from fastapi import FastAPI
+    import uvicorn
+
+    from broadcast import Broadcaster
+    from compression import CompressionMiddleware
+
+    events = Broadcaster(queue_size=queue_size)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        events.start()
+        yield
+        await events.stop()
+
+    app = FastAPI(lifespan=lifespan)
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/events")
+    async def get_events():
+        return events.response(initial=[("hello", {"ok": True})])
+
+    @app.post("/publish")
+    async def publish(size: int = 0):
+        delivered = events.publish("tick", {"sent": time.time(), "padding": "x" * size})
+        return {"delivered": delivered, "publish_ms": events.last_publish_ms}
+
+    @app.get("/stats")
+    async def stats():
+        return events.stats()
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", backlog=4096, timeout_graceful_shutdown=2)
+
+
+# ============================================
+# 클라이언트
+# ============================================
+
+def rss_kb(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+async def request(port: int, method: str, path: str) -> dict:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: bench\r\nContent-Length: 0\r\nConnection: close\r\n\r\n".encode())
+    data = await reader.read()
+    writer.close()
+    return json.loads(data.split(b"\r\n\r\n", 1)[1])
+
+
+class Client:
+    def __init__(self):
+        self.received = []
+        self.reader = None
+        self.writer = None
+
+    async def connect(self, port: int):
+        # 64 KB 이벤트도 한 번에 읽도록 StreamReader 한도를 늘림
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", port, limit=1 << 20)
+        self.writer.write(b"GET /events HTTP/1.1\r\nHost: bench\r\nAccept: text/event-stream\r\n"
+                          b"Accept-Encoding: gzip, br\r\n\r\n")
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        assert b"content-encoding: identity" in head.lower(), head
+        while b"event: hello" not in await self.reader.readuntil(b"\n\n"):
+            pass
+
+    async def listen(self):
+        try:
+            while True:
+                chunk = await self.reader.readuntil(b"\n\n")
+                if b"event: tick" in chunk:
+                    self.received.append(time.perf_counter())
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_ready(port: int):
+    for _ in range(100):
+        try:
+            await request(port, "GET", "/stats")
+            return
+        except (OSError, ValueError, IndexError):
+            await asyncio.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+
+async def run(args):
+    port = free_port()
+    env = {**os.environ, SERVER_ENV: f"{port}:{args.queue_size}",
+           "PYTHONPATH": str(Path(__file__).resolve().parent.parent)}
+    server = subprocess.Popen([sys.executable, "-m", "benchmarks.sse_broadcast_bench"], env=env)
+    try:
+        await wait_ready(port)
+        warm = [Client() for _ in range(50)]  # 코드 경로 워밍업 후 기준 RSS 측정
+        await asyncio.gather(*(c.connect(port) for c in warm))
+        for c in warm:
+            c.writer.close()
+        await asyncio.sleep(0.5)
+        base_rss = rss_kb(server.pid)
+
+        clients = [Client() for _ in range(args.clients)]
+        start = time.perf_counter()
+        for i in range(0, len(clients), 250):
+            await asyncio.gather(*(c.connect(port) for c in clients[i:i + 250]))
+        connect_s = time.perf_counter() - start
+        await asyncio.sleep(1.0)
+        rss = rss_kb(server.pid)
+        listeners = [asyncio.create_task(c.listen()) for c in clients]
+
+        print(f"{args.clients} SSE clients connected in {connect_s:.1f}s (queue size {args.queue_size})")
+        print(f"server RSS: {base_rss / 1024:.1f} MB → {rss / 1024:.1f} MB "
+              f"({(rss - base_rss) / args.clients:.1f} KB per connection)")
+        print(f"{'publish':<8} | {'delivered':>9} | {'fan-out (ms)':>12} | {'p50 (ms)':>8} | {'p99 (ms)':>8} | {'max (ms)':>8}")
+        print("-" * 70)
+        for n in range(1, args.publishes + 1):
+            before = [len(c.received) for c in clients]
+            sent = time.perf_counter()
+            result = await request(port, "POST", "/publish")
+            while any(len(c.received) == b for c, b in zip(clients, before)):
+                await asyncio.sleep(0.005)
+                if time.perf_counter() - sent > 30:
+                    break
+            latencies = sorted((c.received[-1] - sent) * 1e3 for c, b in zip(clients, before) if len(c.received) > b)
+            p99 = latencies[int(len(latencies) * 0.99) - 1]
+            print(f"{n:<8} | {result['delivered']:>9} | {result['publish_ms']:>12.2f} | "
+                  f"{statistics.median(latencies):>8.1f} | {p99:>8.1f} | {latencies[-1]:>8.1f}")
+            await asyncio.sleep(0.5)
+
+        # 느린 소비자: 소켓을 읽지 않는 클라이언트 → 커널 / 전송 버퍼와 큐가 가득 차면 서버가 끊음
+        # (큰 이벤트를 많이 보내므로 정상 클라이언트는 20개만 남김)
+        keep = args.slow + 20
+        for listener in listeners[keep:]:
+            listener.cancel()
+        for c in clients[keep:]:
+            c.writer.close()
+        await asyncio.sleep(1.0)
+        stats = await request(port, "GET", "/stats")
+        print(f"after {args.clients - keep} clients disconnected: {stats['subscribers']} subscribers left")
+        for listener in listeners[:args.slow]:
+            listener.cancel()
+        for c in clients[:args.slow]:
+            c.writer.transport.pause_reading()
+        before = [len(c.received) for c in clients[args.slow:keep]]
+        for _ in range(args.slow_events):
+            await request(port, "POST", f"/publish?size={64 * 1024}")
+            await asyncio.sleep(0.02)  # 초당 약 50개 (읽는 클라이언트는 따라올 수 있는 속도)
+        await asyncio.sleep(1.0)
+        stats = await request(port, "GET", "/stats")
+        healthy = sum(1 for c, b in zip(clients[args.slow:keep], before) if len(c.received) - b == args.slow_events)
+        print(f"slow consumers: {stats['dropped']} of {args.slow} dropped after {args.slow_events} x 64 KB events; "
+              f"{healthy} of {keep - args.slow} reading clients received every event")
+
+        for listener in listeners[args.slow:keep]:
+            listener.cancel()
+        for c in clients[:keep]:
+            c.writer.close()
+        await asyncio.sleep(1.0)
+    finally:
+        server.terminate()
+        try:
+            server.wait(10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SSE 푸시 채널 벤치마크")
+    parser.add_argument("--clients", type=int, default=5000)
+    parser.add_argument("--publishes", type=int, default=5)
+    parser.add_argument("--queue-size", type=int, default=16)
+    parser.add_argument("--slow", type=int, default=20, help="읽지 않는 느린 클라이언트 수")
+    parser.add_argument("--slow-events", type=int, default=200, help="느린 소비자 확인에 보낼 64 KB 이벤트 수")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    if os.getenv(SERVER_ENV):
+        port, queue_size = os.environ[SERVER_ENV].split(":")
+        serve(int(port), int(queue_size))
+    else:
+        main()
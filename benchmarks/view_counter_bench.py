@@ -0,0 +1,100 @@
+"""
+조회수 쓰기 경로 벤치마크
+SQLite 파일 DB 위에서 요청마다 커밋하는 기존 방식(query → += 1 → commit → refresh)과
+ViewCounter 쓰기 지연 방식(조회 + 메모리 증가, 주기적 executemany 배치 UPDATE)의
+초당 처리량을 비교하고, 마지막에 두 방식의 최종 조회수 합계가 같은지 확인합니다.
+
+실행: python -m benchmarks.view_counter_bench [--ops 20000] [--articles 1000] [--interval 0.2]
+"""
+
+from pathlib import Path
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+
+from view_counter import ViewCounter
+
+
+def make_db(path: Path, articles: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, isolation_level=None)  # 트랜잭션은 직접 BEGIN/COMMIT
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE articles (id INTEGER PRIMARY KEY, title TEXT, views INTEGER NOT NULL DEFAULT 0)")
+    conn.execute("BEGIN")
+    conn.executemany("INSERT INTO articles (id, title) VALUES (?, ?)", [(i, f"기사 {i}") for i in range(1, articles + 1)])
+    conn.execute("COMMIT")
+    return conn
+
+
+def workload(ops: int, articles: int):
+    # 인기 기사에 조회가 몰리는 분포 (파레토)
+    rng = random.Random(42)
+    return [min(articles, int(rng.paretovariate(1.2))) for _ in range(ops)]
+
+
+def per_request_commit(conn: sqlite3.Connection, ids) -> float:
+    start = time.perf_counter()
+    for article_id in ids:
+        conn.execute("BEGIN")
+        views = conn.execute("SELECT views FROM articles WHERE id = ?", (article_id,)).fetchone()[0]
+        conn.execute("UPDATE articles SET views = ? WHERE id = ?", (views + 1, article_id))
+        conn.execute("COMMIT")
+        conn.execute("SELECT views FROM articles WHERE id = ?", (article_id,)).fetchone()  # refresh
+    return time.perf_counter() - start
+
+
+def write_behind(conn: sqlite3.Connection, ids, interval: float, shards: int) -> tuple:
+    def sink(deltas):
+        conn.execute("BEGIN")
+        conn.executemany("UPDATE articles SET views = views + ? WHERE id = ?", [(d, k) for k, d in deltas.items()])
+        conn.execute("COMMIT")
+
+    counter = ViewCounter(sink, shards=shards, interval=interval)
+    start = time.perf_counter()
+    next_flush = start + interval
+    for article_id in ids:
+        views = conn.execute("SELECT views FROM articles WHERE id = ?", (article_id,)).fetchone()[0]
+        views + counter.incr(article_id)  # 응답 값 = 저장된 값 + 미반영 증가분
+        now = time.perf_counter()
+        if now >= next_flush:  # 백그라운드 루프 대신 같은 스레드에서 주기 flush
+            counter.flush()
+            next_flush = now + interval
+    counter.flush()  # 종료 시 반영
+    return time.perf_counter() - start, counter.stats()
+
+
+def total_views(conn: sqlite3.Connection) -> int:
+    return conn.execute("SELECT SUM(views) FROM articles").fetchone()[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="조회수 쓰기 경로 벤치마크")
+    parser.add_argument("--ops", type=int, default=20_000)
+    parser.add_argument("--articles", type=int, default=1_000)
+    parser.add_argument("--interval", type=float, default=0.2, help="배치 flush 주기(초)")
+    parser.add_argument("--shards", type=int, default=16)
+    args = parser.parse_args()
+
+    ids = workload(args.ops, args.articles)
+    with tempfile.TemporaryDirectory() as tmp:
+        direct_db = make_db(Path(tmp) / "direct.db", args.articles)
+        batched_db = make_db(Path(tmp) / "batched.db", args.articles)
+
+        direct = per_request_commit(direct_db, ids)
+        batched, stats = write_behind(batched_db, ids, args.interval, args.shards)
+
+        print(f"{args.ops} views over {args.articles} articles (sqlite WAL)")
+        print(f"{'per-request commit':<24}{direct * 1e3:>10.0f} ms {args.ops / direct:>12,.0f} views/s")
+        print(f"{'write-behind batched':<24}{batched * 1e3:>10.0f} ms {args.ops / batched:>12,.0f} views/s"
+              f"   ({stats['flushes']} flushes, {stats['flushed_rows']} row updates)")
+        print(f"speedup x{direct / batched:.1f}")
+
+        assert total_views(direct_db) == total_views(batched_db) == args.ops, "view totals differ"
+        print("totals match:", args.ops)
+        direct_db.close()
+        batched_db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+SSE(Server-Sent Events) 푸시 채널
+백그라운드 갱신(KBO 일정 / 네이버 기사)이 새 스냅샷을 만들면 연결된 모든 클라이언트에 한 번에 보냅니다.
+
+- 이벤트는 publish 때 SSE 프레임 바이트로 한 번만 직렬화하고, 구독자마다 같은 bytes 객체를 큐에 넣습니다.
+- 구독자 큐는 queue_size개로 제한합니다. 큐가 가득 찬(읽지 못하고 밀린) 느린 클라이언트는 연결을 끊고,
+  클라이언트(EventSource)는 다시 연결해 hello 이벤트부터 새로 받습니다.
+- heartbeat초마다 주석 줄(": ping")을 전체 구독자에게 보내 프록시가 유휴 연결을 닫지 않게 합니다.
+  연결마다 타이머를 두지 않고 백그라운드 작업 하나가 발행과 같은 경로로 보냅니다 (start / stop).
+- 종료할 때(stop, 또는 서버가 받은 SIGINT / SIGTERM) 모든 구독 큐에 종료 표시를 넣어 스트림을 끝냅니다.
+  uvicorn은 열린 연결이 모두 끝나야 lifespan 종료로 넘어가므로, 시그널 시점에 닫아야 종료가 막히지 않습니다.
+- text/event-stream 응답은 압축 미들웨어가 거치지 않고 바로 보냅니다 (compression.py).
+
+이벤트 형식:
+    id: <일련번호>
+    event: <이름>
+    data: <JSON 한 줄>
+"""
+
+from typing import Any, AsyncIterator, Iterable, Optional, Set, Tuple
+import asyncio
+import itertools
+import os
+import signal
+import threading
+import time
+
+from starlette.responses import StreamingResponse
+
+from fast_json import dumps
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # nginx 등 리버스 프록시 버퍼링 끄기
+}
+PING = b": ping\n\n"
+CLOSE = b""  # 스트림 종료 표시 (큐에만 넣고 클라이언트에는 보내지 않음)
+EXIT_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+class Subscription:
+    __slots__ = ("queue", "dropped")
+
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue = asyncio.Queue(queue_size)
+        self.dropped = False
+
+
+class Broadcaster:
+    def __init__(self, queue_size: int = 16, heartbeat: float = 15.0, retry_ms: int = 3000):
+        self.queue_size = queue_size
+        self.heartbeat = heartbeat
+        self.retry_ms = retry_ms
+        self._subscribers: Set[Subscription] = set()
+        self._ids = itertools.count(1)
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self.closed = False
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.connections = 0
+        self.last_publish_ms: Optional[float] = None
+
+    @classmethod
+    def from_env(cls) -> "Broadcaster":
+        return cls(
+            queue_size=int(os.getenv("SSE_QUEUE_SIZE", 16)),
+            heartbeat=float(os.getenv("SSE_HEARTBEAT_SECONDS", 15)),
+        )
+
+    def frame(self, event: str, data: Any) -> bytes:
+        return b"id: %d\nevent: %s\ndata: %s\n\n" % (next(self._ids), event.encode(), dumps(data))
+
+    # ============================================
+    # 구독 / 발행
+    # ============================================
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self.queue_size)
+        self._subscribers.add(subscription)
+        self.connections += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscribers.discard(subscription)
+
+    def publish(self, event: str, data: Any) -> int:
+        """모든 구독자 큐에 이벤트를 넣습니다. 받은 구독자 수를 반환합니다 (큐가 가득 찬 구독자는 끊음)."""
+        start = time.perf_counter()
+        delivered = self._fan_out(self.frame(event, data))
+        self.published += 1
+        self.delivered += delivered
+        self.last_publish_ms = (time.perf_counter() - start) * 1e3
+        return delivered
+
+    def _fan_out(self, frame: bytes) -> int:
+        delivered = 0
+        for subscription in list(self._subscribers):
+            try:
+                subscription.queue.put_nowait(frame)
+                delivered += 1
+            except asyncio.QueueFull:
+                subscription.dropped = True
+                self._subscribers.discard(subscription)
+                self.dropped += 1
+        return delivered
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(self.heartbeat)
+            self._fan_out(PING)
+
+    def start(self):
+        self.closed = False
+        if self._heartbeat_task is None:
+            self._heartbeat_task = asyncio.create_task(self._heartbeat())
+            self._close_on_signals()
+
+    async def stop(self):
+        self.close()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+
+    def close(self):
+        """모든 구독 스트림을 끝냅니다 (큐가 가득 찬 구독자는 끊긴 것으로 표시)."""
+        self.closed = True
+        for subscription in list(self._subscribers):
+            subscription.dropped = True
+            try:
+                subscription.queue.put_nowait(CLOSE)
+            except asyncio.QueueFull:
+                pass  # 스트림이 쌓인 프레임을 꺼내면서 dropped를 보고 끝냄
+        self._subscribers.clear()
+
+    def _close_on_signals(self):
+        """서버(uvicorn)의 종료 시그널 핸들러 앞에 close를 끼워 넣습니다. 메인 스레드에서 서버가 핸들러를 둔 경우만."""
+        if threading.current_thread() is not threading.main_thread():
+            return
+        loop = asyncio.get_running_loop()
+        for sig in EXIT_SIGNALS:
+            previous = signal.getsignal(sig)
+            if not callable(previous):
+                continue
+
+            def handler(signum, frame, previous=previous):
+                loop.call_soon_threadsafe(self.close)
+                previous(signum, frame)
+
+            signal.signal(sig, handler)
+
+    # ============================================
+    # SSE 스트림
+    # ============================================
+
+    async def stream(self, initial: Iterable[bytes] = ()) -> AsyncIterator[bytes]:
+        """구독하고 SSE 프레임을 내보냅니다. 연결이 끊겨 제너레이터가 닫히면 구독을 해제합니다."""
+        subscription = self.subscribe()
+        try:
+            yield b"retry: %d\n\n" % self.retry_ms
+            for frame in initial:
+                yield frame
+            queue = subscription.queue
+            while not self.closed:
+                frame = await queue.get()
+                if frame is CLOSE or subscription.dropped:
+                    break  # 밀린 이벤트는 버리고 종료 → 클라이언트가 다시 연결 (서버 종료 시에는 다른 워커로)
+                yield frame
+        finally:
+            self.unsubscribe(subscription)
+
+    def response(self, initial: Iterable[Tuple[str, Any]] = ()) -> StreamingResponse:
+        """SSE 응답. initial의 (이벤트, 데이터)를 먼저 보냅니다."""
+        frames = [self.frame(event, data) for event, data in initial]
+        return StreamingResponse(
+            self.stream(frames),
+            media_type="text/event-stream",
+            headers=SSE_HEADERS,
+        )
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self._subscribers),
+            "connections": self.connections,
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "last_publish_ms": round(self.last_publish_ms, 3) if self.last_publish_ms is not None else None,
+        }
@@ -0,0 +1,203 @@
+"""
+Playwright 브라우저 풀
+앱 lifespan 동안 Chromium을 띄워 두고 재사용합니다.
+
+- 브라우저 컨텍스트는 유휴 풀에서 꺼내 쓰고 반납합니다.
+- 동시에 열 수 있는 페이지 수를 세마포어로 제한하여 트래픽 급증 시에도
+  Chromium이 무한정 늘어나지 않습니다.
+- 연결이 끊긴(크래시) 브라우저나 일정 횟수 이상 사용한 브라우저는 새로 띄웁니다.
+  새 대여는 바로 새 브라우저로 가고, 이전 브라우저는 이미 빌려 간 페이지가 모두 반납된 뒤에 닫습니다.
+
+환경 변수:
+- BROWSER_POOL_SIZE: 띄워 둘 브라우저 수 (기본 1)
+- BROWSER_MAX_PAGES: 동시에 렌더링할 최대 페이지 수 (기본 2)
+- BROWSER_MAX_USES: 브라우저 재시작 전 최대 사용 횟수 (기본 200)
+"""
+
+from contextlib import asynccontextmanager
+from typing import List, Optional, Set
+import asyncio
+import os
+
+# Playwright는 선택적 의존성 (설치되어 있으면 사용)
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+VIEWPORT = {'width': 1920, 'height': 1080}
+
+
+class BrowserPoolBusy(Exception):
+    """대기 시간 안에 페이지 슬롯을 얻지 못했을 때 발생합니다."""
+
+
+class _PooledBrowser:
+    def __init__(self, browser):
+        self.browser = browser
+        self.uses = 0
+        self.in_flight = 0      # 빌려 가서 아직 반납하지 않은 페이지 수
+        self.retired = False    # 교체됨: 새로 빌려 주지 않고, in_flight가 0이 되면 닫음
+        self.idle_contexts: List = []
+
+    @property
+    def healthy(self) -> bool:
+        return self.browser.is_connected()
+
+
+class BrowserPool:
+    def __init__(self, size: int = 1, max_pages: int = 2, max_uses: int = 200, acquire_timeout: float = 10.0):
+        self.size = size
+        self.max_pages = max_pages
+        self.max_uses = max_uses
+        self.acquire_timeout = acquire_timeout
+        self._playwright = None
+        self._browsers: List[Optional[_PooledBrowser]] = []
+        self._retiring: Set[_PooledBrowser] = set()  # 교체됐지만 렌더링 중인 페이지가 남은 브라우저
+        self._slots = asyncio.Semaphore(max_pages)
+        self._launch_lock = asyncio.Lock()
+        self._next = 0
+        self.launches = 0
+        self.recycled = 0
+
+    @classmethod
+    def from_env(cls) -> "BrowserPool":
+        return cls(
+            size=int(os.getenv("BROWSER_POOL_SIZE", 1)),
+            max_pages=int(os.getenv("BROWSER_MAX_PAGES", 2)),
+            max_uses=int(os.getenv("BROWSER_MAX_USES", 200)),
+        )
+
+    @property
+    def available(self) -> bool:
+        return self._playwright is not None
+
+    # ============================================
+    # 수명 관리
+    # ============================================
+
+    async def start(self):
+        if not PLAYWRIGHT_AVAILABLE or self._playwright is not None:
+            return
+        self._playwright = await async_playwright().start()
+        self._browsers = [None] * self.size
+        for i in range(self.size):
+            try:
+                self._browsers[i] = await self._launch()
+            except Exception:
+                # 실행 실패 시 첫 사용 때 다시 시도
+                self._browsers[i] = None
+
+    async def stop(self):
+        for pooled in [*self._browsers, *self._retiring]:
+            if pooled is not None:
+                await self._close(pooled)
+        self._browsers = []
+        self._retiring.clear()
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _launch(self) -> _PooledBrowser:
+        browser = await self._playwright.chromium.launch(headless=True)
+        self.launches += 1
+        return _PooledBrowser(browser)
+
+    async def _close(self, pooled: _PooledBrowser):
+        try:
+            await pooled.browser.close()
+        except Exception:
+            pass
+
+    async def _browser(self) -> _PooledBrowser:
+        """
+        라운드 로빈으로 브라우저를 고르고 페이지 하나를 빌려 준 것으로 셉니다 (반납은 _release).
+        죽었거나 수명이 다 된 브라우저는 새로 띄운 것으로 바꾸고, 이전 것은 빌려 간 페이지가 없을 때만 바로 닫습니다.
+        """
+        async with self._launch_lock:
+            i = self._next % self.size
+            self._next += 1
+            pooled = self._browsers[i]
+            if pooled is None or not pooled.healthy or pooled.uses >= self.max_uses:
+                if pooled is not None:
+                    self.recycled += 1
+                    pooled.retired = True
+                    if pooled.in_flight:
+                        self._retiring.add(pooled)
+                    else:
+                        await self._close(pooled)
+                pooled = self._browsers[i] = await self._launch()
+            pooled.uses += 1
+            pooled.in_flight += 1
+            return pooled
+
+    async def _release(self, pooled: _PooledBrowser):
+        pooled.in_flight -= 1
+        if pooled.retired and pooled.in_flight == 0 and pooled in self._retiring:
+            self._retiring.discard(pooled)
+            await self._close(pooled)
+
+    # ============================================
+    # 페이지 대여
+    # ============================================
+
+    @asynccontextmanager
+    async def page(self):
+        """풀에서 컨텍스트를 빌려 새 페이지를 엽니다. 사용 후 컨텍스트는 풀로 반납됩니다."""
+        if not self.available:
+            raise RuntimeError("Playwright browser pool is not running")
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.acquire_timeout)
+        except asyncio.TimeoutError:
+            raise BrowserPoolBusy()
+        try:
+            pooled = await self._browser()
+            try:
+                context = pooled.idle_contexts.pop() if pooled.idle_contexts else \
+                    await pooled.browser.new_context(user_agent=USER_AGENT, viewport=VIEWPORT)
+                page = await context.new_page()
+                reusable = True
+                try:
+                    yield page
+                except Exception:
+                    reusable = False
+                    raise
+                finally:
+                    try:
+                        await page.close()
+                    except Exception:
+                        reusable = False
+                    if reusable and not pooled.retired and pooled.healthy and len(pooled.idle_contexts) < self.max_pages:
+                        pooled.idle_contexts.append(context)
+                    else:
+                        try:
+                            await context.close()
+                        except Exception:
+                            pass
+            finally:
+                await self._release(pooled)
+        finally:
+            self._slots.release()
+
+    async def render(self, url: str, wait_selector: Optional[str] = None, timeout: int = 30000) -> str:
+        """URL을 렌더링한 뒤 HTML을 반환합니다."""
+        async with self.page() as page:
+            await page.goto(url, wait_until='networkidle', timeout=timeout)
+            if wait_selector:
+                try:
+                    await page.wait_for_selector(wait_selector, timeout=5000)
+                except Exception:
+                    pass
+            return await page.content()
+
+    def stats(self) -> dict:
+        return {
+            "available": self.available,
+            "browsers": sum(1 for b in self._browsers if b is not None and b.healthy),
+            "max_pages": self.max_pages,
+            "launches": self.launches,
+            "recycled": self.recycled,
+            "retiring": len(self._retiring),
+        }
@@ -0,0 +1,165 @@
+"""
+응답 압축 미들웨어 (brotli / gzip)
+Accept-Encoding에 br이 있고 brotli 패키지가 있으면 brotli, 아니면 gzip으로 압축합니다.
+
+- minimum_size 미만의 작은 응답과 304 같은 빈 응답은 압축하지 않음
+- 이미 Content-Encoding이 있는 응답은 건드리지 않음
+- 스트리밍 응답(text/event-stream, 또는 Content-Length 없이 시작하는 응답)은 압축기를 거치지 않고 그대로 보냄
+  (압축기가 청크를 모아 두면 SSE 이벤트가 바로 나가지 않음)
+- gzip 압축 수준은 기본 6 (Starlette 기본 9는 CPU 대비 이득이 작음)
+- 압축한 응답의 강한 ETag에는 코딩 접미사("...-gzip")를 붙여 표현마다 검증자가 다르게 함 (RFC 9110 8.8.3).
+  304 응답은 압축하지 않으므로 If-None-Match에 있던 (접미사 붙은) 태그를 그대로 돌려줌
+"""
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from http_cache import CONTENT_CODINGS, coded_etag, strip_coding
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+
+def _accepts(accept_encoding: str, coding: str) -> bool:
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        if name.strip() == coding:
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            request_headers = Headers(scope=scope)
+            accept_encoding = request_headers.get("Accept-Encoding", "")
+            send = _coded_etag_sender(send, request_headers.get("If-None-Match"))
+            app = _bypass_streams(self.app, send)
+            if BROTLI_AVAILABLE and _accepts(accept_encoding, "br"):
+                await BrotliResponder(app, self.minimum_size, self.brotli_quality)(scope, receive, send)
+                return
+            if _accepts(accept_encoding, "gzip"):
+                await GZipResponder(app, self.minimum_size, compresslevel=self.gzip_level)(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+def _is_stream(message: Message) -> bool:
+    headers = Headers(raw=message["headers"])
+    if headers.get("Content-Type", "").startswith("text/event-stream"):
+        return True
+    # 본문 없는 응답(304 / 204 / HEAD)은 Content-Length가 없어도 스트림이 아님
+    return "content-length" not in headers and message["status"] not in (204, 304)
+
+
+def _bypass_streams(app: ASGIApp, send: Send) -> ASGIApp:
+    """스트리밍 응답이면 압축기 대신 send로 바로 보내는 app"""
+
+    async def app_with_bypass(scope: Scope, receive: Receive, compressor_send: Send):
+        target = compressor_send
+
+        async def route(message: Message):
+            nonlocal target
+            if message["type"] == "http.response.start" and _is_stream(message):
+                target = send
+            await target(message)
+
+        await app(scope, receive, route)
+
+    return app_with_bypass
+
+
+def _coded_etag_sender(send: Send, if_none_match: str = None) -> Send:
+    """응답 시작 메시지의 강한 ETag를 실제로 보내는 content-coding에 맞게 바꿔 보냄"""
+
+    async def send_with_coded_etag(message: Message):
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(raw=message["headers"])
+            etag = headers.get("ETag")
+            if etag and not etag.startswith("W/"):
+                coding = headers.get("Content-Encoding")
+                if coding in CONTENT_CODINGS:
+                    headers["ETag"] = coded_etag(etag, coding)
+                elif message["status"] == 304 and if_none_match:
+                    for tag in if_none_match.split(","):
+                        if strip_coding(tag.strip()) == etag:
+                            headers["ETag"] = tag.strip()
+                            break
+        await send(message)
+
+    return send_with_coded_etag
+
+
+class BrotliResponder:
+    """starlette GZipResponder와 같은 흐름의 brotli 버전"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compressor = brotli.Compressor(quality=quality)
+        self.send: Send = None
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        self.send = send
+        await self.app(scope, receive, self.send_with_brotli)
+
+    def _encode_headers(self, streaming: bool):
+        headers = MutableHeaders(raw=self.initial_message["headers"])
+        headers["Content-Encoding"] = "br"
+        headers.add_vary_header("Accept-Encoding")
+        if streaming:
+            del headers["Content-Length"]
+        return headers
+
+    async def send_with_brotli(self, message: Message):
+        if message["type"] == "http.response.start":
+            # 헤더는 첫 본문을 보고 압축 여부를 정한 뒤에 보냄
+            self.initial_message = message
+            self.passthrough = "content-encoding" in Headers(raw=message["headers"])
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not self.started:
+            self.started = True
+            if self.passthrough or (len(body) < self.minimum_size and not more_body):
+                self.passthrough = True
+                await self.send(self.initial_message)
+                await self.send(message)
+                return
+            if not more_body:
+                message["body"] = self.compressor.process(body) + self.compressor.finish()
+                self._encode_headers(streaming=False)["Content-Length"] = str(len(message["body"]))
+            else:
+                self._encode_headers(streaming=True)
+                message["body"] = self.compressor.process(body) + self.compressor.flush()
+            await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        if not self.passthrough:
+            chunk = self.compressor.process(body)
+            message["body"] = chunk + (self.compressor.flush() if more_body else self.compressor.finish())
+        await self.send(message)
@@ -0,0 +1,228 @@
+"""
+스크래퍼 추출 규칙 모음
+사이트별 선택자 / 정규식 / URL 정규화 규칙을 한곳에 선언하고 import 시점에 한 번만 컴파일합니다.
+(행·앵커마다 re.compile 하던 비용 제거)
+
+각 규칙 세트는 규칙 이름별 적중 횟수를 세므로, 큰 debug 덤프 없이도
+/api/metrics에서 어떤 대체(fallback) 전략이 실제로 쓰이는지 확인할 수 있습니다.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Pattern, Sequence, Tuple, Union
+import re
+import threading
+
+from html_parsing import Subtree
+
+
+@dataclass(frozen=True)
+class FindRule:
+    """
+    기존(문서 전체) 경로에서 쓰는 BeautifulSoup find 규칙.
+    tag는 태그 이름 또는 목록, id / class_는 문자열 또는 미리 컴파일된 정규식입니다.
+    """
+    name: str
+    tag: Union[str, Sequence[str], None] = None
+    id: Union[str, Pattern, None] = None
+    class_: Union[str, Pattern, None] = None
+    _kwargs: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        kwargs = {}
+        if self.id is not None:
+            kwargs["id"] = self.id
+        if self.class_ is not None:
+            kwargs["class_"] = self.class_
+        object.__setattr__(self, "_kwargs", kwargs)
+
+    def find(self, soup):
+        return soup.find(self.tag, **self._kwargs)
+
+    def find_all(self, soup) -> list:
+        return soup.find_all(self.tag, **self._kwargs)
+
+
+class SiteRules:
+    """한 사이트의 추출 규칙과 규칙별 적중 카운터"""
+
+    def __init__(
+        self,
+        site: str,
+        base_url: str,
+        subtrees: Sequence[Subtree] = (),
+        selectors: Optional[Dict[str, str]] = None,
+        patterns: Optional[Dict[str, Pattern]] = None,
+        containers: Sequence[FindRule] = (),
+        items: Sequence[FindRule] = (),
+    ):
+        self.site = site
+        self.base_url = base_url.rstrip("/")
+        self.subtrees = tuple(subtrees)
+        self.selectors = dict(selectors or {})
+        self.patterns = dict(patterns or {})
+        self.containers = tuple(containers)
+        self.items = tuple(items)
+        self._hits: Counter = Counter()
+        self._lock = threading.Lock()
+
+    # ============================================
+    # URL 정규화
+    # ============================================
+
+    def absolute_url(self, href: str) -> str:
+        """프로토콜 상대("//...") / 루트 상대("/...") 경로를 절대 URL로 바꿉니다."""
+        if not href or href.startswith("http"):
+            return href
+        if href.startswith("//"):
+            return "https:" + href
+        if href.startswith("/"):
+            return self.base_url + href
+        return href
+
+    # ============================================
+    # 적중 카운터
+    # ============================================
+
+    def hit(self, rule: str, amount: int = 1):
+        with self._lock:
+            self._hits[rule] += amount
+
+    def record(self, counts: Counter):
+        """한 번의 파싱에서 모은 적중 횟수를 한꺼번에 반영합니다 (행마다 잠그지 않도록)."""
+        with self._lock:
+            self._hits.update(counts)
+
+    def match_subtree(self, node) -> Optional[Subtree]:
+        """빠른 경로가 돌려준 노드가 어떤 Subtree 규칙에 해당하는지 찾아 적중으로 기록합니다."""
+        attrs = {"id": node.attr("id"), "class": node.attr("class")}
+        for target in self.subtrees:
+            if target.matches(node.tag, attrs):
+                self.hit(f"subtree:{target.css}")
+                return target
+        return None
+
+    def find_all_first(self, soup) -> list:
+        """containers 규칙을 순서대로 시도해 결과가 있는 첫 규칙의 find_all 결과를 반환합니다."""
+        for rule in self.containers:
+            found = rule.find_all(soup)
+            if found:
+                self.hit(f"container:{rule.name}")
+                return found
+        self.hit("container:none")
+        return []
+
+    def find_container(self, soup) -> Tuple[Optional[FindRule], object]:
+        """containers 규칙을 순서대로 시도해 처음 찾은 (규칙, 요소)를 반환합니다."""
+        for rule in self.containers:
+            el = rule.find(soup)
+            if el is not None:
+                self.hit(f"container:{rule.name}")
+                return rule, el
+        self.hit("container:none")
+        return None, None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._hits)
+
+    def reset(self):
+        with self._lock:
+            self._hits.clear()
+
+
+# ============================================
+# KBO 일정 (koreabaseball.com)
+# ============================================
+
+KBO_SCHEDULE = SiteRules(
+    site="kbo_schedule",
+    base_url="https://www.koreabaseball.com",
+    subtrees=(
+        Subtree("table", id="scheduleTable"),
+        Subtree("table", id="tblScheduleList"),
+    ),
+    selectors={
+        "row": "tr",
+        "cell": "td, th",
+    },
+    patterns={
+        # "01.27(월)" 또는 "2025.01.27"
+        "date": re.compile(r'(\d{2,4})\.(\d{2})\.?(\d{2})?'),
+        "teams": re.compile(r'([가-힣A-Z\s]+)\s*(?:vs|VS|대)\s*([가-힣A-Z\s]+)'),
+        # div/li 구조일 때 행 안의 필드
+        "date_field": re.compile("date", re.I),
+        "time_field": re.compile("time", re.I),
+        "game_field": re.compile("game|match|vs", re.I),
+        "stadium_field": re.compile("stadium|venue", re.I),
+    },
+    # 기존 경로에서 일정 컨테이너를 찾는 순서 (페이지 구조 변경 대비)
+    containers=(
+        FindRule("table#scheduleTable", "table", id="scheduleTable"),
+        FindRule("table.schedule", "table", class_=re.compile("schedule", re.I)),
+        FindRule("div.schedule", "div", class_=re.compile("schedule", re.I)),
+        FindRule("div#schedule", "div", id=re.compile("schedule", re.I)),
+        FindRule("table", "table"),
+        FindRule("tbody", "tbody"),
+        FindRule("ul.schedule", "ul", class_=re.compile("schedule|game|match", re.I)),
+    ),
+    # 컨테이너가 div/ul일 때 경기 항목
+    items=(
+        FindRule("game_item", ["div", "li"], class_=re.compile("game|match|schedule", re.I)),
+    ),
+)
+
+# ============================================
+# 네이버 스포츠 야구 뉴스
+# ============================================
+
+NAVER_NEWS = SiteRules(
+    site="naver_news",
+    base_url="https://m.sports.naver.com",
+    subtrees=(
+        Subtree("ul", class_="news_list"),
+        Subtree("div", class_="news_list"),
+    ),
+    selectors={
+        "link": "a[href]",
+        "title": '[class*="title"], [class*="headline"], [class*="tit"], [class*="text"], [class*="subject"]',
+        "image": "img",
+        "date": '[class*="date"], [class*="time"], [class*="info"]',
+    },
+    patterns={
+        # 네이버 스포츠 기사 URL
+        "article_link": re.compile(r"sports\.news|news\.naver|/kbaseball/news/|sports\.naver\.com/news"),
+        "item_link": re.compile(r"sports\.news|news\.naver"),
+        "title_class": re.compile("title|headline|tit|text|subject", re.I),
+        "item_title_class": re.compile("title|headline|tit|subject", re.I),
+        "date_class": re.compile("date|time|info|date_time", re.I),
+    },
+    items=(
+        FindRule("news_item", class_=re.compile("news_item|article_item|list_item|news_list", re.I)),
+    ),
+)
+
+# 네이버 스포츠 야구 홈 (naver_sports_scraper 라우터, 기사 카드 구조)
+NAVER_INDEX = SiteRules(
+    site="naver_index",
+    base_url="https://m.sports.naver.com",
+    patterns={
+        "title_class": re.compile("title|headline", re.I),
+        "date_class": re.compile("date|time|ago", re.I),
+    },
+    # 기사 카드를 찾는 순서
+    containers=(
+        FindRule("a.news", "a", class_=re.compile("news|article|item", re.I)),
+        FindRule("div.news", "div", class_=re.compile("news|article", re.I)),
+    ),
+)
+
+# 이미지 지연 로딩 속성 (앞쪽이 우선)
+IMAGE_ATTRS = ("src", "data-src", "data-lazy-src")
+
+RULE_SETS = (KBO_SCHEDULE, NAVER_NEWS, NAVER_INDEX)
+
+
+def stats() -> dict:
+    """사이트별 규칙 적중 횟수 (/api/metrics 용)"""
+    return {rules.site: rules.stats() for rules in RULE_SETS}
@@ -0,0 +1,41 @@
+"""
+빠른 JSON 응답
+이미 검증된(저장소 / 스크래퍼가 만든) dict를 응답 모델 재검증과 jsonable_encoder 없이 바로 직렬화합니다.
+
+- orjson이 있으면 사용 (datetime 등도 C 구현으로 직렬화), 없으면 표준 json
+- 라우트별로 켭니다: response_class=FastJSONResponse로 지정하고 FastJSONResponse(...)를 반환하면
+  FastAPI는 response_model 검증을 건너뜁니다 (response_model은 OpenAPI 문서용으로 유지).
+
+사용 예:
+    @app.get("/api/items", response_model=ItemPage, response_class=FastJSONResponse)
+    async def items():
+        return FastJSONResponse({"items": store.all()})
+"""
+
+from typing import Any
+import json
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(content: Any) -> bytes:
+    """JSON 바이트로 직렬화합니다. orjson이 모르는 타입만 jsonable_encoder로 변환합니다."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, default=jsonable_encoder)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=jsonable_encoder,
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """검증된 데이터를 그대로 직렬화하는 JSONResponse (본문 형식은 JSONResponse와 같음)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,167 @@
+"""
+경기 이벤트 분석 (승리 확률 / 레버리지 / RE24)
+game_data의 plays 열 단위 테이블을 NumPy 배열로 한 번 복사해 두고,
+행마다 도는 Python 루프 대신 열 전체에 대한 벡터 연산으로 집계합니다.
+
+- 결정적 장면: |WPa|(승리 확률 변화) 상위 N개 (argpartition)
+- 선수별 누적 WPA: 타자는 +WPa, 투수는 -WPa (bincount)
+- RE24: 플레이마다 REa - REs + 득점, 타자별 합계
+
+plays 테이블이 바뀌면(version 증가) 다음 요청에서 배열을 다시 만듭니다.
+NumPy가 없으면 NUMPY_AVAILABLE = False이며 분석 API는 503을 반환합니다.
+"""
+
+from typing import Dict, List, Optional
+
+from game_data import MISSING, GameDataStore, typecode
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+def _num(value, digits: int = 4) -> Optional[float]:
+    """JSON 응답용 float (NaN은 None)"""
+    value = float(value)
+    return None if value != value else round(value, digits)
+
+
+class PlayFrame:
+    """plays 테이블의 NumPy 스냅샷과 경기별 행 위치"""
+
+    def __init__(self, store: GameDataStore):
+        table = store.plays
+        self.version = table.version
+        self.categories = {col: list(values) for col, values in table.categories.items()}
+        self.results = list(table["result"])
+        self.columns: Dict[str, "np.ndarray"] = {}
+        for col, kind in table.schema.items():
+            if kind != "str":
+                column = table[col]
+                if not len(column):
+                    self.columns[col] = np.empty(0, dtype=typecode(column))
+                elif table.mapped:
+                    # 스냅샷 view는 바뀌지 않으므로 복사하지 않음 (워커끼리 같은 페이지를 공유)
+                    self.columns[col] = np.frombuffer(column, dtype=typecode(column))
+                else:
+                    self.columns[col] = np.frombuffer(column, dtype=typecode(column)).copy()
+
+        # 득점과 RE24는 적재 시점이 아니라 여기서 한 번에 계산
+        c = self.columns
+        before = c["before_away"] + c["before_home"]
+        after = c["after_away"] + c["after_home"]
+        known = (c["before_away"] != MISSING) & (c["after_away"] != MISSING)
+        self.runs = np.where(known, after - before, 0)
+        self.re24 = c["rea"] - c["res"] + self.runs
+
+        # 경기 인덱스로 정렬한 행 순서 → 경기 g의 행은 order[offsets[g]:offsets[g + 1]]
+        self.order = np.argsort(c["game"], kind="stable")
+        games = np.arange(len(store.game_ids) + 1, dtype=c["game"].dtype)
+        self.offsets = np.searchsorted(c["game"][self.order], games).tolist()
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def game_rows(self, game: int) -> "np.ndarray":
+        if game + 1 >= len(self.offsets):
+            return self.order[:0]
+        return self.order[self.offsets[game]:self.offsets[game + 1]]
+
+    def all_rows(self) -> "np.ndarray":
+        return self.order
+
+
+class GameAnalytics:
+    def __init__(self, store: GameDataStore):
+        self.store = store
+        self._frame: Optional[PlayFrame] = None
+        self.rebuilds = 0
+
+    def frame(self) -> PlayFrame:
+        if self._frame is None or self._frame.version != self.store.plays.version:
+            self._frame = PlayFrame(self.store)
+            self.rebuilds += 1
+        return self._frame
+
+    def game(self, game_id: str, top: int = 5) -> Optional[dict]:
+        """한 경기의 분석 결과. 경기가 없으면 None"""
+        game = self.store.game_index(game_id)
+        if game is None:
+            return None
+        frame = self.frame()
+        return {"game": game_id, **self.summarize(frame, frame.game_rows(game), top)}
+
+    def season(self, top: int = 10) -> dict:
+        """적재된 모든 경기에 대한 분석 결과"""
+        frame = self.frame()
+        return {"games": len(self.store.game_ids), **self.summarize(frame, frame.all_rows(), top)}
+
+    def summarize(self, frame: PlayFrame, rows: "np.ndarray", top: int) -> dict:
+        c = frame.columns
+        wpa = c["wpa"][rows]
+        lev = c["lev"][rows]
+        re24 = frame.re24[rows]
+        wpa0 = np.nan_to_num(wpa)
+        re0 = np.nan_to_num(re24)
+
+        return {
+            "plays": int(len(rows)),
+            "leverage": {"mean": _num(np.nanmean(lev)) if len(rows) else None,
+                         "max": _num(np.nanmax(lev)) if len(rows) else None},
+            "decisive_moments": self._decisive(frame, rows, wpa0, top),
+            "batters": self._leaders(frame, "batter", c["batter"][rows], wpa0, re0, top),
+            "pitchers": self._leaders(frame, "pitcher", c["pitcher"][rows], -wpa0, None, top),
+        }
+
+    def _decisive(self, frame: PlayFrame, rows, wpa0, top: int) -> List[dict]:
+        if not len(rows) or top <= 0:
+            return []
+        key = np.abs(wpa0)
+        if len(key) > top:
+            picked = np.argpartition(-key, top - 1)[:top]
+        else:
+            picked = np.arange(len(key))
+        picked = picked[np.argsort(-key[picked], kind="stable")]
+        c = frame.columns
+        moments = []
+        for local in picked:
+            i = rows[local]
+            moments.append({
+                "inning": int(c["inning"][i]),
+                "half": "초" if c["half"][i] == 0 else "말",
+                "pitcher": frame.categories["pitcher"][c["pitcher"][i]],
+                "batter": frame.categories["batter"][c["batter"][i]],
+                "result": frame.results[i],
+                "lev": _num(c["lev"][i]),
+                "wpe": _num(c["wpe"][i]),
+                "wpa": _num(c["wpa"][i]),
+                "re24": _num(frame.re24[i]),
+            })
+        return moments
+
+    def _leaders(self, frame: PlayFrame, role: str, codes, wpa, re24, top: int) -> List[dict]:
+        if not len(codes):
+            return []
+        size = len(frame.categories[role])
+        plays = np.bincount(codes, minlength=size)
+        totals = np.bincount(codes, weights=wpa, minlength=size)
+        present = np.flatnonzero(plays)
+        ranked = present[np.argsort(-totals[present], kind="stable")][:top]
+        re_totals = np.bincount(codes, weights=re24, minlength=size) if re24 is not None else None
+        leaders = []
+        for code in ranked:
+            entry = {"player": frame.categories[role][code], "plays": int(plays[code]), "wpa": _num(totals[code])}
+            if re_totals is not None:
+                entry["re24"] = _num(re_totals[code])
+            leaders.append(entry)
+        return leaders
+
+    def stats(self) -> dict:
+        return {
+            "numpy": NUMPY_AVAILABLE,
+            "rebuilds": self.rebuilds,
+            "rows": len(self._frame) if self._frame is not None else 0,
+        }
@@ -0,0 +1,523 @@
+"""
+경기 기록 CSV 적재 (열 단위 타입 배열)
+public/data의 경기 기록 CSV를 한 줄씩 읽어 열(column)마다 타입이 정해진 배열로 쌓습니다.
+브라우저에서 CSV를 매번 파싱하던 것을 백엔드에서 한 번만 변환해 두고 집계에 씁니다.
+
+파일 (경기 디렉터리마다 아래 파일 중 있는 것만):
+- 결장.csv: 결정적 장면 (LEV, REs, REa, WPe, WPa) → plays 테이블
+- 경기주요기록.csv: 결승타 / 홈런 / 실책 등 → highlights 테이블
+- 리뷰.csv: 구장·관중·경기시간 + 이닝별 점수 → games 정보 + linescores 테이블
+
+디렉터리 구조 (GAME_DATA_DIR, 기본 public/data):
+- GAME_DATA_DIR/<경기 ID>/결장.csv ...  경기마다 하위 디렉터리
+- GAME_DATA_DIR/결장.csv ...            바로 아래 파일은 경기 ID "default"
+
+변환 규칙:
+- UTF-8 BOM, 제목 줄("결정적 장면 best5" 등)과 여러 줄짜리 머리글 블록, 뒤쪽 빈 열은 건너뜀
+- "24.60%" → 0.246, "8,822" → 8822, "3:05"(경기시간) → 185분
+- "1사 1,3루 1:0" → 아웃 1, 주자 0b101(1·3루), 원정 1점, 홈 0점
+- 숫자로 읽을 수 없는 값("-", "00:00" 등)은 실수 열은 NaN, 정수 열은 -1 (열별 invalid 개수 기록)
+
+refresh()는 (수정 시각, 크기)가 바뀐 파일만 다시 읽으므로 새 경기 파일을 추가해도 기존 파일은 다시 읽지 않습니다.
+바이너리 스냅샷(game_snapshot)에서 불러온 테이블은 열이 mmap의 읽기 전용 view이며, 처음 쓸 때 복사합니다.
+refresh()는 파일을 stat하고 CSV를 다시 파싱하므로 이벤트 루프가 아닌 스레드풀에서 부릅니다.
+요청 핸들러는 `with store.fresh():` 안에서 읽어, 다른 스레드의 refresh가 테이블을 바꾸는 도중에 읽지 않게 합니다.
+"""
+
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import csv
+import math
+import os
+import re
+import threading
+import time
+
+NAN = float("nan")
+MISSING = -1
+DEFAULT_GAME_ID = "default"
+
+PLAYS_FILE = "결장.csv"
+HIGHLIGHTS_FILE = "경기주요기록.csv"
+LINESCORE_FILE = "리뷰.csv"
+
+# 주자 상황 비트 (1루 = 1, 2루 = 2, 3루 = 4)
+BASE_BITS = {"1": 1, "2": 2, "3": 4}
+OUTS = {"무사": 0, "1사": 1, "2사": 2}
+
+_SITUATION = re.compile(r"(무사|[12]사)\s*(?:(만루)|([123](?:,[123])*)루)?\s*(\d+)\s*:\s*(\d+)")
+_INNING = re.compile(r"(\d+)회\s*(초|말)?")
+_PITCH_COUNT = re.compile(r"(\d+)\s*\((\d+)-(\d+)\)")
+_RECORD_TEAM = re.compile(r"\((.+?)\)\s*(\d+)승\s*(\d+)패(?:\s*(\d+)무)?")
+_HIGHLIGHT_ITEM = re.compile(r"([^(]+?)\s*\(([^)]*)\)")
+
+
+# ============================================
+# 값 변환
+# ============================================
+
+def parse_float(value: str) -> float:
+    """'1.64', '24.60%', '8,822' → float. 읽을 수 없으면 NaN"""
+    text = value.strip().replace(",", "")
+    if not text:
+        return NAN
+    try:
+        if text.endswith("%"):
+            return float(text[:-1]) / 100
+        return float(text)
+    except ValueError:
+        return NAN
+
+
+def parse_int(value: str) -> int:
+    """'8,822' → 8822. 읽을 수 없으면 MISSING(-1)"""
+    text = value.strip().replace(",", "")
+    return int(text) if text.isdigit() else MISSING
+
+
+def parse_situation(value: str) -> Tuple[int, int, int, int]:
+    """'1사 1,3루 1:0' → (아웃, 주자 비트, 원정 점수, 홈 점수). 읽을 수 없으면 모두 MISSING"""
+    match = _SITUATION.search(value)
+    if match is None:
+        return MISSING, MISSING, MISSING, MISSING
+    outs, loaded, bases, away, home = match.groups()
+    if loaded:
+        runners = 7
+    else:
+        runners = sum(BASE_BITS[b] for b in bases.split(",")) if bases else 0
+    return OUTS[outs], runners, int(away), int(home)
+
+
+def parse_inning(value: str) -> Tuple[int, int]:
+    """'1회초' → (1, 0), '6회말' → (6, 1). 초/말이 없으면 반은 MISSING"""
+    match = _INNING.search(value)
+    if match is None:
+        return MISSING, MISSING
+    half = {"초": 0, "말": 1}.get(match.group(2), MISSING)
+    return int(match.group(1)), half
+
+
+def parse_pitch_count(value: str) -> Tuple[int, int, int]:
+    """'6(3-2)' → (투구 수, 볼, 스트라이크)"""
+    match = _PITCH_COUNT.search(value)
+    if match is None:
+        return MISSING, MISSING, MISSING
+    return int(match.group(1)), int(match.group(2)), int(match.group(3))
+
+
+def parse_minutes(value: str) -> int:
+    """'3:05' → 185"""
+    hours, _, minutes = value.strip().partition(":")
+    if hours.isdigit() and minutes.isdigit():
+        return int(hours) * 60 + int(minutes)
+    return MISSING
+
+
+def typecode(column) -> str:
+    """array 열 또는 스냅샷 memoryview 열의 타입 코드 ('d', 'i', 'b')"""
+    return column.format if isinstance(column, memoryview) else column.typecode
+
+
+def _label_value(cell: str) -> Tuple[str, str]:
+    """'관중 : 8,822' → ('관중', '8,822')"""
+    label, _, value = cell.partition(":")
+    return label.strip(), value.strip()
+
+
+# ============================================
+# 열 단위 테이블
+# ============================================
+
+class ColumnTable:
+    """
+    열마다 하나의 배열을 두는 테이블.
+    schema는 열 이름 → array 타입 코드('d' 실수, 'i' 정수, 'b' 작은 정수), 'str'(리스트),
+    또는 'cat'(선수 이름처럼 반복되는 문자열: 정수 코드 array('i') + categories 목록).
+    array 열은 numpy로 한 번에 복사해 벡터 연산에 쓸 수 있습니다 (version이 바뀌면 다시 복사).
+    mapped이면 열이 스냅샷 파일의 읽기 전용 view이고, 행을 추가 / 삭제하기 전에 _own()으로 복사합니다.
+    행은 경기(파일) 단위로 이어서 추가되므로 경기마다 행 구간 [시작, 끝)을 두고
+    game_rows / drop_game이 game 열 전체를 훑지 않게 합니다.
+    """
+
+    def __init__(self, name: str, schema: Dict[str, str]):
+        self.name = name
+        self.schema = dict(schema)
+        self.columns: Dict[str, object] = {col: self._empty(kind) for col, kind in self.schema.items()}
+        self.categories: Dict[str, List[str]] = {col: [] for col, kind in self.schema.items() if kind == "cat"}
+        self._codes: Dict[str, Dict[str, int]] = {col: {} for col in self.categories}
+        self.invalid: Dict[str, int] = {}
+        self._ranges: Dict[int, Tuple[int, int]] = {}  # 경기 → 행 구간 [시작, 끝)
+        self.version = 0     # 행이 추가 / 삭제될 때마다 증가
+        self.generation = 0  # 행 번호가 바뀔 때(삭제)만 증가 → 행 번호를 들고 있는 색인은 다시 만듦
+        self.mapped = False
+
+    @staticmethod
+    def _empty(kind: str):
+        if kind == "str":
+            return []
+        return array("i" if kind == "cat" else kind)
+
+    def lookup(self, column: str, value: str) -> Optional[int]:
+        """범주 열에서 값의 코드 (없으면 None)"""
+        return self._codes[column].get(value)
+
+    def code(self, column: str, value: str) -> int:
+        """범주 열의 값 → 정수 코드 (처음 보는 값이면 새 코드)"""
+        codes = self._codes[column]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.categories[column])
+            self.categories[column].append(value)
+        return code
+
+    def _own(self):
+        """스냅샷 view 열을 쓸 수 있는 array / list로 복사합니다 (mapped일 때 처음 쓰기 직전 한 번)."""
+        if not self.mapped:
+            return
+        for col, kind in self.schema.items():
+            values = self.columns[col]
+            if kind == "str":
+                self.columns[col] = list(values)
+            else:
+                owned = array(typecode(values))
+                owned.frombytes(values.cast("B"))
+                self.columns[col] = owned
+        self.mapped = False
+
+    def __len__(self) -> int:
+        return len(self.columns["game"])
+
+    def __getitem__(self, column: str):
+        return self.columns[column]
+
+    def _index_games(self):
+        """game 열에서 경기별 행 구간을 다시 만듭니다 (스냅샷 열을 붙인 뒤)."""
+        ranges: Dict[int, Tuple[int, int]] = {}
+        for i, game in enumerate(self.columns["game"]):
+            start, end = ranges.get(game, (i, i))
+            if end != i:
+                raise ValueError(f"{self.name}: rows of game {game} are not contiguous")
+            ranges[game] = (start, i + 1)
+        self._ranges = ranges
+
+    def append(self, row: dict):
+        game, n = row["game"], len(self)
+        start, end = self._ranges.get(game, (n, n))
+        if end != n:
+            raise ValueError(f"{self.name}: rows of game {game} must be appended contiguously")
+        self._own()
+        for col, kind in self.schema.items():
+            value = row[col]
+            if self._is_invalid(col, value):
+                self.invalid[col] = self.invalid.get(col, 0) + 1
+            elif kind == "cat":
+                value = self.code(col, value)
+            self.columns[col].append(value)
+        self._ranges[game] = (start, n + 1)
+        self.version += 1
+
+    def _is_invalid(self, column: str, value) -> bool:
+        kind = self.schema[column]
+        return kind == "d" and math.isnan(value) or kind in ("i", "b") and value == MISSING
+
+    def drop_game(self, game: int) -> int:
+        """한 경기의 행을 지웁니다 (파일이 바뀌어 다시 읽을 때). 지운 행의 invalid 개수도 뺍니다."""
+        span = self._ranges.pop(game, None)
+        if span is None:
+            return 0
+        start, end = span
+        for col in self.invalid:
+            values = self.columns[col]
+            self.invalid[col] -= sum(1 for i in range(start, end) if self._is_invalid(col, values[i]))
+        self.invalid = {col: count for col, count in self.invalid.items() if count}
+        self._own()
+        for col in self.schema:
+            values = self.columns[col]
+            # 새 배열로 만듦 (이전 배열의 버퍼를 보고 있는 numpy view가 있어도 안전)
+            self.columns[col] = values[:start] + values[end:]
+        removed = end - start
+        self._ranges = {g: (s - removed, e - removed) if s >= end else (s, e) for g, (s, e) in self._ranges.items()}
+        self.version += 1
+        self.generation += 1
+        return removed
+
+    def rows(self, indices: Optional[Iterable[int]] = None) -> List[dict]:
+        """행 dict 목록 (응답 / 디버깅용)"""
+        if indices is None:
+            indices = range(len(self))
+        return [{col: self.value(col, i) for col in self.schema} for i in indices]
+
+    def value(self, column: str, index: int):
+        value = self.columns[column][index]
+        if self.schema[column] == "cat":
+            return self.categories[column][value]
+        return value
+
+    def game_rows(self, game: int) -> range:
+        start, end = self._ranges.get(game, (0, 0))
+        return range(start, end)
+
+    def stats(self) -> dict:
+        return {"rows": len(self), "invalid": dict(self.invalid), "mapped": self.mapped}
+
+
+PLAYS_SCHEMA = {
+    "game": "i",
+    "inning": "b", "half": "b",
+    "pitcher": "cat", "batter": "cat", "result": "str",
+    "pitches": "i", "balls": "b", "strikes": "b",
+    "before_outs": "b", "before_bases": "b", "before_away": "i", "before_home": "i",
+    "after_outs": "b", "after_bases": "b", "after_away": "i", "after_home": "i",
+    "lev": "d", "res": "d", "rea": "d", "wpe": "d", "wpa": "d",
+}
+
+HIGHLIGHTS_SCHEMA = {
+    "game": "i",
+    "category": "cat", "player": "str", "detail": "str", "inning": "b",
+}
+
+LINE_INNINGS = 12
+LINESCORE_SCHEMA = {
+    "game": "i",
+    "result": "str", "team": "cat", "wins": "i", "losses": "i", "draws": "i",
+    **{f"inning_{n}": "b" for n in range(1, LINE_INNINGS + 1)},
+    "runs": "i", "hits": "i", "errors": "i", "walks": "i",
+}
+# 리뷰.csv 머리글 → 열 이름
+LINESCORE_HEADERS = {
+    **{f"{n}회": f"inning_{n}" for n in range(1, LINE_INNINGS + 1)},
+    "R": "runs", "H": "hits", "E": "errors", "B": "walks",
+}
+
+
+# ============================================
+# 파일별 행 변환 (한 줄씩 스트리밍)
+# ============================================
+
+def _csv_rows(path: Path) -> Iterator[List[str]]:
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        yield from csv.reader(f)
+
+
+def read_plays(path: Path, game: int) -> Iterator[dict]:
+    header = None
+    for cells in _csv_rows(path):
+        if header is None:
+            # 제목 줄 등 머리글 전의 블록은 건너뜀
+            if "LEV" in cells and "WPa" in cells:
+                header = {name: i for i, name in enumerate(cells) if name}
+            continue
+        if not cells or not cells[0].strip():
+            continue
+        cell = lambda name: cells[header[name]] if header[name] < len(cells) else ""  # noqa: E731
+        inning, half = parse_inning(cell("이닝초"))
+        pitches, balls, strikes = parse_pitch_count(cell("P"))
+        before = parse_situation(cell("이전상황"))
+        after = parse_situation(cell("이후상황"))
+        yield {
+            "game": game,
+            "inning": inning, "half": half,
+            "pitcher": cell("투수").strip(), "batter": cell("타자").strip(), "result": cell("결과").strip(),
+            "pitches": pitches, "balls": balls, "strikes": strikes,
+            "before_outs": before[0], "before_bases": before[1], "before_away": before[2], "before_home": before[3],
+            "after_outs": after[0], "after_bases": after[1], "after_away": after[2], "after_home": after[3],
+            "lev": parse_float(cell("LEV")), "res": parse_float(cell("REs")), "rea": parse_float(cell("REa")),
+            "wpe": parse_float(cell("WPe")), "wpa": parse_float(cell("WPa")),
+        }
+
+
+def read_highlights(path: Path, game: int) -> Iterator[dict]:
+    # "항목,값" 한 줄짜리 레코드이며 따옴표가 닫히지 않은 줄이 있어 csv 모듈 대신 줄 단위로 나눔
+    with open(path, encoding="utf-8-sig") as f:
+        lines = iter(f)
+        next(lines, None)  # 제목 줄
+        for line in lines:
+            category, _, value = line.rstrip("\r\n").partition(",")
+            value = value.strip().strip('"').strip()
+            if not category.strip() or not value:
+                continue
+            items = _HIGHLIGHT_ITEM.findall(value) or [(value, "")]
+            for player, detail in items:
+                inning, _ = parse_inning(detail)
+                yield {
+                    "game": game,
+                    "category": category.strip(),
+                    "player": player.strip(" ,"),
+                    "detail": detail.strip(),
+                    "inning": inning,
+                }
+
+
+def read_linescore(path: Path, game: int, info: dict) -> Iterator[dict]:
+    """이닝별 점수 행을 내보내고, 머리글 블록의 구장 / 관중 / 시간은 info에 채웁니다."""
+    header = None
+    for cells in _csv_rows(path):
+        if header is None:
+            if "팀" in cells and "R" in cells:
+                header = {name: i for i, name in enumerate(cells) if name}
+                continue
+            for cell in cells:
+                label, value = _label_value(cell)
+                if label == "구장":
+                    info["stadium"] = value
+                elif label == "관중":
+                    info["attendance"] = parse_int(value)
+                elif label == "개시":
+                    info["start"] = value
+                elif label == "종료":
+                    info["end"] = value
+                elif label == "경기시간":
+                    info["duration_minutes"] = parse_minutes(value)
+            continue
+        if len(cells) <= header["팀"] or not cells[header["팀"]].strip():
+            continue
+        team_cell = cells[header["팀"]]
+        record = _RECORD_TEAM.search(team_cell)
+        row = {
+            "game": game,
+            "result": cells[0].strip(),
+            "team": record.group(1) if record else team_cell.strip(),
+            "wins": int(record.group(2)) if record else MISSING,
+            "losses": int(record.group(3)) if record else MISSING,
+            "draws": int(record.group(4) or 0) if record else MISSING,
+        }
+        for name, col in LINESCORE_HEADERS.items():
+            index = header.get(name)
+            row[col] = parse_int(cells[index]) if index is not None and index < len(cells) else MISSING
+        yield row
+
+
+# ============================================
+# 경기 데이터 저장소
+# ============================================
+
+class GameDataStore:
+    """경기 기록 CSV를 열 단위 테이블로 적재하고, 새로 생기거나 바뀐 파일만 다시 읽습니다."""
+
+    def __init__(self, root: Path, scan_interval: float = 10.0):
+        self.root = Path(root)
+        self.scan_interval = scan_interval
+        self.plays = ColumnTable("plays", PLAYS_SCHEMA)
+        self.highlights = ColumnTable("highlights", HIGHLIGHTS_SCHEMA)
+        self.linescores = ColumnTable("linescores", LINESCORE_SCHEMA)
+        self.game_ids: List[str] = []           # 경기 인덱스 → 경기 ID
+        self._game_index: Dict[str, int] = {}
+        self.games: Dict[str, dict] = {}        # 경기 ID → 구장 / 관중 / 시간 등
+        self._files: Dict[Path, Tuple[int, int]] = {}  # 파일 → (mtime_ns, size)
+        self._scanned_at: Optional[float] = None
+        self.files_read = 0
+        self.files_skipped = 0
+        self._listeners: List[Callable[[str], None]] = []
+        self._refresh_listeners: List[Callable[[int], None]] = []
+        # refresh(적재)와 읽기를 스레드 간에 직렬화 (fresh() 안에서 refresh를 다시 부르므로 재진입 가능)
+        self.lock = threading.RLock()
+
+    @classmethod
+    def from_env(cls) -> "GameDataStore":
+        default_root = Path(__file__).parent / "public" / "data"
+        return cls(
+            Path(os.getenv("GAME_DATA_DIR", default_root)),
+            scan_interval=float(os.getenv("GAME_DATA_SCAN_INTERVAL", 10)),
+        )
+
+    def on_ingest(self, listener: Callable[[str], None]):
+        """경기 파일을 (다시) 읽은 뒤 경기 ID로 호출될 콜백을 등록합니다 (파생 집계 갱신용)."""
+        self._listeners.append(listener)
+
+    def on_refresh(self, listener: Callable[[int], None]):
+        """refresh()가 파일을 하나 이상 읽은 뒤 읽은 파일 수로 호출될 콜백을 등록합니다 (스냅샷 저장용)."""
+        self._refresh_listeners.append(listener)
+
+    def game_index(self, game_id: str) -> Optional[int]:
+        return self._game_index.get(game_id)
+
+    def _game(self, game_id: str) -> int:
+        index = self._game_index.get(game_id)
+        if index is None:
+            index = self._game_index[game_id] = len(self.game_ids)
+            self.game_ids.append(game_id)
+            self.games[game_id] = {"id": game_id}
+        return index
+
+    def _game_dirs(self) -> Iterator[Tuple[str, Path]]:
+        if not self.root.is_dir():
+            return
+        yield DEFAULT_GAME_ID, self.root
+        for entry in sorted(self.root.iterdir()):
+            if entry.is_dir():
+                yield entry.name, entry
+
+    @contextmanager
+    def fresh(self):
+        """refresh()한 뒤 잠근 채로 읽습니다 (스레드풀에서 도는 요청 핸들러용)."""
+        with self.lock:
+            self.refresh()
+            yield self
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        새로 생기거나 바뀐 CSV만 읽습니다. 읽은 파일 수를 반환합니다.
+        force가 아니면 scan_interval초 안의 재호출은 디렉터리를 다시 보지 않습니다.
+        """
+        with self.lock:
+            return self._refresh(force)
+
+    def _refresh(self, force: bool) -> int:
+        now = time.monotonic()
+        if not force and self._scanned_at is not None and now - self._scanned_at < self.scan_interval:
+            return 0
+        self._scanned_at = now
+
+        read = 0
+        changed_games = set()
+        for game_id, directory in self._game_dirs():
+            for name, table in ((PLAYS_FILE, self.plays), (HIGHLIGHTS_FILE, self.highlights), (LINESCORE_FILE, self.linescores)):
+                path = directory / name
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                version = (stat.st_mtime_ns, stat.st_size)
+                previous = self._files.get(path)
+                if previous == version:
+                    self.files_skipped += 1
+                    continue
+                game = self._game(game_id)
+                if previous is not None:
+                    table.drop_game(game)
+                self._ingest(path, table, game, game_id)
+                self._files[path] = version
+                self.files_read += 1
+                read += 1
+                changed_games.add(game_id)
+
+        for game_id in changed_games:
+            for listener in self._listeners:
+                listener(game_id)
+        if read:
+            for listener in self._refresh_listeners:
+                listener(read)
+        return read
+
+    def _ingest(self, path: Path, table: ColumnTable, game: int, game_id: str):
+        if table is self.plays:
+            rows = read_plays(path, game)
+        elif table is self.highlights:
+            rows = read_highlights(path, game)
+        else:
+            rows = read_linescore(path, game, self.games[game_id])
+        for row in rows:
+            table.append(row)
+
+    def stats(self) -> dict:
+        return {
+            "root": str(self.root),
+            "games": len(self.game_ids),
+            "files_read": self.files_read,
+            "files_skipped": self.files_skipped,
+            "plays": self.plays.stats(),
+            "highlights": self.highlights.stats(),
+            "linescores": self.linescores.stats(),
+        }
@@ -0,0 +1,395 @@
+"""
+경기 기록 바이너리 스냅샷 (mmap)
+GameDataStore의 plays / highlights / linescores 테이블을 고정 폭 열 배열 그대로 파일에 쓰고,
+다음 시작 때 CSV를 다시 파싱하는 대신 mmap으로 열어 열마다 복사 없는 memoryview로 붙입니다.
+
+- 재시작 / 새 uvicorn 워커는 파일을 매핑만 하므로 시즌 데이터도 수 ms 안에 준비됩니다.
+- 매핑된 페이지는 OS 페이지 캐시를 공유하므로 워커 수만큼 메모리가 늘지 않습니다.
+- 파일별 (mtime_ns, 크기)도 함께 저장하므로, 불러온 뒤 refresh()는 바뀐 CSV만 다시 읽습니다.
+  다시 읽은 테이블은 그때 복사본으로 바뀌며(ColumnTable._own), 읽은 뒤 스냅샷을 새로 씁니다.
+- 다시 쓰기는 요청 경로에서 하지 않습니다. refresh() 뒤 save_delay초(GAME_SNAPSHOT_SAVE_DELAY) 동안
+  모아 백그라운드 작업이 한 번 쓰며, 열 복사(capture, store.lock 안에서)와 직렬화 / 파일 쓰기 모두 스레드풀에서 합니다.
+  refresh()는 스레드풀에서 불리므로 저장 예약은 start()에서 기억한 이벤트 루프로 넘깁니다.
+  kv를 주면 리스(game_snapshot)를 잡은 워커 하나만 씁니다.
+
+파일 형식 (리틀/빅 엔디언은 머리글의 byteorder와 현재 시스템이 같아야 함):
+    0   MAGIC (8바이트)
+    8   형식 버전 (uint32)
+    12  머리글 JSON 길이 (uint32)
+    16  머리글 JSON (UTF-8): 테이블 / 열별 (offset, nbytes), 경기별 행 구간, 문자열 사전 위치, 경기 정보, 파일 버전
+    ... 데이터 영역 (8바이트 정렬). 모든 offset은 데이터 영역 시작 기준
+
+- 숫자 열('d', 'i', 'b')과 범주 코드('cat')는 array 메모리 그대로
+- 문자열 사전: uint32 offset 배열(n + 1개) + UTF-8 바이트. 선수 / 팀 이름(범주 목록)과
+  문자열 열(결과, 세부 기록 등)은 사전 번호(int32) 배열로 저장
+- 형식 버전이나 테이블 스키마가 다르면 스냅샷을 쓰지 않고 CSV를 처음부터 읽습니다.
+"""
+
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional
+import asyncio
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+
+from starlette.concurrency import run_in_threadpool
+
+from game_data import ColumnTable, GameDataStore
+from kv_store import WORKER_ID
+from storage import KeyValueStore
+
+MAGIC = b"GAMESNAP"
+FORMAT_VERSION = 1
+_PREFIX = struct.Struct("<8sII")
+ALIGN = 8
+DEFAULT_SNAPSHOT_PATH = "./data/game_data.snap"
+SAVE_LEASE = "lease:game_snapshot"
+SAVE_LEASE_TTL = 600.0
+
+
+def _padding(size: int) -> int:
+    return -size % ALIGN
+
+
+class StringDictionary:
+    """스냅샷의 문자열 사전 (offset 배열 + UTF-8 바이트, 읽을 때마다 디코딩)"""
+
+    def __init__(self, offsets: memoryview, blob: memoryview):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self) -> int:
+        return max(len(self.offsets) - 1, 0)
+
+    def __getitem__(self, index: int) -> str:
+        return str(self.blob[self.offsets[index]:self.offsets[index + 1]], "utf-8")
+
+
+class StringColumn:
+    """사전 번호 배열로 저장된 문자열 열 (읽기 전용 시퀀스)"""
+
+    def __init__(self, ids: memoryview, strings: StringDictionary):
+        self.ids = ids
+        self.strings = strings
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.strings[i] for i in self.ids[index]]
+        return self.strings[self.ids[index]]
+
+    def __iter__(self):
+        strings = self.strings
+        return (strings[i] for i in self.ids)
+
+
+class _Writer:
+    """데이터 영역 구성 (8바이트 정렬 조각 목록)"""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.size = 0
+        self.strings: Dict[str, int] = {}
+
+    def add(self, data) -> List[int]:
+        data = memoryview(data).cast("B")
+        offset = self.size
+        self.chunks.append(data)
+        self.size += len(data)
+        pad = _padding(self.size)
+        if pad:
+            self.chunks.append(b"\0" * pad)
+            self.size += pad
+        return [offset, len(data)]
+
+    def string_ids(self, values) -> array:
+        strings = self.strings
+        ids = array("i")
+        for value in values:
+            code = strings.get(value)
+            if code is None:
+                code = strings[value] = len(strings)
+            ids.append(code)
+        return ids
+
+    def add_strings(self) -> dict:
+        offsets = array("I", [0])
+        blob = bytearray()
+        for value in self.strings:  # dict는 삽입 순서 = 사전 번호
+            blob += value.encode("utf-8")
+            offsets.append(len(blob))
+        return {"count": len(self.strings), "offsets": self.add(offsets), "blob": self.add(bytes(blob))}
+
+
+class GameSnapshot:
+    def __init__(self, path: Optional[Path], save_delay: float = 5.0, kv: Optional[KeyValueStore] = None):
+        self.path = Path(path) if path else None
+        self.save_delay = save_delay
+        self.kv = kv
+        self._mmap: Optional[mmap.mmap] = None
+        self._save_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # 저장 작업을 띄울 루프 (start)
+        self.loaded = False
+        self.load_ms: Optional[float] = None
+        self.saves = 0
+        self.skipped_saves = 0  # 다른 워커가 리스를 잡고 있어 쓰지 않은 횟수
+        self.save_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    @classmethod
+    def from_env(cls, kv: Optional[KeyValueStore] = None) -> "GameSnapshot":
+        """GAME_DATA_SNAPSHOT (기본 ./data/game_data.snap, 빈 값이면 사용하지 않음), GAME_SNAPSHOT_SAVE_DELAY"""
+        return cls(
+            os.getenv("GAME_DATA_SNAPSHOT", DEFAULT_SNAPSHOT_PATH) or None,
+            save_delay=float(os.getenv("GAME_SNAPSHOT_SAVE_DELAY", 5)),
+            kv=kv,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def attach(self, store: GameDataStore) -> bool:
+        """스냅샷이 있으면 불러오고, 이후 refresh()가 파일을 읽으면 백그라운드에서 새로 저장합니다."""
+        if not self.enabled:
+            return False
+        loaded = self.load(store)
+        store.on_refresh(lambda read: self.schedule_save(store))
+        return loaded
+
+    # ============================================
+    # 저장
+    # ============================================
+
+    def start(self):
+        """지금 이벤트 루프를 기억합니다. 이후 다른 스레드의 refresh()도 이 루프에 저장을 예약합니다."""
+        self._loop = asyncio.get_running_loop()
+
+    def schedule_save(self, store: GameDataStore):
+        """save_delay초 뒤 저장을 예약합니다 (그 사이의 refresh는 한 번의 저장으로 합침)."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            if self._loop is not None and not self._loop.is_closed():
+                # 스레드풀의 refresh: 앱 루프에서 예약
+                self._loop.call_soon_threadsafe(self._schedule, store)
+            else:
+                # 이벤트 루프 밖(스크립트)에서 읽었으면 그 자리에서 저장
+                self._save_locked(store)
+            return
+        self._schedule(store)
+
+    def _schedule(self, store: GameDataStore):
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.get_running_loop().create_task(self._save_later(store))
+
+    async def _save_later(self, store: GameDataStore):
+        await asyncio.sleep(self.save_delay)
+        try:
+            await run_in_threadpool(self._save_locked, store)
+        except Exception as e:
+            self.last_error = f"save failed: {e}"
+
+    async def stop(self):
+        if self._save_task is not None and not self._save_task.done():
+            self._save_task.cancel()
+            try:
+                await self._save_task
+            except asyncio.CancelledError:
+                pass
+        self._save_task = None
+        self._loop = None
+
+    def _save_locked(self, store: GameDataStore) -> bool:
+        # 복사하는 동안만 적재를 막고, 직렬화 / 쓰기는 잠금 밖에서
+        with store.lock:
+            captured = self.capture(store)
+        return self._save_as_leader(captured)
+
+    def _save_as_leader(self, captured: dict) -> bool:
+        # 워커들이 같은 CSV를 보고 같은 내용을 쓰므로 리스를 가진 하나만 씀 (다음 저장 때 리스 연장)
+        if self.kv is not None and not self.kv.acquire_lease(SAVE_LEASE, WORKER_ID, SAVE_LEASE_TTL):
+            self.skipped_saves += 1
+            return False
+        self.write(captured)
+        return True
+
+    @staticmethod
+    def capture(store: GameDataStore) -> dict:
+        """
+        저장할 내용을 지금 상태로 복사합니다 (숫자 열은 memcpy 한 번, 문자열 열은 리스트 복사).
+        이후 write()는 다른 스레드에서 돌아도 적재 중인 테이블과 버퍼를 공유하지 않습니다.
+        스냅샷 view(mapped) 열은 바뀌지 않으므로 그대로 씁니다.
+        """
+        tables = []
+        for table in (store.plays, store.highlights, store.linescores):
+            columns = {}
+            for col, kind in table.schema.items():
+                values = table[col]
+                if table.mapped:
+                    columns[col] = values
+                elif kind == "str":
+                    columns[col] = list(values)
+                else:
+                    columns[col] = values.tobytes()
+            tables.append({
+                "name": table.name,
+                "rows": len(table),
+                "schema": dict(table.schema),
+                "columns": columns,
+                "categories": {col: list(names) for col, names in table.categories.items()},
+                "invalid": dict(table.invalid),
+                "ranges": [[game, start, end] for game, (start, end) in table._ranges.items()],
+            })
+        return {
+            "tables": tables,
+            "game_ids": list(store.game_ids),
+            "games": {game_id: dict(info) for game_id, info in store.games.items()},
+            "files": {str(path.relative_to(store.root)): version for path, version in store._files.items()},
+        }
+
+    def save(self, store: GameDataStore):
+        """지금 바로 저장합니다 (capture + write)."""
+        self.write(self.capture(store))
+
+    def write(self, captured: dict):
+        """임시 파일에 쓴 뒤 rename (다른 워커가 매핑 중인 이전 파일은 그대로 유효)"""
+        start = time.perf_counter()
+        writer = _Writer()
+        tables = {}
+        for table in captured["tables"]:
+            columns = {}
+            for col, kind in table["schema"].items():
+                values = table["columns"][col]
+                if kind == "str":
+                    columns[col] = writer.add(writer.string_ids(values))
+                else:
+                    columns[col] = writer.add(values)
+            tables[table["name"]] = {
+                "rows": table["rows"],
+                "schema": table["schema"],
+                "columns": columns,
+                "categories": {col: writer.add(writer.string_ids(names)) for col, names in table["categories"].items()},
+                "invalid": table["invalid"],
+                "ranges": table["ranges"],
+            }
+        header = {
+            "byteorder": sys.byteorder,
+            "itemsize": {code: array(code).itemsize for code in ("b", "i", "I", "d")},
+            "created_at": time.time(),
+            "strings": writer.add_strings(),
+            "tables": tables,
+            "game_ids": captured["game_ids"],
+            "games": captured["games"],
+            "files": captured["files"],
+        }
+        encoded = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        encoded += b" " * _padding(_PREFIX.size + len(encoded))
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(encoded)))
+            f.write(encoded)
+            for chunk in writer.chunks:
+                f.write(chunk)
+        os.replace(tmp, self.path)
+        self.saves += 1
+        self.save_ms = (time.perf_counter() - start) * 1e3
+
+    # ============================================
+    # 불러오기 (mmap → 열별 memoryview)
+    # ============================================
+
+    def _read_header(self, view: memoryview) -> Optional[dict]:
+        if len(view) < _PREFIX.size:
+            self.last_error = "truncated"
+            return None
+        magic, version, length = _PREFIX.unpack_from(view)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.last_error = f"unsupported format {magic!r} v{version}"
+            return None
+        header = json.loads(bytes(view[_PREFIX.size:_PREFIX.size + length]))
+        itemsize = {code: array(code).itemsize for code in header["itemsize"]}
+        if header["byteorder"] != sys.byteorder or itemsize != header["itemsize"]:
+            self.last_error = "incompatible byte order or item size"
+            return None
+        header["data_start"] = _PREFIX.size + length
+        return header
+
+    def load(self, store: GameDataStore) -> bool:
+        """비어 있는 저장소에 스냅샷을 붙입니다. 파일이 없거나 맞지 않으면 False (CSV부터 읽음)"""
+        if not self.path.is_file() or not self.path.stat().st_size:
+            return False
+        start = time.perf_counter()
+        with open(self.path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        try:
+            header = self._read_header(view)
+        except (ValueError, KeyError) as e:  # 깨진 머리글
+            self.last_error, header = f"invalid header: {e}", None
+        tables = (store.plays, store.highlights, store.linescores)
+        if header is None or any(header["tables"].get(t.name, {}).get("schema") != t.schema for t in tables):
+            self.last_error = self.last_error or "schema changed"
+            view.release()
+            mapped.close()
+            return False
+
+        data = view[header["data_start"]:]
+        section = lambda span, code: data[span[0]:span[0] + span[1]].cast(code)  # noqa: E731
+        strings = StringDictionary(section(header["strings"]["offsets"], "I"), section(header["strings"]["blob"], "B"))
+        for table in tables:
+            self._attach_table(table, header["tables"][table.name], section, strings)
+
+        store.game_ids = list(header["game_ids"])
+        store._game_index = {game_id: i for i, game_id in enumerate(store.game_ids)}
+        store.games = header["games"]
+        store._files = {store.root / name: tuple(version) for name, version in header["files"].items()}
+        self._mmap = mapped
+        self.loaded = True
+        self.last_error = None
+        self.load_ms = (time.perf_counter() - start) * 1e3
+        return True
+
+    @staticmethod
+    def _attach_table(table: ColumnTable, meta: dict, section, strings: StringDictionary):
+        for col, kind in table.schema.items():
+            span = meta["columns"][col]
+            if kind == "str":
+                table.columns[col] = StringColumn(section(span, "i"), strings)
+            else:
+                table.columns[col] = section(span, "i" if kind == "cat" else kind)
+        for col, span in meta["categories"].items():
+            names = [strings[i] for i in section(span, "i")]
+            table.categories[col] = names
+            table._codes[col] = {name: code for code, name in enumerate(names)}
+        table.invalid = dict(meta["invalid"])
+        table.mapped = True
+        if "ranges" in meta:
+            table._ranges = {game: (start, end) for game, start, end in meta["ranges"]}
+        else:
+            table._index_games()  # 행 구간을 저장하기 전 형식
+        # 먼저 만들어진 파생 집계가 있어도 다시 계산하도록
+        table.version += 1
+        table.generation += 1
+
+    def stats(self) -> dict:
+        size = self.path.stat().st_size if self.enabled and self.path.is_file() else 0
+        return {
+            "path": str(self.path) if self.enabled else None,
+            "loaded": self.loaded,
+            "load_ms": round(self.load_ms, 2) if self.load_ms is not None else None,
+            "saves": self.saves,
+            "skipped_saves": self.skipped_saves,
+            "save_pending": self._save_task is not None and not self._save_task.done(),
+            "save_ms": round(self.save_ms, 2) if self.save_ms is not None else None,
+            "bytes": size,
+            "last_error": self.last_error,
+        }
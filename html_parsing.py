@@ -0,0 +1,219 @@
+"""
+플러그형 HTML 파서 백엔드
+스크래퍼가 필요한 부분(일정 테이블, 뉴스 목록 컨테이너)만 빠르게 파싱하기 위한 계층입니다.
+
+백엔드 우선순위 (설치된 것 중 가장 빠른 것을 사용):
+1. selectolax (lexbor)   - pip install selectolax
+2. lxml + cssselect       - pip install lxml cssselect
+3. html.parser (BeautifulSoup, 항상 사용 가능) - SoupStrainer로 대상 서브트리만 트리로 구성
+
+HTML_PARSER_BACKEND 환경 변수로 특정 백엔드를 강제할 수 있습니다.
+모든 백엔드는 같은 Node 인터페이스(css, css_first, text, attr, tag)를 제공하며,
+css()는 bs4의 find_all처럼 자기 자신을 제외한 하위 요소만 반환합니다.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+import os
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import lxml.html
+    import cssselect  # noqa: F401  (lxml의 .cssselect()에 필요)
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+@dataclass(frozen=True)
+class Subtree:
+    """
+    파싱할 서브트리 지정. 예: Subtree("table", id="scheduleTable"), Subtree("ul", class_="news_list")
+    id는 정확히 일치, class_는 class 속성의 부분 문자열 일치입니다 (해시가 붙은 클래스명 대응).
+    """
+    tag: str
+    id: Optional[str] = None
+    class_: Optional[str] = None
+
+    @property
+    def css(self) -> str:
+        selector = self.tag
+        if self.id:
+            selector += f'[id="{self.id}"]'
+        if self.class_:
+            selector += f'[class*="{self.class_}"]'
+        return selector
+
+    def matches(self, name: str, attrs: dict) -> bool:
+        """파싱 중인 태그(이름, 원본 속성)가 대상인지 확인합니다 (SoupStrainer용)."""
+        if name != self.tag:
+            return False
+        if self.id and attrs.get("id") != self.id:
+            return False
+        if self.class_:
+            classes = attrs.get("class") or ""
+            if isinstance(classes, list):
+                classes = " ".join(classes)
+            if self.class_ not in classes:
+                return False
+        return True
+
+
+# ============================================
+# Node 래퍼
+# ============================================
+
+class SoupNode:
+    __slots__ = ("el",)
+
+    def __init__(self, el):
+        self.el = el
+
+    @property
+    def tag(self) -> str:
+        return self.el.name
+
+    def css(self, selector: str) -> List["SoupNode"]:
+        return [SoupNode(e) for e in self.el.select(selector)]
+
+    def css_first(self, selector: str) -> Optional["SoupNode"]:
+        e = self.el.select_one(selector)
+        return SoupNode(e) if e is not None else None
+
+    def text(self) -> str:
+        return self.el.get_text(strip=True)
+
+    def attr(self, name: str) -> Optional[str]:
+        value = self.el.get(name)
+        return " ".join(value) if isinstance(value, list) else value
+
+
+class LexborNode:
+    __slots__ = ("el",)
+
+    def __init__(self, el):
+        self.el = el
+
+    @property
+    def tag(self) -> str:
+        return self.el.tag
+
+    def css(self, selector: str) -> List["LexborNode"]:
+        return [LexborNode(e) for e in self.el.css(selector) if e != self.el]
+
+    def css_first(self, selector: str) -> Optional["LexborNode"]:
+        for e in self.el.css(selector):
+            if e != self.el:
+                return LexborNode(e)
+        return None
+
+    def text(self) -> str:
+        return self.el.text(deep=True, strip=True)
+
+    def attr(self, name: str) -> Optional[str]:
+        return self.el.attributes.get(name)
+
+
+class LxmlNode:
+    __slots__ = ("el",)
+
+    def __init__(self, el):
+        self.el = el
+
+    @property
+    def tag(self) -> str:
+        return self.el.tag
+
+    def css(self, selector: str) -> List["LxmlNode"]:
+        return [LxmlNode(e) for e in self.el.cssselect(selector) if e is not self.el]
+
+    def css_first(self, selector: str) -> Optional["LxmlNode"]:
+        for e in self.el.cssselect(selector):
+            if e is not self.el:
+                return LxmlNode(e)
+        return None
+
+    def text(self) -> str:
+        return "".join(t.strip() for t in self.el.itertext())
+
+    def attr(self, name: str) -> Optional[str]:
+        return self.el.get(name)
+
+
+# ============================================
+# 백엔드
+# ============================================
+
+class HtmlParserBackend:
+    """BeautifulSoup + html.parser. 대상 서브트리만 트리로 만들어 메모리와 시간을 줄입니다."""
+    name = "html.parser"
+
+    def parse(self, html: str) -> SoupNode:
+        return SoupNode(BeautifulSoup(html, "html.parser"))
+
+    def subtree(self, html: str, targets: Sequence[Subtree]) -> Optional[SoupNode]:
+        strainer = SoupStrainer(lambda name, attrs: any(t.matches(name, attrs) for t in targets))
+        soup = BeautifulSoup(html, "html.parser", parse_only=strainer)
+        for target in targets:
+            el = soup.find(lambda tag: target.matches(tag.name, tag.attrs))
+            if el is not None:
+                return SoupNode(el)
+        return None
+
+
+class SelectolaxBackend:
+    name = "selectolax"
+
+    def parse(self, html: str) -> LexborNode:
+        return LexborNode(LexborHTMLParser(html).root)
+
+    def subtree(self, html: str, targets: Sequence[Subtree]) -> Optional[LexborNode]:
+        tree = LexborHTMLParser(html)
+        for target in targets:
+            el = tree.css_first(target.css)
+            if el is not None:
+                return LexborNode(el)
+        return None
+
+
+class LxmlBackend:
+    name = "lxml"
+
+    def parse(self, html: str) -> LxmlNode:
+        return LxmlNode(lxml.html.document_fromstring(html))
+
+    def subtree(self, html: str, targets: Sequence[Subtree]) -> Optional[LxmlNode]:
+        doc = lxml.html.document_fromstring(html)
+        for target in targets:
+            found = doc.cssselect(target.css)
+            if found:
+                return LxmlNode(found[0])
+        return None
+
+
+BACKENDS = {"html.parser": HtmlParserBackend}
+if LXML_AVAILABLE:
+    BACKENDS["lxml"] = LxmlBackend
+if SELECTOLAX_AVAILABLE:
+    BACKENDS["selectolax"] = SelectolaxBackend
+
+_PREFERENCE = ("selectolax", "lxml", "html.parser")
+
+
+def get_backend(name: Optional[str] = None):
+    """이름으로 백엔드를 고릅니다. 지정이 없으면 HTML_PARSER_BACKEND, 그다음 설치된 가장 빠른 것."""
+    name = name or os.getenv("HTML_PARSER_BACKEND")
+    if name:
+        if name not in BACKENDS:
+            raise ValueError(f"HTML parser backend not available: {name}")
+        return BACKENDS[name]()
+    for candidate in _PREFERENCE:
+        if candidate in BACKENDS:
+            return BACKENDS[candidate]()
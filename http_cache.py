@@ -0,0 +1,108 @@
+"""
+HTTP 조건부 요청 (ETag / Last-Modified → 304 Not Modified)
+대시보드 폴링처럼 바뀐 것이 없는 요청은 본문 없이 304로 응답합니다.
+
+- 기사: (id, updated_at, 조회수) 버전으로 강한 ETag
+- 스크래핑 스냅샷: 내용 해시로 약한 ETag(W/) + 수집 시각 Last-Modified.
+  해시는 스냅샷 객체가 바뀔 때만 다시 계산합니다 (SnapshotETag).
+- If-None-Match가 있으면 그것만 보고, 없을 때만 If-Modified-Since를 봅니다 (RFC 9110).
+- 강한 ETag는 표현(content-coding)마다 달라야 하므로 압축 미들웨어가 "...-gzip" / "...-br"을 붙이고,
+  비교할 때는 그 접미사를 떼고 봅니다 (coded_etag / strip_coding).
+"""
+
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from hashlib import blake2b
+from typing import Any, Iterable, Optional
+
+from fastapi import Request, Response
+
+from fast_json import FastJSONResponse, dumps
+
+
+def make_etag(*parts: Any, weak: bool = False) -> str:
+    """버전을 이루는 값들로 ETag를 만듭니다."""
+    digest = blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+CONTENT_CODINGS = ("gzip", "br")
+
+
+def coded_etag(etag: str, coding: str) -> str:
+    """압축된 표현의 강한 ETag ("abc" → "abc-gzip")"""
+    return f'{etag[:-1]}-{coding}"'
+
+
+def strip_coding(tag: str) -> str:
+    """coded_etag의 역. 접미사가 없으면 그대로"""
+    for coding in CONTENT_CODINGS:
+        suffix = f'-{coding}"'
+        if tag.endswith(suffix):
+            return tag[:-len(suffix)] + '"'
+    return tag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 목록에 etag가 있는지 (약한 비교, W/와 압축 접미사 무시)"""
+    if if_none_match.strip() == "*":
+        return True
+    target = etag.removeprefix("W/")
+    return any(strip_coding(tag.strip().removeprefix("W/")) == target for tag in if_none_match.split(","))
+
+
+def http_date(value: datetime) -> str:
+    # 타임존 없는 datetime은 서버 로컬 시각으로 간주
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP 날짜는 초 단위
+        return last_modified.astimezone(timezone.utc).replace(microsecond=0) <= since
+    return False
+
+
+def conditional_json(
+    request: Request,
+    content: Any,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = "no-cache",
+) -> Response:
+    """검증자가 일치하면 304, 아니면 FastJSONResponse. 두 경우 모두 ETag / Last-Modified를 담습니다."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    if not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    return FastJSONResponse(content, headers=headers)
+
+
+class SnapshotETag:
+    """
+    같은 스냅샷 객체에 대해서는 해시를 한 번만 계산하는 약한 ETag.
+    exclude의 키(수집 시각 등)는 내용이 같으면 같은 ETag가 되도록 해시에서 뺍니다.
+    """
+
+    def __init__(self, exclude: Iterable[str] = ()):
+        self.exclude = tuple(exclude)
+        self._snapshot: Any = None
+        self._etag: Optional[str] = None
+
+    def __call__(self, snapshot: Any) -> str:
+        if snapshot is not self._snapshot or self._etag is None:
+            content = snapshot
+            if isinstance(snapshot, dict) and self.exclude:
+                content = {k: v for k, v in snapshot.items() if k not in self.exclude}
+            self._etag = make_etag(dumps(content), weak=True)
+            self._snapshot = snapshot
+        return self._etag
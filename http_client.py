@@ -0,0 +1,138 @@
+"""
+스크래퍼 공용 비동기 HTTP 클라이언트
+httpx.AsyncClient 하나를 공유하여 keep-alive 연결을 재사용하고,
+이벤트 루프를 막지 않고 업스트림을 호출합니다.
+
+- h2 패키지가 있으면 HTTP/2 사용
+- 호스트별 동시 연결 수 제한 (HTTP_MAX_CONNECTIONS_PER_HOST, 기본 6)
+- 연결 오류 / 429 / 5xx 응답은 지터가 섞인 지수 백오프로 재시도 (HTTP_RETRIES, 기본 2)
+  백오프 대기 중에는 호스트 슬롯을 놓고, 다음 시도 때 다시 잡습니다.
+"""
+
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+import asyncio
+import os
+import random
+
+import httpx
+
+try:
+    import h2  # noqa: F401  (httpx[http2] 설치 여부 확인)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class HttpClient:
+    def __init__(
+        self,
+        max_connections: int = 50,
+        max_per_host: int = 6,
+        retries: int = 2,
+        backoff: float = 0.5,
+    ):
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.retries = retries
+        self.backoff = backoff
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self.requests = 0
+        self.retried = 0
+
+    @classmethod
+    def from_env(cls) -> "HttpClient":
+        return cls(
+            max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", 50)),
+            max_per_host=int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", 6)),
+            retries=int(os.getenv("HTTP_RETRIES", 2)),
+        )
+
+    # ============================================
+    # 수명 관리
+    # ============================================
+
+    def start(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                headers=DEFAULT_HEADERS,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=60,
+                ),
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._host_slots.clear()
+
+    # ============================================
+    # 요청
+    # ============================================
+
+    def _slot(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        return slot
+
+    async def _sleep_backoff(self, attempt: int):
+        # full jitter: 0 ~ backoff * 2^attempt 사이에서 무작위 대기
+        await asyncio.sleep(random.uniform(0, self.backoff * (2 ** attempt)))
+
+    async def get(self, url: str, headers: Optional[dict] = None, timeout: float = 15.0, **kwargs) -> httpx.Response:
+        """GET 요청. 재시도 후에도 실패하면 마지막 응답을 반환하거나 httpx.HTTPError를 발생시킵니다."""
+        return await self.request("GET", url, headers=headers, timeout=timeout, **kwargs)
+
+    async def post(self, url: str, headers: Optional[dict] = None, timeout: float = 15.0, **kwargs) -> httpx.Response:
+        """POST 요청 (폼 / AJAX 엔드포인트). 재시도 규칙은 get과 같습니다."""
+        return await self.request("POST", url, headers=headers, timeout=timeout, **kwargs)
+
+    async def request(
+        self, method: str, url: str, headers: Optional[dict] = None, timeout: float = 15.0, **kwargs,
+    ) -> httpx.Response:
+        client = self.start()
+        slot = self._slot(url)
+        for attempt in range(self.retries + 1):
+            # 백오프 동안에는 슬롯을 놓아, 같은 호스트의 다른 요청이 그 사이에 연결을 쓰게 함
+            async with slot:
+                self.requests += 1
+                try:
+                    response = await client.request(method, url, headers=headers, timeout=timeout, **kwargs)
+                except httpx.TransportError:
+                    if attempt >= self.retries:
+                        raise
+                else:
+                    if response.status_code not in RETRY_STATUS or attempt >= self.retries:
+                        return response
+                    await response.aclose()
+            self.retried += 1
+            await self._sleep_backoff(attempt)
+
+    def stats(self) -> dict:
+        return {
+            "http2": HTTP2_AVAILABLE,
+            "requests": self.requests,
+            "retried": self.retried,
+            "hosts": len(self._host_slots),
+        }
+
+
+# 모듈 공용 인스턴스 (backend_main lifespan에서 닫고, 라우터 모듈도 같은 클라이언트 사용)
+http_client = HttpClient.from_env()
@@ -1,95 +1,277 @@
 """
 KBO 경기 일정 스크래퍼
 KBO 공식 웹사이트에서 경기 일정을 가져옵니다.
+
+- scrape_kbo_schedule: 기본 일정 페이지(현재 보이는 달) 한 장
+- crawl_kbo_season: 시즌 전체를 (시리즈, 월) 단위 요청(GetScheduleList AJAX)으로 나눠 동시에 가져와 하나로 합침
+
+실행:
+    python kbo_scraper.py                                    # 현재 페이지
+    python kbo_scraper.py --season 2025 [--series regular,postseason] [--months 4,5] [-o season.json]
 """
-import requests
-from bs4 import BeautifulSoup
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urljoin, urlsplit
+import argparse
+import asyncio
 import json
-from datetime import datetime
-import re
+import os
+import time
+
+import httpx
+
+from http_client import http_client
+from scrape_parsers import parse_kbo_schedule, parse_kbo_schedule_list
 
-def scrape_kbo_schedule():
+def scrape_kbo_schedule(url: Optional[str] = None):
+    """
+    KBO 공식 웹사이트에서 경기 일정을 스크래핑합니다. (동기 실행용 래퍼)
+    """
+    async def run():
+        try:
+            return await scrape_kbo_schedule_async(url)
+        finally:
+            await http_client.aclose()
+
+    return asyncio.run(run())
+
+async def scrape_kbo_schedule_async(url: Optional[str] = None):
     """
     KBO 공식 웹사이트에서 경기 일정을 스크래핑합니다.
+    공용 비동기 HTTP 클라이언트를 사용하므로 이벤트 루프를 막지 않고,
+    파싱은 다른 스크래퍼와 같은 scrape_parsers.parse_kbo_schedule(규칙별 적중 카운터 포함)로 합니다.
     """
-    url = "https://www.koreabaseball.com/Schedule/Schedule.aspx"
-    
+    url = url or KBO_SCHEDULE_URL
+
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
+        response = await http_client.get(url, timeout=10)
         response.encoding = 'utf-8'
-        
+
         if response.status_code != 200:
             return {"error": f"HTTP {response.status_code}", "games": []}
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        games = []
-        
-        # 경기 일정 테이블 찾기
-        # KBO 웹사이트 구조에 맞게 수정 필요
-        schedule_table = soup.find('table', class_='schedule') or soup.find('table', id='schedule')
-        
-        if not schedule_table:
-            # 다른 방법으로 테이블 찾기 시도
-            tables = soup.find_all('table')
-            for table in tables:
-                if '경기' in str(table) or '일정' in str(table):
-                    schedule_table = table
-                    break
-        
-        if schedule_table:
-            rows = schedule_table.find_all('tr')[1:]  # 헤더 제외
-            
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) < 3:
-                    continue
-                
-                try:
-                    # 날짜 추출
-                    date_cell = cells[0].get_text(strip=True)
-                    # 시간 추출
-                    time_cell = cells[1].get_text(strip=True) if len(cells) > 1 else ''
-                    # 경기 정보 추출
-                    game_cell = cells[2].get_text(strip=True) if len(cells) > 2 else ''
-                    # 구장 추출
-                    stadium_cell = cells[-1].get_text(strip=True) if len(cells) > 3 else ''
-                    
-                    # 날짜 파싱 (예: "01.27(월)")
-                    date_match = re.search(r'(\d{2})\.(\d{2})', date_cell)
-                    if date_match:
-                        month = int(date_match.group(1))
-                        day = int(date_match.group(2))
-                        year = datetime.now().year
-                        date_obj = datetime(year, month, day)
-                        
-                        # 경기 팀 추출 (예: "LG vs KIA")
-                        teams_match = re.search(r'([가-힣A-Z\s]+)\s+vs\s+([가-힣A-Z\s]+)', game_cell)
-                        home = teams_match.group(1).strip() if teams_match else ''
-                        away = teams_match.group(2).strip() if teams_match else ''
-                        
-                        games.append({
-                            "date": date_obj.strftime("%Y-%m-%d"),
-                            "dateText": date_cell,
-                            "time": time_cell,
-                            "timeText": time_cell,
-                            "play": game_cell,
-                            "playText": game_cell,
-                            "stadium": stadium_cell,
-                            "home": home,
-                            "away": away
-                        })
-                except Exception as e:
-                    continue
-        
+
+        games, _ = parse_kbo_schedule(response.text)
         return {"games": games, "count": len(games)}
-        
+
     except Exception as e:
         return {"error": str(e), "games": []}
 
+# ============================================
+# 시즌 전체 크롤러 ((시리즈, 월) 단위 병렬 수집)
+# ============================================
+
+KBO_SCHEDULE_URL = os.getenv("KBO_SCHEDULE_URL", "https://www.koreabaseball.com/Schedule/Schedule.aspx")
+# 일정 화면이 달 / 시리즈를 바꿀 때 부르는 AJAX 엔드포인트 (일정 페이지와 같은 호스트)
+SCHEDULE_LIST_PATH = "/ws/Schedule.asmx/GetScheduleList"
+KBO_CRAWL_RATE = float(os.getenv("KBO_CRAWL_RATE", 4))    # 호스트당 초당 요청 수
+KBO_CRAWL_BURST = int(os.getenv("KBO_CRAWL_BURST", 4))    # 한 번에 몰아서 보낼 수 있는 요청 수
+
+# 시리즈 → (KBO 일정 화면의 시리즈 코드 목록, 경기가 있는 달)
+SERIES: Dict[str, Tuple[str, Tuple[int, ...]]] = {
+    "exhibition": ("1", (3,)),
+    "regular": ("0,9,6", tuple(range(3, 11))),
+    "postseason": ("3,4,5,7", (10, 11)),
+}
+DEFAULT_SERIES = ("regular", "postseason")
+AJAX_HEADERS = {"X-Requested-With": "XMLHttpRequest", "Accept": "application/json, text/javascript, */*; q=0.01"}
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷. 초당 rate개, 쉬고 있던 만큼 최대 burst개까지 연달아 허용합니다."""
+
+    def __init__(self, rate: float = KBO_CRAWL_RATE, burst: int = KBO_CRAWL_BURST):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # 호스트 → (남은 토큰, 갱신 시각)
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.waited = 0.0
+
+    async def acquire(self, url: str):
+        host = urlsplit(url).netloc
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:  # 기다리는 요청은 도착 순서대로
+            now = time.monotonic()
+            tokens, updated = self._buckets.get(host, (float(self.burst), now))
+            tokens = min(float(self.burst), tokens + (now - updated) * self.rate)
+            if tokens < 1:
+                wait = (1 - tokens) / self.rate
+                self.waited += wait
+                await asyncio.sleep(wait)
+                now = time.monotonic()
+                tokens = 1.0
+            self._buckets[host] = (tokens - 1, now)
+
+
+def partition_request(base_url: str, season: int, month: int, series: str) -> Tuple[str, dict]:
+    """
+    (시즌, 월, 시리즈) 요청 하나의 (URL, 폼 데이터). 업스트림 요청 형식이 바뀌면 여기만 고칩니다.
+    Schedule.aspx는 쿼리 파라미터를 무시하고 항상 이번 달을 보여 주므로,
+    화면의 달 선택과 같은 GetScheduleList POST를 보냅니다.
+    """
+    form = {
+        "leId": "1",
+        "srIdList": SERIES[series][0],
+        "seasonId": str(season),
+        "gameMonth": f"{month:02d}",
+        "teamId": "",
+    }
+    return urljoin(base_url, SCHEDULE_LIST_PATH), form
+
+
+def season_partitions(series: Iterable[str], months: Optional[Sequence[int]] = None) -> List[Tuple[str, int]]:
+    """요청할 (시리즈, 월) 목록. months를 주면 각 시리즈의 기간 안에서만"""
+    partitions = []
+    for name in series:
+        if name not in SERIES:
+            raise ValueError(f"Unknown series: {name} (choose from {', '.join(SERIES)})")
+        for month in SERIES[name][1]:
+            if months is None or month in months:
+                partitions.append((name, month))
+    return partitions
+
+
+def _normalize(game: dict, series: str) -> dict:
+    return {
+        "date": game["date"],
+        "time": game["time"],
+        "away": game["away"],
+        "home": game["home"],
+        "stadium": game["stadium"],
+        "series": series,
+    }
+
+
+def merge_season(season: int, results: List[dict]) -> Tuple[List[dict], int]:
+    """
+    파티션별 경기를 하나로 합칩니다. 같은 (날짜, 시각, 원정, 홈)은 한 경기로 봅니다
+    (시리즈 화면이 겹쳐 같은 경기가 여러 페이지에 나오는 경우). 시즌 밖 날짜는 버립니다.
+    (정렬된 경기 목록, 중복으로 버린 수)를 반환합니다.
+    """
+    merged: Dict[tuple, dict] = {}
+    duplicates = 0
+    prefix = f"{season}-"
+    for result in results:
+        for game in result["games"]:
+            if not game["date"].startswith(prefix):
+                continue
+            key = (game["date"], game["time"], game["away"], game["home"])
+            if key in merged:
+                duplicates += 1
+                continue
+            merged[key] = _normalize(game, result["series"])
+    games = sorted(merged.values(), key=lambda g: (g["date"], g["time"], g["stadium"], g["home"]))
+    return games, duplicates
+
+
+async def _fetch_partition(
+    base_url: str, season: int, series: str, month: int, limiter: HostRateLimiter,
+) -> dict:
+    url, form = partition_request(base_url, season, month, series)
+    result = {"series": series, "month": month, "games": [], "error": None}
+    await limiter.acquire(url)
+    start = time.perf_counter()
+    try:
+        response = await http_client.post(url, data=form, headers=AJAX_HEADERS, timeout=15)
+        response.encoding = 'utf-8'
+        if response.status_code != 200:
+            result["error"] = f"HTTP {response.status_code}"
+        else:
+            games, _ = parse_kbo_schedule_list(response.text, year=season)
+            # 응답의 날짜에는 연도가 없어 year가 그대로 붙으므로, 다른 달(요청이 무시되고 온 기본 화면 등)이
+            # 섞여 있으면 이 시즌 일정으로 믿을 수 없습니다. 페이지 전체를 실패로 남깁니다.
+            expected = f"{season}-{month:02d}-"
+            stray = sorted({g["date"][:7] for g in games if not g["date"].startswith(expected)})
+            if stray:
+                result["error"] = f"요청한 달({season}.{month:02d})이 아닌 일정: {', '.join(stray)}"
+            else:
+                result["games"] = games
+    except httpx.HTTPError as e:
+        result["error"] = f"네트워크 오류: {e}"
+    except ValueError as e:  # JSON이 아닌 응답 (오류 페이지 등)
+        result["error"] = f"응답 형식 오류: {e}"
+    result["ms"] = round((time.perf_counter() - start) * 1e3, 1)
+    return result
+
+
+async def crawl_kbo_season(
+    season: int,
+    series: Iterable[str] = DEFAULT_SERIES,
+    months: Optional[Sequence[int]] = None,
+    base_url: str = KBO_SCHEDULE_URL,
+    limiter: Optional[HostRateLimiter] = None,
+) -> dict:
+    """
+    한 시즌의 일정을 (시리즈, 월) 파티션으로 나눠 동시에 가져옵니다.
+    동시 연결 수는 공용 HTTP 클라이언트의 호스트별 제한, 요청 속도는 limiter(호스트별 토큰 버킷)가 정합니다.
+    실패한 파티션은 partitions[].error에 남기고 나머지 결과는 그대로 돌려줍니다.
+    """
+    limiter = limiter or HostRateLimiter()
+    start = time.perf_counter()
+    partitions = season_partitions(series, months)
+    results = await asyncio.gather(*(
+        _fetch_partition(base_url, season, name, month, limiter) for name, month in partitions
+    ))
+    games, duplicates = merge_season(season, results)
+    failed = [r for r in results if r["error"]]
+    return {
+        "success": bool(games) and not failed,
+        "season": season,
+        "games": games,
+        "count": len(games),
+        "duplicates": duplicates,
+        "partitions": [
+            {"series": r["series"], "month": r["month"], "games": len(r["games"]), "ms": r["ms"], "error": r["error"]}
+            for r in results
+        ],
+        "error": f"{len(failed)}/{len(results)} 페이지를 가져오지 못했습니다." if failed else None,
+        "elapsed_ms": round((time.perf_counter() - start) * 1e3, 1),
+    }
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="KBO 경기 일정 스크래퍼")
+    parser.add_argument("--season", type=int, help="시즌 전체를 수집할 연도 (없으면 현재 일정 페이지 한 장)")
+    parser.add_argument("--series", default=",".join(DEFAULT_SERIES), help=f"쉼표로 구분 ({', '.join(SERIES)})")
+    parser.add_argument("--months", type=_int_list, help="수집할 달 (예: 4,5,6)")
+    parser.add_argument("--rate", type=float, default=KBO_CRAWL_RATE, help="호스트당 초당 요청 수")
+    parser.add_argument("--burst", type=int, default=KBO_CRAWL_BURST)
+    parser.add_argument("--url", default=KBO_SCHEDULE_URL, help="일정 페이지 주소 (같은 호스트의 GetScheduleList를 호출, 픽스처 서버 등)")
+    parser.add_argument("-o", "--output", help="결과 JSON 파일 (없으면 표준 출력)")
+    args = parser.parse_args(argv)
+
+    series = [name.strip() for name in args.series.split(",") if name.strip()]
+    unknown = [name for name in series if name not in SERIES]
+    if unknown:
+        parser.error(f"unknown series: {', '.join(unknown)} (choose from {', '.join(SERIES)})")
+
+    if args.season is None:
+        result = scrape_kbo_schedule(args.url)
+    else:
+        async def run():
+            try:
+                return await crawl_kbo_season(
+                    args.season,
+                    series=series,
+                    months=args.months,
+                    base_url=args.url,
+                    limiter=HostRateLimiter(args.rate, args.burst),
+                )
+            finally:
+                await http_client.aclose()
+
+        result = asyncio.run(run())
+
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"{result.get('count', 0)} games → {args.output}")
+    else:
+        print(text)
+
+
 if __name__ == "__main__":
-    result = scrape_kbo_schedule()
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    main()
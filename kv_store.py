@@ -0,0 +1,172 @@
+"""
+공유 키-값 저장소 / 리스 기반 공유 loader
+
+- MemoryKeyValueStore: storage.KeyValueStore의 인메모리 구현 (단일 프로세스, STORAGE_BACKEND=memory)
+- SharedLoader: 여러 워커 중 리스를 잡은 하나만 업스트림을 호출하고,
+  나머지 워커는 공유 저장소에 올라온 결과를 읽도록 감싸는 loader (RefreshingCache용)
+  저장소 호출은 동기(SQL)라서 스레드풀에서 실행해 이벤트 루프를 막지 않습니다.
+  공유 결과에는 리더가 가져온 시각을 함께 저장하고 Fetched(값, 수집 시각)로 반환합니다.
+"""
+
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import asyncio
+import os
+import socket
+import threading
+import time
+
+from starlette.concurrency import run_in_threadpool
+
+from refresh_cache import Fetched
+from storage import KeyValueStore
+
+# 리스 소유자 식별자 (호스트 + 프로세스)
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+class MemoryKeyValueStore(KeyValueStore):
+    """
+    만료된 항목도 get에서 돌려주는 계약(SharedLoader가 업스트림 실패 때 오래된 결과를 씀)은 지키되,
+    만료 후 stale_grace초가 지난 항목과 만료된 리스는 sweep_interval초마다 get / set에서 한 번에 지웁니다.
+    """
+
+    def __init__(self, stale_grace: float = 3600.0, sweep_interval: float = 60.0):
+        self._data: Dict[str, Tuple[Any, float]] = {}
+        self._leases: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self.stale_grace = stale_grace
+        self.sweep_interval = sweep_interval
+        self._next_sweep = time.time() + sweep_interval
+        self.evicted = 0
+
+    def _maybe_sweep(self, now: float):
+        if now < self._next_sweep:
+            return
+        with self._lock:
+            if now < self._next_sweep:
+                return
+            self._next_sweep = now + self.sweep_interval
+            cutoff = now - self.stale_grace
+            for key, (_, expires_at) in list(self._data.items()):
+                if expires_at <= cutoff:
+                    self._data.pop(key, None)
+                    self.evicted += 1
+            for name, (_, expires_at) in list(self._leases.items()):
+                if expires_at <= now:
+                    self._leases.pop(name, None)
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        now = time.time()
+        self._maybe_sweep(now)
+        entry = self._data.get(key)
+        if entry is not None and entry[1] <= now - self.stale_grace:
+            self._data.pop(key, None)
+            self.evicted += 1
+            return None
+        return entry
+
+    def set(self, key: str, value: Any, ttl: float):
+        now = time.time()
+        self._maybe_sweep(now)
+        self._data[key] = (value, now + ttl)
+
+    def delete(self, key: str):
+        self._data.pop(key, None)
+
+    def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        now = time.time()
+        with self._lock:
+            current = self._leases.get(name)
+            if current is not None and current[0] != owner and current[1] > now:
+                return False
+            self._leases[name] = (owner, now + ttl)
+            return True
+
+    def release_lease(self, name: str, owner: str):
+        with self._lock:
+            current = self._leases.get(name)
+            if current is not None and current[0] == owner:
+                del self._leases[name]
+
+
+class SharedLoader:
+    """
+    공유 저장소의 key에 결과를 두고 워커끼리 나눠 쓰는 loader.
+
+    1. 공유 결과가 아직 신선하면(ttl 이내) 그대로 반환
+    2. 아니면 리스를 잡은 워커만 loader를 실행하고, 정상 결과를 ttl 동안 공유
+    3. 리스를 못 잡은 워커는 다른 워커의 결과가 올라올 때까지 최대 wait초 기다리고,
+       그래도 없으면 오래된 공유 결과를, 그것도 없으면 직접 loader를 실행
+
+    저장 형식은 {"value": 결과, "fetched_at": 수집 시각(epoch 초)}입니다.
+    """
+
+    def __init__(
+        self,
+        kv: KeyValueStore,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float,
+        is_good: Callable[[Any], bool] = lambda value: True,
+        lease_ttl: float = 60.0,
+        wait: float = 20.0,
+        poll_interval: float = 0.5,
+    ):
+        self.kv = kv
+        self.key = key
+        self.loader = loader
+        self.ttl = ttl
+        self.is_good = is_good
+        self.lease_ttl = lease_ttl
+        self.wait = wait
+        self.poll_interval = poll_interval
+        self.leader_loads = 0
+        self.shared_reads = 0
+
+    @staticmethod
+    def _unwrap(stored: Any) -> Fetched:
+        if isinstance(stored, dict) and stored.keys() == {"value", "fetched_at"}:
+            return Fetched(stored["value"], datetime.fromtimestamp(stored["fetched_at"]))
+        return Fetched(stored, datetime.now())  # 수집 시각 없이 저장된 이전 형식
+
+    async def _fresh(self) -> Optional[Fetched]:
+        entry = await run_in_threadpool(self.kv.get, self.key)
+        if entry is not None and entry[1] > time.time():
+            return self._unwrap(entry[0])
+        return None
+
+    async def __call__(self) -> Fetched:
+        value = await self._fresh()
+        if value is not None:
+            self.shared_reads += 1
+            return value
+
+        lease = f"lease:{self.key}"
+        if await run_in_threadpool(self.kv.acquire_lease, lease, WORKER_ID, self.lease_ttl):
+            try:
+                value = await self.loader()
+                fetched_at = time.time()
+                if self.is_good(value):
+                    stored = {"value": value, "fetched_at": fetched_at}
+                    await run_in_threadpool(self.kv.set, self.key, stored, self.ttl)
+                self.leader_loads += 1
+                return Fetched(value, datetime.fromtimestamp(fetched_at))
+            finally:
+                await run_in_threadpool(self.kv.release_lease, lease, WORKER_ID)
+
+        # 다른 워커가 가져오는 중
+        deadline = time.monotonic() + self.wait
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            value = await self._fresh()
+            if value is not None:
+                self.shared_reads += 1
+                return value
+        entry = await run_in_threadpool(self.kv.get, self.key)
+        if entry is not None:
+            return self._unwrap(entry[0])
+        return Fetched(await self.loader(), datetime.now())
+
+    def stats(self) -> dict:
+        return {"worker": WORKER_ID, "leader_loads": self.leader_loads, "shared_reads": self.shared_reads}
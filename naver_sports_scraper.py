@@ -3,30 +3,39 @@
 매일 5개씩 최신 기사를 가져와서 요약합니다.
 """
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
-import requests
+import httpx
 from bs4 import BeautifulSoup
 from datetime import datetime
-import re
 import json
 
+from extraction_rules import NAVER_INDEX
+from fast_json import FastJSONResponse
+from http_client import http_client
+from single_flight import SingleFlight
+
 router = APIRouter()
 
-@router.get("/naver-baseball-articles")
+NAVER_BASEBALL_URL = "https://m.sports.naver.com/kbaseball/index"
+
+# 같은 URL로 동시에 들어온 요청은 한 번의 가져오기/파싱을 공유 (성공 결과는 60초 캐시)
+articles_flight = SingleFlight(ttl=60)
+
+@router.get("/naver-baseball-articles", response_class=FastJSONResponse)
 async def get_naver_baseball_articles():
     """
     네이버 스포츠 야구 기사 페이지에서 최신 기사 5개를 가져와서 요약합니다.
+    동시에 들어온 요청은 한 번의 스크래핑을 공유합니다.
+    """
+    return FastJSONResponse(content=await articles_flight.do(NAVER_BASEBALL_URL, _scrape_naver_baseball_articles))
+
+async def _scrape_naver_baseball_articles() -> dict:
     """
-    url = "https://m.sports.naver.com/kbaseball/index"
+    네이버 스포츠 야구 기사 페이지에서 최신 기사 5개를 스크래핑합니다.
+    """
+    url = NAVER_BASEBALL_URL
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-        }
-        
-        response = requests.get(url, headers=headers, timeout=15)
+        response = await http_client.get(url, timeout=15)
         response.encoding = 'utf-8'
         
         if response.status_code != 200:
@@ -37,13 +46,12 @@ async def get_naver_baseball_articles():
         
         # 네이버 스포츠 모바일 페이지 구조에 맞게 기사 추출
         # 실제 구조에 따라 수정 필요
-        news_items = soup.find_all('a', class_=re.compile('news|article|item', re.I)) or \
-                     soup.find_all('div', class_=re.compile('news|article', re.I))
+        news_items = NAVER_INDEX.find_all_first(soup)
         
         for item in news_items[:10]:  # 더 많이 가져와서 필터링
             try:
                 # 제목 추출
-                title_elem = item.find(['h3', 'h4', 'span', 'div'], class_=re.compile('title|headline', re.I))
+                title_elem = item.find(['h3', 'h4', 'span', 'div'], class_=NAVER_INDEX.patterns["title_class"])
                 title = title_elem.get_text(strip=True) if title_elem else ''
                 
                 # 링크 추출
@@ -59,7 +67,7 @@ async def get_naver_baseball_articles():
                     image = f"https:{image}" if image.startswith('//') else f"https://m.sports.naver.com{image}"
                 
                 # 날짜/시간 추출
-                date_elem = item.find(['span', 'div', 'time'], class_=re.compile('date|time|ago', re.I))
+                date_elem = item.find(['span', 'div', 'time'], class_=NAVER_INDEX.patterns["date_class"])
                 date_text = date_elem.get_text(strip=True) if date_elem else ''
                 
                 if title and len(title) > 10:  # 유효한 제목만
@@ -81,14 +89,14 @@ async def get_naver_baseball_articles():
                 seen_titles.add(article['title'])
                 unique_articles.append(article)
         
-        return JSONResponse(content={
+        return {
             "success": True,
             "articles": unique_articles,
             "count": len(unique_articles),
             "date": datetime.now().strftime("%Y-%m-%d")
-        })
+        }
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         raise HTTPException(status_code=500, detail=f"네트워크 오류: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"스크래핑 오류: {str(e)}")
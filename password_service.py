@@ -0,0 +1,87 @@
+"""
+비동기 비밀번호 서비스
+bcrypt 해싱/검증을 이벤트 루프 밖의 워커 풀(스레드 또는 프로세스)에서 실행합니다.
+대기 작업 수가 한도를 넘으면 즉시 PasswordServiceBusy를 발생시켜 (503) 과부하를 막습니다.
+
+환경 변수:
+- PASSWORD_POOL_KIND: "thread"(기본) 또는 "process"
+- PASSWORD_POOL_WORKERS: 워커 수 (기본: CPU 코어 수)
+- PASSWORD_MAX_PENDING: 실행 중 + 대기 중 작업 한도 (기본: 워커 수 x 4)
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+import asyncio
+import os
+
+from passlib.context import CryptContext
+
+# 프로세스 풀에서도 쓸 수 있도록 모듈 수준에 둡니다.
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordServiceBusy(Exception):
+    """대기 작업 수가 한도에 도달했을 때 발생합니다."""
+
+
+class PasswordService:
+    def __init__(self, kind: str = "thread", workers: Optional[int] = None, max_pending: Optional[int] = None):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"unknown pool kind: {kind}")
+        self.kind = kind
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 4
+        self._pending = 0
+        self._executor: Optional[Executor] = None
+
+    @classmethod
+    def from_env(cls) -> "PasswordService":
+        workers = os.getenv("PASSWORD_POOL_WORKERS")
+        max_pending = os.getenv("PASSWORD_MAX_PENDING")
+        return cls(
+            kind=os.getenv("PASSWORD_POOL_KIND", "thread"),
+            workers=int(workers) if workers else None,
+            max_pending=int(max_pending) if max_pending else None,
+        )
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def start(self):
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, fn, *args):
+        # 대기열 길이 확인과 증가는 이벤트 루프 스레드에서만 일어나므로 락이 필요 없습니다.
+        if self._pending >= self.max_pending:
+            raise PasswordServiceBusy()
+        self.start()
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(_verify, plain_password, hashed_password)
@@ -0,0 +1,223 @@
+"""
+플레이 역색인 (선수 / 이닝 / 주자·아웃 상황 / 결과 유형 → 이벤트 행 번호)
+game_data의 plays 테이블 위에 필드 값별 posting list(array('i'), 행 번호 오름차순)를 둡니다.
+
+- 색인 필드: batter, pitcher, game, inning, half(0 초 / 1 말), outs, bases(주자 비트),
+  risp(득점권 주자: 2·3루), result(결과 유형: 2루타, 홈런, 실책 ...), leverage(high / medium / low)
+- 질의: 가장 짧은 posting list를 후보로 잡고, 나머지 조건은 열 배열로 거릅니다.
+  후보가 많으면 NumPy로 열을 한 번에 비교하므로 시즌 규모에서도 1ms 미만입니다.
+- 증분 갱신: 새로 추가된 행만 색인합니다. 경기 파일이 바뀌어 행 번호가 밀리면(generation 변경) 다시 만듭니다.
+- 갱신과 질의는 store.lock 안에서 합니다. 질의가 열 array를 frombuffer로 보는 동안 다른 스레드가
+  append하면 BufferError가 나므로, 적재(refresh → update)와 겹치지 않게 합니다.
+
+예: 양의지의 득점권 고레버리지 타석
+    index.search({"batter": "양의지", "risp": True, "leverage": "high"})
+"""
+
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from game_data import MISSING, GameDataStore, typecode
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# 결과 문자열 → 유형 (앞쪽이 우선)
+RESULT_TYPES = (
+    "홈런", "3루타", "2루타", "1루타", "안타", "실책", "볼넷", "몸에 맞는 공", "삼진",
+    "병살", "희생", "야수선택", "땅볼", "플라이", "뜬공", "직선타",
+)
+# 레버리지 구간 (LI 관례: 1.5 이상 high, 0.85 미만 low)
+LEVERAGE_BANDS = ("low", "medium", "high")
+# half 값 → 코드 (질의 문자열로 오는 "0" / "1"도 받음)
+HALF_CODES = {"초": 0, "말": 1, "0": 0, "1": 1}
+HIGH_LEVERAGE = 1.5
+LOW_LEVERAGE = 0.85
+SCORING_POSITION = 0b110  # 2루 | 3루
+
+# 이 수 이하의 후보는 Python으로, 넘으면 NumPy로 거름
+SCAN_LIMIT = 512
+
+
+def result_type(result: str) -> int:
+    for code, keyword in enumerate(RESULT_TYPES):
+        if keyword in result:
+            return code
+    return MISSING
+
+
+def leverage_band(lev: float) -> int:
+    if lev != lev:
+        return MISSING
+    if lev >= HIGH_LEVERAGE:
+        return 2
+    return 0 if lev < LOW_LEVERAGE else 1
+
+
+class PlayIndex:
+    def __init__(self, store: GameDataStore):
+        self.store = store
+        self.postings: Dict[Tuple[str, int], array] = {}
+        # 테이블에 없는 파생 열
+        self.result_types = array("b")
+        self.leverage = array("b")
+        self._generation = store.plays.generation
+        self.rebuilds = 0
+        self.update()
+        store.on_ingest(lambda game_id: self.update())
+
+    # ============================================
+    # 색인 갱신
+    # ============================================
+
+    def _reset(self):
+        self.postings = {}
+        self.result_types = array("b")
+        self.leverage = array("b")
+        self._generation = self.store.plays.generation
+        self.rebuilds += 1
+
+    def _add(self, field: str, value: int, row: int):
+        posting = self.postings.get((field, value))
+        if posting is None:
+            posting = self.postings[(field, value)] = array("i")
+        posting.append(row)
+
+    def update(self) -> int:
+        """아직 색인하지 않은 행을 색인합니다. 색인한 행 수를 반환합니다."""
+        with self.store.lock:
+            return self._update()
+
+    def _update(self) -> int:
+        table = self.store.plays
+        if table.generation != self._generation:
+            self._reset()
+        start, end = len(self.result_types), len(table)
+        c = table.columns
+        for row in range(start, end):
+            bases = c["before_bases"][row]
+            kind = result_type(table["result"][row])
+            band = leverage_band(c["lev"][row])
+            self.result_types.append(kind)
+            self.leverage.append(band)
+            self._add("game", c["game"][row], row)
+            self._add("batter", c["batter"][row], row)
+            self._add("pitcher", c["pitcher"][row], row)
+            self._add("inning", c["inning"][row], row)
+            self._add("half", c["half"][row], row)
+            self._add("outs", c["before_outs"][row], row)
+            self._add("bases", bases, row)
+            self._add("risp", int(bases != MISSING and bool(bases & SCORING_POSITION)), row)
+            self._add("result", kind, row)
+            self._add("leverage", band, row)
+        return end - start
+
+    # ============================================
+    # 질의
+    # ============================================
+
+    def _terms(self, query: dict) -> Optional[List[Tuple[str, int]]]:
+        """이름 / 문자열 조건을 (필드, 코드) 목록으로 바꿉니다. 일치할 수 없는 값이 있으면 None"""
+        table = self.store.plays
+        terms = []
+        for field, value in query.items():
+            if value is None:
+                continue
+            if field in ("batter", "pitcher"):
+                code = table.lookup(field, value)
+            elif field == "game":
+                code = self.store.game_index(value)
+            elif field == "result":
+                code = RESULT_TYPES.index(value) if value in RESULT_TYPES else None
+            elif field == "leverage":
+                code = LEVERAGE_BANDS.index(value) if value in LEVERAGE_BANDS else None
+            elif field == "half":
+                code = HALF_CODES.get(str(value))
+            elif field == "risp":
+                code = int(bool(value))
+            elif field in ("inning", "outs", "bases"):
+                code = int(value)
+            else:
+                raise ValueError(f"Unknown field: {field}")
+            if code is None:
+                return None
+            terms.append((field, code))
+        return terms
+
+    def _column(self, field: str):
+        if field == "result":
+            return self.result_types
+        if field == "leverage":
+            return self.leverage
+        column = {"outs": "before_outs", "bases": "before_bases", "risp": "before_bases"}.get(field, field)
+        return self.store.plays.columns[column]
+
+    def search(
+        self,
+        query: dict,
+        min_lev: Optional[float] = None,
+        limit: int = 50,
+    ) -> Tuple[int, List[int]]:
+        """조건을 모두 만족하는 행 번호 (전체 개수, 앞에서부터 limit개)"""
+        with self.store.lock:
+            return self._search(query, min_lev, limit)
+
+    def _search(self, query: dict, min_lev: Optional[float], limit: int) -> Tuple[int, List[int]]:
+        self._update()
+        terms = self._terms(query)
+        if terms is None:
+            return 0, []
+        table = self.store.plays
+        if not terms:
+            candidates = range(len(table))
+        else:
+            terms.sort(key=lambda term: len(self.postings.get(term, ())))
+            candidates = self.postings.get(terms[0], array("i"))
+            terms = terms[1:]
+
+        if NUMPY_AVAILABLE and len(candidates) > SCAN_LIMIT:
+            rows = self._filter_numpy(candidates, terms, min_lev)
+            return len(rows), rows[:limit].tolist()
+        rows = self._filter_python(candidates, terms, min_lev)
+        return len(rows), rows[:limit]
+
+    def _filter_python(self, candidates, terms, min_lev) -> List[int]:
+        checks = []
+        for field, code in terms:
+            column = self._column(field)
+            if field == "risp":
+                checks.append(lambda i, b=column, want=code: (b[i] != MISSING and bool(b[i] & SCORING_POSITION)) == want)
+            else:
+                checks.append(lambda i, col=column, want=code: col[i] == want)
+        if min_lev is not None:
+            lev = self.store.plays.columns["lev"]
+            checks.append(lambda i: lev[i] >= min_lev)
+        return [i for i in candidates if all(check(i) for check in checks)]
+
+    def _filter_numpy(self, candidates, terms, min_lev) -> "np.ndarray":
+        # 열 배열은 frombuffer로 복사 없이 보고, 질의가 끝나면 참조를 놓음 (array가 다시 자랄 수 있도록).
+        # search()가 store.lock을 쥐고 있어 그동안 update / 적재의 append는 일어나지 않음
+        rows = np.arange(len(candidates)) if isinstance(candidates, range) else np.frombuffer(candidates, dtype="i")
+        for field, code in terms:
+            column = self._column(field)
+            values = np.frombuffer(column, dtype=typecode(column))[rows]
+            if field == "risp":
+                mask = ((values != MISSING) & ((values & SCORING_POSITION) != 0)) == bool(code)
+            else:
+                mask = values == code
+            rows = rows[mask]
+        if min_lev is not None:
+            rows = rows[np.frombuffer(self.store.plays.columns["lev"], dtype="d")[rows] >= min_lev]
+        return rows
+
+    def stats(self) -> dict:
+        return {
+            "rows": len(self.result_types),
+            "terms": len(self.postings),
+            "postings_bytes": sum(p.itemsize * len(p) for p in self.postings.values()),
+            "rebuilds": self.rebuilds,
+        }
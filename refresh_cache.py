@@ -0,0 +1,136 @@
+"""
+백그라운드 갱신 캐시 (stale-while-revalidate)
+느린 업스트림(스크래핑 등) 결과를 스냅샷으로 보관하고,
+백그라운드 작업이 주기적으로 다시 가져옵니다.
+
+- 요청은 항상 마지막으로 성공한 스냅샷을 즉시 받습니다.
+- 스냅샷이 오래되면 응답은 그대로 주고 백그라운드에서 갱신합니다.
+- 동시에 들어온 갱신 요청은 하나의 업스트림 호출로 합쳐집니다.
+- 정상 스냅샷의 내용이 바뀌면 on_update로 등록한 콜백을 부릅니다 (SSE 푸시 등, 코루틴 함수도 가능).
+- loader가 Fetched(값, 수집 시각)를 반환하면 그 시각을 fetched_at으로 씁니다.
+  (SharedLoader: 다른 워커가 가져온 결과도 실제 수집 시각이라 워커마다 Last-Modified가 같음)
+"""
+
+from datetime import datetime
+from typing import Any, Awaitable, Callable, List, NamedTuple, Optional, Tuple
+import asyncio
+import inspect
+import time
+
+
+class Fetched(NamedTuple):
+    """수집 시각을 함께 돌려주는 loader 결과"""
+    value: Any
+    fetched_at: datetime
+
+
+class RefreshingCache:
+    def __init__(
+        self,
+        loader: Callable[[], Awaitable[Any]],
+        interval: float,
+        is_good: Callable[[Any], bool] = lambda value: True,
+        retry_interval: Optional[float] = None,
+    ):
+        self.loader = loader
+        self.interval = interval
+        # 정상 스냅샷이 아직 없을 때는 더 짧은 주기로 재시도합니다.
+        self.retry_interval = min(interval, 30.0) if retry_interval is None else retry_interval
+        self.is_good = is_good
+        self.value: Any = None
+        self.fetched_at: Optional[datetime] = None
+        self._loaded_at: Optional[float] = None  # monotonic
+        self._inflight: Optional[asyncio.Task] = None
+        self._loop_task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[Any], Optional[Awaitable[None]]]] = []
+        self.refreshes = 0
+        self.failures = 0
+
+    def on_update(self, listener: Callable[[Any], Optional[Awaitable[None]]]):
+        """정상 스냅샷이 이전과 다른 내용으로 바뀔 때 새 스냅샷으로 호출될 콜백을 등록합니다."""
+        self._listeners.append(listener)
+
+    @property
+    def good(self) -> bool:
+        return self.value is not None and self.is_good(self.value)
+
+    @property
+    def stale(self) -> bool:
+        interval = self.interval if self.good else self.retry_interval
+        return self._loaded_at is None or time.monotonic() - self._loaded_at >= interval
+
+    async def _load(self):
+        try:
+            value = await self.loader()
+            fetched_at = datetime.now()
+            if isinstance(value, Fetched):
+                value, fetched_at = value
+        except Exception:
+            self.failures += 1
+            if self.value is None:
+                raise
+            # 업스트림 장애 중에는 interval 동안 재시도하지 않고 기존 스냅샷을 제공합니다.
+            self._loaded_at = time.monotonic()
+            return
+        self.refreshes += 1
+        self._loaded_at = time.monotonic()
+        # 실패한 결과는 기존 정상 스냅샷을 덮어쓰지 않습니다.
+        if self.is_good(value) or not self.good:
+            previous, self.value = self.value, value
+            self.fetched_at = fetched_at
+            if self.is_good(value) and value != previous:
+                for listener in self._listeners:
+                    result = listener(value)
+                    if inspect.isawaitable(result):
+                        await result
+        else:
+            self.failures += 1
+
+    def refresh(self) -> asyncio.Task:
+        """진행 중인 갱신이 있으면 그 작업을, 없으면 새 갱신 작업을 반환합니다."""
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._load())
+        return self._inflight
+
+    async def get(self) -> Tuple[Any, Optional[datetime]]:
+        """(스냅샷, 가져온 시각)을 반환합니다. 스냅샷이 없을 때만 업스트림을 기다립니다."""
+        if self.value is None:
+            await asyncio.shield(self.refresh())
+        elif self.stale:
+            self.refresh()
+        return self.value, self.fetched_at
+
+    # ============================================
+    # 백그라운드 갱신 루프
+    # ============================================
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.shield(self.refresh())
+            except Exception:
+                pass
+            await asyncio.sleep(self.interval if self.good else self.retry_interval)
+
+    def start(self):
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        for task in (self._loop_task, self._inflight):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._loop_task = None
+        self._inflight = None
+
+    def stats(self) -> dict:
+        return {
+            "fetched_at": self.fetched_at.isoformat() if self.fetched_at else None,
+            "stale": self.stale,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+        }
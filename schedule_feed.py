@@ -0,0 +1,177 @@
+"""
+KBO 일정 변경 피드 (이전 스냅샷과의 차이만 전달)
+일정을 새로 수집할 때마다 직전 스냅샷과 비교해 바뀐 경기만 버전별로 기록하고,
+클라이언트는 /api/kbo-schedule/changes?since=<버전>으로 그 뒤의 변경분만 받습니다.
+
+- 경기 키: (날짜, 홈, 원정, 구장)
+- 변경 종류: added(새 경기), removed(사라진 경기), time_changed(시각 변경), rainout(취소로 바뀜),
+  updated(그 밖의 필드 변경, 예: 취소 철회)
+- since 이후 여러 버전에 걸친 변경은 경기별로 합쳐 최소 차이만 보냅니다 (추가 후 삭제 → 없음).
+- 상태는 storage.kv에 두므로 워커가 여러 개여도 버전 번호가 같습니다. 기록은 일정을 실제로 수집한
+  워커(SharedLoader 리더)만 남깁니다.
+    {key}          작은 헤드 {version, oldest, epoch, games}  (폴링마다 읽는 것은 이것뿐)
+    {key}:games    마지막 스냅샷 (기록할 때만 읽음)
+    {key}:{버전}    그 버전의 변경 목록 (최근 history개만 유지, 한 번 쓰면 바뀌지 않아 워커마다 메모리에 캐시)
+- since가 남아 있는 기록보다 오래됐거나 현재 버전보다 크면 reset: true를 보내 전체 일정을 다시 받게 합니다.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import threading
+import time
+import uuid
+
+from storage import KeyValueStore
+
+CHANGE_TYPES = ("added", "removed", "time_changed", "rainout", "updated")
+RAINOUT_MARKERS = ("취소", "우천")
+STATE_TTL = 30 * 24 * 3600
+
+
+def game_key(game: dict) -> str:
+    return "|".join((game.get("date", ""), game.get("home", ""), game.get("away", ""), game.get("stadium", "")))
+
+
+def is_rainout(game: dict) -> bool:
+    text = " ".join(str(game.get(field, "")) for field in ("play", "playText", "time", "timeText", "stadium"))
+    return any(marker in text for marker in RAINOUT_MARKERS)
+
+
+def classify(before: Optional[dict], after: Optional[dict]) -> Optional[dict]:
+    """한 경기의 (이전, 이후) → 변경 항목. 바뀐 것이 없으면 None"""
+    if before == after:
+        return None
+    if before is None:
+        return {"type": "added", "game": after}
+    if after is None:
+        return {"type": "removed", "game": before}
+    if is_rainout(after) and not is_rainout(before):
+        return {"type": "rainout", "game": after}
+    if after.get("time") != before.get("time"):
+        return {"type": "time_changed", "game": after, "previous_time": before.get("time")}
+    return {"type": "updated", "game": after}
+
+
+class ScheduleChangeFeed:
+    def __init__(self, kv: KeyValueStore, key: str = "kbo_schedule_feed", history: int = 100):
+        self.kv = kv
+        self.key = key
+        self.history = history
+        self._entries: Dict[int, dict] = {}  # 버전 → 변경 기록 (self._epoch 상태의 것)
+        self._epoch: Optional[str] = None
+        self._lock = threading.Lock()        # changes()는 스레드풀에서 동시에 불림
+        self.recorded = 0
+        self.unchanged = 0
+        self.resets = 0
+
+    def _entry_key(self, version: int) -> str:
+        return f"{self.key}:{version}"
+
+    def _head(self) -> dict:
+        entry = self.kv.get(self.key)
+        if entry is None:
+            return {"version": 0, "oldest": 1, "epoch": None, "games": 0}
+        head = entry[0]
+        if "log" in head:  # 예전 형식 (스냅샷 + 기록 한 덩어리): 버전만 이어받고 기록은 버림
+            return {"version": head["version"], "oldest": head["version"] + 1, "epoch": "legacy",
+                    "games": len(head["games"])}
+        return head
+
+    def _games(self, head: dict) -> Dict[str, dict]:
+        if head["epoch"] == "legacy":
+            return self.kv.get(self.key)[0]["games"]
+        entry = self.kv.get(f"{self.key}:games")
+        return entry[0] if entry is not None else {}
+
+    @property
+    def version(self) -> int:
+        return self._head()["version"]
+
+    def record(self, games: List[dict]) -> int:
+        """새로 수집한 전체 일정을 직전 스냅샷과 비교해 바뀐 경기가 있으면 새 버전으로 기록합니다. 현재 버전 반환"""
+        head = self._head()
+        previous = self._games(head) if head["version"] else {}
+        current = {game_key(game): game for game in games}
+        changes = []  # [키, 이전, 이후]
+        for key, game in current.items():
+            if previous.get(key) != game:
+                changes.append([key, previous.get(key), game])
+        for key, game in previous.items():
+            if key not in current:
+                changes.append([key, game, None])
+        if not changes:
+            self.unchanged += 1
+            return head["version"]
+
+        version = head["version"] + 1
+        epoch = head["epoch"] if head["epoch"] not in (None, "legacy") else uuid.uuid4().hex
+        oldest = max(head["oldest"], version - self.history + 1)
+        # 기록과 스냅샷을 먼저 쓰고 헤드를 마지막에 바꿔, 헤드가 가리키는 버전의 기록은 항상 있게 합니다.
+        self.kv.set(self._entry_key(version), {"version": version, "at": time.time(), "changes": changes}, STATE_TTL)
+        self.kv.set(f"{self.key}:games", current, STATE_TTL)
+        self.kv.set(self.key, {"version": version, "oldest": oldest, "epoch": epoch, "games": len(current)}, STATE_TTL)
+        for old in range(head["oldest"], oldest):
+            self.kv.delete(self._entry_key(old))
+        self.recorded += 1
+        return version
+
+    def _log(self, head: dict, since: int) -> Optional[List[dict]]:
+        """since 다음부터 현재 버전까지의 변경 기록. 하나라도 없으면 (만료 / 다른 워커가 정리) None"""
+        with self._lock:
+            if self._epoch != head["epoch"]:  # 상태가 새로 시작됨: 같은 번호라도 다른 기록
+                self._entries.clear()
+                self._epoch = head["epoch"]
+            for old in [v for v in self._entries if v < head["oldest"]]:
+                del self._entries[old]
+            cached = dict(self._entries)
+        log = []
+        for version in range(since + 1, head["version"] + 1):
+            entry = cached.get(version)
+            if entry is None:
+                stored = self.kv.get(self._entry_key(version))
+                if stored is None:
+                    return None
+                entry = stored[0]
+                with self._lock:
+                    if self._epoch == head["epoch"]:
+                        self._entries[version] = entry
+            log.append(entry)
+        return log
+
+    def changes(self, since: int) -> dict:
+        """since 버전 이후의 변경을 경기별로 합친 결과"""
+        head = self._head()
+        version = head["version"]
+        if since == version:
+            return {"version": version, "since": since, "reset": False, "changes": []}
+        # since가 현재 버전보다 크면 상태가 초기화된 것 (메모리 저장소로 재시작 등)
+        log = None
+        if 0 <= since <= version and since >= head["oldest"] - 1:
+            log = self._log(head, since)
+        if log is None:
+            self.resets += 1
+            return {"version": version, "since": since, "reset": True, "changes": []}
+
+        merged: Dict[str, Tuple[Optional[dict], Optional[dict]]] = {}
+        for entry in log:
+            for key, before, after in entry["changes"]:
+                first = merged[key][0] if key in merged else before
+                merged[key] = (first, after)
+        changes = []
+        for key, (before, after) in merged.items():
+            change = classify(before, after)
+            if change is not None:
+                changes.append({"id": key, **change})
+        changes.sort(key=lambda c: (CHANGE_TYPES.index(c["type"]), c["id"]))
+        return {"version": version, "since": since, "reset": False, "changes": changes}
+
+    def stats(self) -> dict:
+        head = self._head()
+        return {
+            "version": head["version"],
+            "games": head["games"],
+            "history": max(0, head["version"] - head["oldest"] + 1),
+            "cached_entries": len(self._entries),
+            "recorded": self.recorded,
+            "unchanged": self.unchanged,
+            "resets": self.resets,
+        }
@@ -0,0 +1,371 @@
+"""
+스크래핑 결과 HTML에서 KBO 일정 / 네이버 야구 기사를 추출합니다.
+
+1차(빠른 경로): html_parsing 백엔드로 일정 테이블 / 뉴스 목록 컨테이너 서브트리만 파싱
+2차(기존 경로): 빠른 경로에서 아무것도 찾지 못하면 문서 전체를 html.parser로 파싱해
+              여러 선택 방법을 차례로 시도 (페이지 구조 변경 대비)
+
+선택자 / 정규식 / URL 정규화는 extraction_rules에 선언된 규칙을 사용하며,
+어떤 규칙이 적중했는지는 규칙 세트의 카운터(/api/metrics의 extraction_rules)로 확인합니다.
+시즌 크롤러가 받는 일정 AJAX 응답(JSON)은 parse_kbo_schedule_list가 같은 형태로 바꿉니다.
+"""
+
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional, Tuple, Union
+import html
+import json
+import re
+
+from bs4 import BeautifulSoup
+
+from extraction_rules import IMAGE_ATTRS, KBO_SCHEDULE, NAVER_NEWS
+from html_parsing import get_backend
+
+NAVER_SOURCE = "네이버 스포츠"
+MAX_NAVER_ARTICLES = 10
+
+# 미리 컴파일된 규칙 (extraction_rules에서 한 번만 생성)
+_KBO_DATE = KBO_SCHEDULE.patterns["date"]
+_KBO_TEAMS = KBO_SCHEDULE.patterns["teams"]
+_NAVER_ARTICLE_LINK = NAVER_NEWS.patterns["article_link"]
+
+# ============================================
+# 공통 헬퍼
+# ============================================
+
+def _is_article_link(href: str) -> bool:
+    # 네이버 스포츠 기사 URL 패턴
+    return _NAVER_ARTICLE_LINK.search(href) is not None
+
+
+def _first_image(get_attr, hits: Counter) -> str:
+    """src / data-src / data-lazy-src 순으로 이미지 주소를 고르고 어떤 속성이 쓰였는지 셉니다."""
+    for name in IMAGE_ATTRS:
+        value = get_attr(name)
+        if value:
+            hits[f"image:{name}"] += 1
+            return value
+    hits["image:none"] += 1
+    return ""
+
+
+def _article(title: str, link: str, image: str, date_text: str) -> dict:
+    return {
+        "title": title[:200],
+        "link": link,
+        "image": image or "",
+        "date": date_text or "",
+        "source": NAVER_SOURCE,
+    }
+
+
+def _dedupe(articles: List[dict]) -> List[dict]:
+    # 제목 기준 중복 제거, 최대 10개
+    seen = set()
+    unique = []
+    for art in articles:
+        key = art["title"][:80]
+        if key not in seen and len(unique) < MAX_NAVER_ARTICLES:
+            seen.add(key)
+            unique.append(art)
+    return unique
+
+
+def _schedule_game(
+    date_text: str, time_text: str, game_text: str, stadium_text: str, hits: Counter, year: Optional[int] = None,
+) -> Optional[dict]:
+    """일정 한 행의 텍스트로 경기 dict를 만듭니다. 날짜를 해석할 수 없으면 None.
+    "MM.DD" 형식은 year(기본: 올해)의 날짜로 봅니다."""
+    # 날짜 파싱 (예: "01.27(월)" 또는 "2025.01.27")
+    date_match = _KBO_DATE.search(date_text)
+    if not date_match:
+        hits["date:miss"] += 1
+        return None
+    if date_match.group(3):  # YYYY.MM.DD 형식
+        hits["date:yyyy.mm.dd"] += 1
+        year = int(date_match.group(1))
+        month = int(date_match.group(2))
+        day = int(date_match.group(3))
+    else:  # MM.DD 형식
+        hits["date:mm.dd"] += 1
+        year = year or datetime.now().year
+        month = int(date_match.group(1))
+        day = int(date_match.group(2))
+    try:
+        date_obj = datetime(year, month, day)
+    except ValueError:
+        hits["date:invalid"] += 1
+        return None
+
+    # 경기 팀 추출
+    teams_match = _KBO_TEAMS.search(game_text)
+    hits["teams" if teams_match else "teams:miss"] += 1
+    home = teams_match.group(1).strip() if teams_match else ''
+    away = teams_match.group(2).strip() if teams_match else ''
+
+    return {
+        "date": date_obj.strftime("%Y-%m-%d"),
+        "dateText": date_text,
+        "time": time_text,
+        "timeText": time_text,
+        "play": game_text,
+        "playText": game_text,
+        "stadium": stadium_text,
+        "home": home,
+        "away": away
+    }
+
+
+def _table_row_texts(cells: list) -> Optional[Tuple[str, str, str, str]]:
+    if len(cells) < 2:
+        return None
+    date_text = cells[0].text()
+    time_text = cells[1].text()
+    game_text = cells[2].text() if len(cells) > 2 else ''
+    stadium_text = cells[-1].text() if len(cells) > 3 else ''
+    return date_text, time_text, game_text, stadium_text
+
+# ============================================
+# KBO 일정
+# ============================================
+
+def parse_kbo_schedule(html: str, backend=None, year: Optional[int] = None) -> Tuple[List[dict], dict]:
+    """(경기 목록, 디버깅 정보)를 반환합니다. 규칙별 적중 횟수는 KBO_SCHEDULE에 쌓입니다.
+    year는 연도 없는 날짜("04.01(화)")에 붙일 시즌 (지난 시즌 페이지를 읽을 때)"""
+    rules = KBO_SCHEDULE
+    backend = backend or get_backend()
+    hits = Counter()
+    table = backend.subtree(html, rules.subtrees)
+    games = []
+    if table is not None:
+        target = rules.match_subtree(table)
+        for row in table.css(rules.selectors["row"])[1:]:  # 헤더 제외
+            texts = _table_row_texts(row.css(rules.selectors["cell"]))
+            if texts is None:
+                continue
+            game = _schedule_game(*texts, hits, year)
+            if game is not None:
+                games.append(game)
+    if games:
+        rules.record(hits)
+        return games, {"parser": backend.name, "fast_path": True, "rule": f"subtree:{target.css}" if target else None}
+
+    games, debug_info = _parse_kbo_schedule_full(html, hits, year)
+    rules.record(hits)
+    debug_info["parser"] = "html.parser"
+    debug_info["fast_path"] = False
+    return games, debug_info
+
+
+def _parse_kbo_schedule_full(
+    html_content: str, hits: Optional[Counter] = None, year: Optional[int] = None,
+) -> Tuple[List[dict], dict]:
+    rules = KBO_SCHEDULE
+    hits = hits if hits is not None else Counter()
+    soup = BeautifulSoup(html_content, 'html.parser')
+    games = []
+
+    # KBO 웹사이트의 경기 일정 컨테이너 찾기 (규칙 순서대로 시도)
+    rule, schedule_table = rules.find_container(soup)
+    is_table = schedule_table is not None and schedule_table.name == 'table'
+
+    rows = []
+    if schedule_table is not None:
+        if is_table:
+            rows = schedule_table.find_all('tr')[1:]  # 헤더 제외
+        else:
+            # div인 경우 경기 항목 찾기
+            rows = rules.items[0].find_all(schedule_table)
+
+    patterns = rules.patterns
+    for row in rows:
+        try:
+            if is_table:
+                cells = row.find_all(['td', 'th'])
+                if len(cells) < 2:
+                    continue
+
+                date_text = cells[0].get_text(strip=True)
+                time_text = cells[1].get_text(strip=True)
+                game_text = cells[2].get_text(strip=True) if len(cells) > 2 else ''
+                stadium_text = cells[-1].get_text(strip=True) if len(cells) > 3 else ''
+            else:
+                # div 구조인 경우
+                date_text = _field_text(row, patterns["date_field"])
+                time_text = _field_text(row, patterns["time_field"])
+                game_text = _field_text(row, patterns["game_field"])
+                stadium_text = _field_text(row, patterns["stadium_field"])
+
+            game = _schedule_game(date_text, time_text, game_text, stadium_text, hits, year)
+            if game is not None:
+                games.append(game)
+        except Exception:
+            continue
+
+    # 실패 원인 파악에 필요한 최소 정보만 남김 (어떤 규칙이 맞았는지는 /api/metrics 카운터 참고)
+    debug_info = {
+        "html_length": len(html_content),
+        "rule": f"container:{rule.name}" if rule else None,
+        "rows_found": len(rows),
+    }
+    return games, debug_info
+
+
+def _field_text(row, pattern) -> str:
+    el = row.find(class_=pattern)
+    return el.get_text(strip=True) if el else ''
+
+# KBO 일정 화면은 달 / 시리즈를 바꿀 때 GetScheduleList(AJAX)를 호출합니다.
+# 응답: {"rows": [{"row": [{"Text": "<b>04.01(화)</b>", "Class": "day", "RowSpan": "5"}, ...]}, ...]}
+# 날짜 칸은 그날 첫 경기 행에만 있고(RowSpan), 칸 순서는 날짜 / 시간 / 경기 / ... / 구장 / 비고입니다.
+_TAG = re.compile(r'<[^>]+>')
+_SCORE = re.compile(r'<em>.*?</em>', re.S)  # 경기 칸의 "점수 vs 점수" 부분
+
+
+def _cell_text(cell: dict) -> str:
+    return html.unescape(_TAG.sub('', cell.get("Text") or '')).strip()
+
+
+def parse_kbo_schedule_list(payload: Union[str, bytes, dict], year: Optional[int] = None) -> Tuple[List[dict], dict]:
+    """GetScheduleList 응답(JSON)을 parse_kbo_schedule과 같은 경기 목록으로 바꿉니다.
+    year는 연도 없는 날짜에 붙일 시즌. (경기 목록, 디버깅 정보)를 반환합니다.
+    응답 구조가 다르면(객체가 아닌 본문 / 행) ValueError"""
+    data = json.loads(payload) if isinstance(payload, (str, bytes)) else payload
+    if not isinstance(data, dict):
+        raise ValueError(f"schedule list must be a JSON object, got {type(data).__name__}")
+    hits = Counter()
+    games = []
+    date_text = ''
+    rows = data.get("rows") or []
+    if not isinstance(rows, list):
+        raise ValueError(f"schedule list rows must be a list, got {type(rows).__name__}")
+    for item in rows:
+        if not isinstance(item, dict):
+            raise ValueError(f"schedule list row must be an object, got {type(item).__name__}")
+        cells = item.get("row") or []
+        if not isinstance(cells, list) or not all(isinstance(cell, dict) for cell in cells):
+            raise ValueError("schedule list cells must be a list of objects")
+        if cells and cells[0].get("Class") == "day":
+            date_text = _cell_text(cells[0])
+            cells = cells[1:]
+        if len(cells) < 2 or cells[0].get("Class") != "time":
+            continue  # "데이터가 없습니다." 같은 안내 행
+        play = dict(cells[1], Text=_SCORE.sub('vs', cells[1].get("Text") or ''))
+        stadium_text = _cell_text(cells[-2]) if len(cells) > 3 else ''
+        game = _schedule_game(date_text, _cell_text(cells[0]), _cell_text(play), stadium_text, hits, year)
+        if game is not None:
+            games.append(game)
+    KBO_SCHEDULE.record(hits)
+    return games, {"parser": "json", "rows_found": len(rows)}
+
+# ============================================
+# 네이버 야구 기사
+# ============================================
+
+def parse_naver_articles(html: str, backend=None) -> Tuple[List[dict], dict]:
+    """(중복 제거된 기사 최대 10개, 디버깅 정보)를 반환합니다. 규칙별 적중 횟수는 NAVER_NEWS에 쌓입니다."""
+    rules = NAVER_NEWS
+    selectors = rules.selectors
+    backend = backend or get_backend()
+    hits = Counter()
+    container = backend.subtree(html, rules.subtrees)
+    articles = []
+    if container is not None:
+        target = rules.match_subtree(container)
+        for a in container.css(selectors["link"]):
+            href = a.attr("href") or ""
+            if not _is_article_link(href):
+                continue
+            title_el = a.css_first(selectors["title"])
+            title = title_el.text() if title_el else a.text()
+            if not title or len(title) < 5:
+                hits["title:miss"] += 1
+                continue
+            hits["title:selector" if title_el else "title:anchor_text"] += 1
+            img = a.css_first(selectors["image"])
+            image = _first_image(img.attr, hits) if img else ""
+            date_el = a.css_first(selectors["date"])
+            articles.append(_article(
+                title, rules.absolute_url(href), rules.absolute_url(image), date_el.text() if date_el else "",
+            ))
+    if articles:
+        rules.record(hits)
+        unique = _dedupe(articles)
+        return unique, {
+            "parser": backend.name,
+            "fast_path": True,
+            "rule": f"subtree:{target.css}" if target else None,
+            "articles_found": len(articles),
+            "unique_articles": len(unique),
+        }
+
+    articles, debug_info = _parse_naver_articles_full(html, hits)
+    rules.record(hits)
+    unique = _dedupe(articles)
+    debug_info.update({
+        "parser": "html.parser",
+        "fast_path": False,
+        "articles_found": len(articles),
+        "unique_articles": len(unique),
+    })
+    return unique, debug_info
+
+
+def _parse_naver_articles_full(html_content: str, hits: Optional[Counter] = None) -> Tuple[List[dict], dict]:
+    rules = NAVER_NEWS
+    patterns = rules.patterns
+    hits = hits if hits is not None else Counter()
+    soup = BeautifulSoup(html_content, "html.parser")
+    articles = []
+
+    # 여러 방법으로 기사 찾기
+    # 방법 1: 기사 링크가 있는 a 태그 찾기
+    links = soup.find_all("a", href=True)
+    for a in links:
+        href = a.get("href", "")
+        if not _is_article_link(href):
+            continue
+
+        # 제목 추출 (여러 방법 시도)
+        title_el = a.find(class_=patterns["title_class"])
+        title = title_el.get_text(strip=True) if title_el else a.get_text(strip=True)
+        if not title or len(title) < 5:
+            continue
+
+        img = a.find("img")
+        image = _first_image(img.get, hits) if img else ""
+        date_el = a.find(class_=patterns["date_class"])
+        date_text = date_el.get_text(strip=True) if date_el else ""
+
+        hits["method:anchor"] += 1
+        articles.append(_article(title, rules.absolute_url(href), rules.absolute_url(image), date_text))
+
+    # 방법 2: 기사 리스트 아이템 찾기
+    for item in rules.items[0].find_all(soup):
+        link_elem = item.find("a", href=True)
+        if not link_elem:
+            continue
+
+        href = link_elem.get("href", "")
+        if not href or not patterns["item_link"].search(href):
+            continue
+
+        title_elem = item.find(class_=patterns["item_title_class"])
+        title = title_elem.get_text(strip=True) if title_elem else link_elem.get_text(strip=True)
+        if not title or len(title) < 5:
+            continue
+
+        img_elem = item.find("img")
+        image = _first_image(img_elem.get, hits) if img_elem else ""
+        date_elem = item.find(class_=patterns["date_class"])
+        date_text = date_elem.get_text(strip=True) if date_elem else ""
+
+        hits["method:news_item"] += 1
+        articles.append(_article(title, rules.absolute_url(href), rules.absolute_url(image), date_text))
+
+    debug_info = {
+        "html_length": len(html_content),
+        "total_links_found": len(links),
+    }
+    return articles, debug_info
@@ -0,0 +1,107 @@
+"""
+Single-flight 요청 합치기 + 짧은 TTL 결과 캐시
+같은 키(업스트림 URL)로 동시에 들어온 호출은 하나의 실행(가져오기 + 파싱)을 공유하고,
+성공한 결과는 ttl 초 동안 재사용합니다. failure_ttl을 주면 실패 결과(is_good이 거짓)도
+그만큼 짧게 재사용해, 같은 잘못된 요청이 매번 업스트림을 다시 부르지 않도록 합니다.
+
+store(storage.KeyValueStore)를 주면 성공 결과를 워커 간 공유 저장소에도 ttl 동안 두어,
+여러 uvicorn 워커 중 먼저 가져온 쪽의 결과를 다른 워커가 재사용합니다 (저장소 호출은 스레드풀에서).
+
+사용 예:
+    flight = SingleFlight(ttl=60)
+    payload = await flight.do(url, lambda: scrape(url))
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import asyncio
+import time
+
+from starlette.concurrency import run_in_threadpool
+
+from storage import KeyValueStore
+
+
+class SingleFlight:
+    def __init__(
+        self,
+        ttl: float = 0.0,
+        is_good: Callable[[Any], bool] = lambda value: True,
+        store: Optional[KeyValueStore] = None,
+        namespace: str = "",
+        failure_ttl: float = 0.0,
+    ):
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.is_good = is_good
+        self.store = store
+        self.namespace = namespace
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._cache: Dict[str, Tuple[float, Any]] = {}  # key -> (만료 시각(monotonic), 결과)
+        self.calls = 0      # 실제 실행 횟수
+        self.shared = 0     # 진행 중인 실행에 합류한 횟수
+        self.hits = 0       # TTL 캐시 적중 횟수
+        self.store_hits = 0 # 공유 저장소 적중 횟수 (다른 워커가 가져온 결과)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        cached = self._cache.get(key)
+        if cached is not None:
+            if time.monotonic() < cached[0]:
+                self.hits += 1
+                return cached[1]
+            del self._cache[key]
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.shared += 1
+            # 한 호출자가 취소되어도 공유 실행은 계속되도록 shield
+            return await asyncio.shield(future)
+
+        self.calls += 1
+        future = asyncio.ensure_future(self._run(key, fn) if self.store is not None else fn())
+        self._inflight[key] = future
+        # 첫 호출자가 취소되더라도 실행이 끝나는 시점에 정리·캐시됩니다.
+        future.add_done_callback(lambda f: self._done(key, f))
+        return await asyncio.shield(future)
+
+    async def _run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        entry = await run_in_threadpool(self.store.get, self.namespace + key)
+        if entry is not None and entry[1] > time.time():
+            self.store_hits += 1
+            # 로컬 캐시는 공유 결과의 남은 수명만큼만 유지
+            self._cache[key] = (time.monotonic() + entry[1] - time.time(), entry[0])
+            return entry[0]
+        result = await fn()
+        ttl = self._ttl_for(result)
+        if ttl > 0:
+            await run_in_threadpool(self.store.set, self.namespace + key, result, ttl)
+        return result
+
+    def _ttl_for(self, result: Any) -> float:
+        return self.ttl if self.is_good(result) else self.failure_ttl
+
+    def _done(self, key: str, future: asyncio.Future):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if key in self._cache:
+            return  # 공유 저장소에서 읽은 결과 (_run에서 이미 캐시됨)
+        if not future.cancelled() and future.exception() is None:
+            result = future.result()
+            ttl = self._ttl_for(result)
+            if ttl > 0:
+                self._cache[key] = (time.monotonic() + ttl, result)
+
+    def forget(self, key: str):
+        """캐시된 결과를 지웁니다 (진행 중인 실행은 유지)."""
+        self._cache.pop(key, None)
+        if self.store is not None:
+            self.store.delete(self.namespace + key)
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "shared": self.shared,
+            "hits": self.hits,
+            "store_hits": self.store_hits,
+            "inflight": len(self._inflight),
+            "cached_keys": len(self._cache),
+        }
@@ -0,0 +1,393 @@
+"""
+SQLite / SQLAlchemy 저장소 백엔드
+storage.UserRepository / ArticleRepository를 SQLAlchemy Core로 구현합니다.
+
+- SQLite는 WAL 모드 + synchronous=NORMAL + busy_timeout으로 열어
+  읽기와 쓰기가 서로 막지 않고, 여러 uvicorn 워커가 같은 파일을 공유할 수 있습니다.
+- 연결은 엔진 풀(QueuePool)에서 재사용합니다 (DB_POOL_SIZE, DB_MAX_OVERFLOW).
+- 인덱스: id(PK), status, author_id, updated_at, (status, updated_at, id), (updated_at, id),
+  사용자 email / username / kakaoId 고유 인덱스
+- 목록(page)은 요약 열과 요청한 fields만 SELECT 합니다. fullContent / image 본문은 상세(get)에서만 읽고,
+  목록의 hasImage / image(URL일 때만)는 SQL에서 계산합니다.
+- kv_entries / leases: 워커 간 공유 스크래핑 캐시와 리더 선출용 리스 (SqlKeyValueStore)
+- DATABASE_URL을 다른 SQLAlchemy URL(PostgreSQL 등)로 바꿔도 동작하도록 표준 SQL만 사용합니다.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import os
+import threading
+import time
+
+from sqlalchemy import (
+    JSON, Column, DateTime, Float, Index, Integer, MetaData, String, Table, Text,
+    and_, bindparam, case, create_engine, delete, event, func, insert, or_, select, update,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from article_projection import SUMMARY_FIELDS
+from article_store import from_micros, sort_key
+from storage import ArticleRepository, KeyValueStore, UserRepository
+from user_store import UNIQUE_FIELDS, DuplicateUserError
+
+metadata = MetaData()
+
+users = Table(
+    "users", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("email", String(255)),
+    Column("username", String(150)),
+    Column("kakaoId", String(64)),
+    Column("password", String(255)),
+    Column("first_name", String(100)),
+    Column("last_name", String(100)),
+    Column("nickname", String(100)),
+    Column("phone", String(32)),
+    Column("department", String(100)),
+    Index("ux_users_email", "email", unique=True),
+    Index("ux_users_username", "username", unique=True),
+    Index("ux_users_kakao_id", "kakaoId", unique=True),
+)
+
+articles = Table(
+    "articles", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("title", String, nullable=False),
+    Column("content", Text),
+    Column("fullContent", Text),
+    Column("date", String(64)),
+    Column("reporter", String(100)),
+    Column("department", String(100)),
+    Column("email", String(255)),
+    Column("image", Text),
+    Column("tags", JSON),
+    Column("views", Integer, nullable=False, default=0),
+    Column("status", String(20), nullable=False, default="draft"),
+    Column("author_id", Integer),
+    Column("created_at", DateTime),
+    Column("updated_at", DateTime, nullable=False),
+    Index("ix_articles_status", "status"),
+    Index("ix_articles_author_id", "author_id"),
+    Index("ix_articles_updated_at", "updated_at"),
+    # 키셋 페이지네이션: 상태별 / 전체 목록
+    Index("ix_articles_status_updated_id", "status", "updated_at", "id"),
+    Index("ix_articles_updated_id", "updated_at", "id"),
+)
+
+USER_COLUMNS = frozenset(c.name for c in users.columns) - {"id"}
+ARTICLE_COLUMNS = frozenset(c.name for c in articles.columns) - {"id"}
+
+# 목록 요약용 계산 열: 무거운 image 값 대신 존재 여부와 URL(data: URI면 NULL)만 읽음
+HAS_IMAGE = and_(articles.c.image.isnot(None), articles.c.image != "").label("hasImage")
+IMAGE_URL = case((articles.c.image.like("data:%"), None), else_=articles.c.image).label("image")
+
+
+def page_columns(fields: Optional[Iterable[str]]) -> list:
+    """목록 한 페이지에 읽을 열. fullContent / image 본문은 요청한 경우에만 (상세 get()은 전체)"""
+    if fields is None:
+        return [articles.c[name] for name in SUMMARY_FIELDS] + [IMAGE_URL, HAS_IMAGE]
+    names = dict.fromkeys(["id", "updated_at", *fields])
+    columns = [articles.c[name] for name in names if name in articles.c]
+    if "hasImage" in names:
+        columns.append(HAS_IMAGE)
+    return columns
+
+# ============================================
+# 엔진
+# ============================================
+
+_engines: Dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000))}")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def make_engine(url: str) -> Engine:
+    """URL로 엔진을 만들고 테이블 / 인덱스를 생성합니다."""
+    kwargs = {"pool_pre_ping": True}
+    is_sqlite = url.startswith("sqlite")
+    if is_sqlite:
+        database = url.split("///", 1)[-1]
+        if database and database != ":memory:":
+            Path(database).parent.mkdir(parents=True, exist_ok=True)
+            kwargs.update(
+                pool_size=int(os.getenv("DB_POOL_SIZE", 5)),
+                max_overflow=int(os.getenv("DB_MAX_OVERFLOW", 10)),
+            )
+        # 풀에서 꺼낸 연결은 다른 스레드(스레드풀 엔드포인트 등)에서도 쓰일 수 있음
+        kwargs["connect_args"] = {"check_same_thread": False}
+    engine = create_engine(url, **kwargs)
+    if is_sqlite:
+        event.listen(engine, "connect", _sqlite_pragmas)
+    for attempt in range(3):
+        try:
+            metadata.create_all(engine)
+            break
+        except OperationalError:
+            # 여러 워커가 동시에 시작하면 다른 워커가 먼저 만든 테이블과 충돌 → 다시 확인 후 생성
+            if attempt == 2:
+                raise
+    return engine
+
+
+def shared_engine(url: str) -> Engine:
+    """URL별로 하나의 엔진(연결 풀)을 공유합니다."""
+    with _engines_lock:
+        engine = _engines.get(url)
+        if engine is None:
+            engine = _engines[url] = make_engine(url)
+        return engine
+
+
+def _row_dict(row, drop_none: bool = False) -> Optional[dict]:
+    if row is None:
+        return None
+    data = dict(row._mapping)
+    if drop_none:
+        # 인메모리 저장소처럼 값이 없는 필드는 키 자체가 없도록 (user.get("nickname", 기본값) 호환)
+        data = {k: v for k, v in data.items() if v is not None}
+    return data
+
+# ============================================
+# 사용자
+# ============================================
+
+class SqlUserRepository(UserRepository):
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self._delete_listeners: List[Callable[[dict], None]] = []
+
+    def _find(self, conn, field: str, value) -> Optional[dict]:
+        row = conn.execute(select(users).where(users.c[field] == value)).first()
+        return _row_dict(row, drop_none=True)
+
+    def _duplicate_field(self, conn, data: dict) -> Optional[str]:
+        for field in UNIQUE_FIELDS:
+            value = data.get(field)
+            if value is not None and self._find(conn, field, value) is not None:
+                return field
+        return None
+
+    def add(self, data: dict) -> dict:
+        values = {k: v for k, v in data.items() if k in USER_COLUMNS}
+        try:
+            with self.engine.begin() as conn:
+                field = self._duplicate_field(conn, values)
+                if field is not None:
+                    raise DuplicateUserError(field)
+                user_id = conn.execute(insert(users).values(**values)).inserted_primary_key[0]
+        except IntegrityError:
+            # 다른 워커가 동시에 같은 값으로 가입한 경우 (고유 인덱스가 최종 판정)
+            with self.engine.connect() as conn:
+                raise DuplicateUserError(self._duplicate_field(conn, values) or "email")
+        return self.get(user_id)
+
+    def get_or_create(self, field: str, value: str, factory: Callable[[], dict]) -> dict:
+        user = self._by(field, value)
+        if user is not None:
+            return user
+        try:
+            return self.add(factory())
+        except DuplicateUserError as e:
+            if e.field != field:
+                raise
+            return self._by(field, value)  # 동시에 만들어진 레코드 사용
+
+    def on_delete(self, listener: Callable[[dict], None]):
+        self._delete_listeners.append(listener)
+
+    def delete(self, user_id: int) -> Optional[dict]:
+        with self.engine.begin() as conn:
+            user = _row_dict(conn.execute(select(users).where(users.c.id == user_id)).first(), drop_none=True)
+            if user is not None:
+                conn.execute(delete(users).where(users.c.id == user_id))
+        if user is not None:
+            for listener in self._delete_listeners:
+                listener(user)
+        return user
+
+    def _by(self, field: str, value) -> Optional[dict]:
+        with self.engine.connect() as conn:
+            return self._find(conn, field, value)
+
+    def get(self, user_id: int) -> Optional[dict]:
+        return self._by("id", user_id)
+
+    def get_by_email(self, email: str) -> Optional[dict]:
+        return self._by("email", email)
+
+    def get_by_username(self, username: str) -> Optional[dict]:
+        return self._by("username", username)
+
+    def get_by_kakao_id(self, kakao_id: str) -> Optional[dict]:
+        return self._by("kakaoId", kakao_id)
+
+# ============================================
+# 기사
+# ============================================
+
+class SqlArticleRepository(ArticleRepository):
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+    def _get(self, conn, article_id: int) -> Optional[dict]:
+        return _row_dict(conn.execute(select(articles).where(articles.c.id == article_id)).first())
+
+    def add(self, data: dict) -> dict:
+        values = {k: v for k, v in data.items() if k in ARTICLE_COLUMNS}
+        values.setdefault("updated_at", values.get("created_at") or datetime.now())
+        with self.engine.begin() as conn:
+            article_id = conn.execute(insert(articles).values(**values)).inserted_primary_key[0]
+            return self._get(conn, article_id)
+
+    def get(self, article_id: int) -> Optional[dict]:
+        with self.engine.connect() as conn:
+            return self._get(conn, article_id)
+
+    def update(self, article_id: int, changes: dict) -> Optional[dict]:
+        values = {k: v for k, v in changes.items() if k in ARTICLE_COLUMNS}
+        with self.engine.begin() as conn:
+            if values:
+                result = conn.execute(update(articles).where(articles.c.id == article_id).values(**values))
+                if result.rowcount == 0:
+                    return None
+            return self._get(conn, article_id)
+
+    def delete(self, article_id: int) -> Optional[dict]:
+        with self.engine.begin() as conn:
+            article = self._get(conn, article_id)
+            if article is not None:
+                conn.execute(delete(articles).where(articles.c.id == article_id))
+            return article
+
+    def increment_views(self, article_id: int, amount: int = 1) -> Optional[int]:
+        with self.engine.begin() as conn:
+            result = conn.execute(
+                update(articles).where(articles.c.id == article_id).values(views=articles.c.views + amount)
+            )
+            if result.rowcount == 0:
+                return None
+            return conn.execute(select(articles.c.views).where(articles.c.id == article_id)).scalar()
+
+    def apply_view_deltas(self, deltas: Dict[int, int]) -> int:
+        """{id: 증가분}을 트랜잭션 하나의 executemany UPDATE로 반영합니다."""
+        if not deltas:
+            return 0
+        stmt = (
+            update(articles)
+            .where(articles.c.id == bindparam("b_id"))
+            .values(views=articles.c.views + bindparam("b_delta"))
+        )
+        with self.engine.begin() as conn:
+            result = conn.execute(stmt, [{"b_id": k, "b_delta": v} for k, v in deltas.items()])
+            return result.rowcount
+
+    def page(
+        self,
+        status: Optional[str] = None,
+        limit: int = 20,
+        after: Optional[Tuple[int, int]] = None,
+        skip: int = 0,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Tuple[List[dict], Optional[Tuple[int, int]]]:
+        query = select(*page_columns(fields))
+        if status is not None:
+            query = query.where(articles.c.status == status)
+        if after is not None:
+            last_updated, last_id = from_micros(after[0]), after[1]
+            query = query.where(or_(
+                articles.c.updated_at < last_updated,
+                and_(articles.c.updated_at == last_updated, articles.c.id < last_id),
+            ))
+        elif skip:
+            query = query.offset(skip)
+        query = query.order_by(articles.c.updated_at.desc(), articles.c.id.desc()).limit(limit + 1)
+        with self.engine.connect() as conn:
+            rows = [_row_dict(row) for row in conn.execute(query)]
+        next_key = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_key = sort_key(rows[-1])
+        return rows, next_key
+
+    def count(self, status: Optional[str] = None) -> int:
+        query = select(func.count()).select_from(articles)
+        if status is not None:
+            query = query.where(articles.c.status == status)
+        with self.engine.connect() as conn:
+            return conn.execute(query).scalar()
+
+# ============================================
+# 워커 간 공유 키-값 / 리스
+# ============================================
+
+kv_entries = Table(
+    "kv_entries", metadata,
+    Column("key", String(255), primary_key=True),
+    Column("value", JSON),
+    Column("expires_at", Float, nullable=False),
+)
+
+leases = Table(
+    "leases", metadata,
+    Column("name", String(255), primary_key=True),
+    Column("owner", String(255), nullable=False),
+    Column("expires_at", Float, nullable=False),
+)
+
+
+class SqlKeyValueStore(KeyValueStore):
+    """스크래핑 결과 공유 캐시와 리더 선출용 리스를 같은 DB에 둡니다."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                select(kv_entries.c.value, kv_entries.c.expires_at).where(kv_entries.c.key == key)
+            ).first()
+        return (row.value, row.expires_at) if row is not None else None
+
+    def set(self, key: str, value: Any, ttl: float):
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(delete(kv_entries).where(kv_entries.c.key == key))
+                conn.execute(insert(kv_entries).values(key=key, value=value, expires_at=time.time() + ttl))
+        except IntegrityError:
+            pass  # 다른 워커가 같은 순간에 같은 키를 썼음 (어느 쪽 값이든 최신)
+
+    def delete(self, key: str):
+        with self.engine.begin() as conn:
+            conn.execute(delete(kv_entries).where(kv_entries.c.key == key))
+
+    def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        now = time.time()
+        with self.engine.begin() as conn:
+            taken = conn.execute(
+                update(leases)
+                .where(leases.c.name == name)
+                .where(or_(leases.c.owner == owner, leases.c.expires_at < now))
+                .values(owner=owner, expires_at=now + ttl)
+            ).rowcount
+        if taken:
+            return True
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(insert(leases).values(name=name, owner=owner, expires_at=now + ttl))
+            return True
+        except IntegrityError:
+            return False  # 다른 워커가 보유 중
+
+    def release_lease(self, name: str, owner: str):
+        with self.engine.begin() as conn:
+            conn.execute(delete(leases).where(leases.c.name == name).where(leases.c.owner == owner))
@@ -0,0 +1,174 @@
+"""
+시즌 순위 / 득실점 / 이닝별 득점 분포 집계
+game_data의 linescores 테이블(리뷰.csv)을 경기 단위로 더해 가며 팀 순위표를 유지합니다.
+
+- 경기가 새로 적재되면 그 경기의 기여분만 더합니다 (시즌 전체를 다시 계산하지 않음).
+- 파일이 바뀌어 다시 적재된 경기는 이전 기여분을 빼고 새 기여분을 더합니다.
+  그 경기가 팀의 공식 전적(reported) 출처였다면 남은 경기 중 가장 최근 것으로 다시 고릅니다.
+- 순위: 승률 = 승 / (승 + 패) (무승부 제외, KBO 방식), 게임차는 1위 기준
+- 이닝별 분포: 팀별 이닝 득점 / 실점 합계와 리그 전체의 이닝별 득점 히스토그램(0~5+점)
+- 스냅샷은 version이 바뀔 때만 다시 만들어 폴링 요청은 캐시된 dict를 받습니다.
+"""
+
+from typing import Dict, List, Optional
+
+from game_data import LINE_INNINGS, MISSING, GameDataStore
+
+HIST_BUCKETS = 6  # 0, 1, 2, 3, 4, 5+점
+
+
+def _new_totals() -> dict:
+    return {
+        "games": 0, "wins": 0, "losses": 0, "draws": 0,
+        "runs_for": 0, "runs_against": 0, "hits": 0, "errors": 0, "walks": 0,
+        "innings_for": [0] * LINE_INNINGS, "innings_against": [0] * LINE_INNINGS,
+    }
+
+
+class StandingsAggregator:
+    def __init__(self, store: GameDataStore):
+        self.store = store
+        self.teams: Dict[str, dict] = {}
+        self.inning_hist: List[List[int]] = [[0] * HIST_BUCKETS for _ in range(LINE_INNINGS)]
+        self.reported: Dict[str, dict] = {}   # 팀 → 가장 최근 경기(경기 ID 순)의 공식 전적 문자열 값
+        self._contributions: Dict[str, dict] = {}
+        self.version = 0
+        self.skipped = 0
+        self._snapshot: Optional[dict] = None
+        self._snapshot_version = -1
+        for game_id in store.game_ids:
+            self.ingest(game_id)
+        store.on_ingest(self.ingest)
+
+    # ============================================
+    # 증분 반영
+    # ============================================
+
+    def _contribution(self, game_id: str) -> Optional[dict]:
+        lines = self.store.linescores
+        rows = lines.rows(lines.game_rows(self.store.game_index(game_id)))
+        if len(rows) != 2 or any(row["runs"] == MISSING for row in rows):
+            return None
+        teams = {}
+        hist = []
+        for row, opponent in ((rows[0], rows[1]), (rows[1], rows[0])):
+            innings = [row[f"inning_{n}"] for n in range(1, LINE_INNINGS + 1)]
+            against = [opponent[f"inning_{n}"] for n in range(1, LINE_INNINGS + 1)]
+            teams[row["team"]] = {
+                "games": 1,
+                "wins": int(row["runs"] > opponent["runs"]),
+                "losses": int(row["runs"] < opponent["runs"]),
+                "draws": int(row["runs"] == opponent["runs"]),
+                "runs_for": row["runs"], "runs_against": opponent["runs"],
+                "hits": max(row["hits"], 0), "errors": max(row["errors"], 0), "walks": max(row["walks"], 0),
+                "innings_for": [max(r, 0) for r in innings],
+                "innings_against": [max(r, 0) for r in against],
+            }
+            # 치르지 않은 이닝("-")은 분포에서 제외
+            hist.extend((n, min(r, HIST_BUCKETS - 1)) for n, r in enumerate(innings) if r != MISSING)
+            if row["wins"] != MISSING:
+                teams[row["team"]]["reported"] = {
+                    "game": game_id, "wins": row["wins"], "losses": row["losses"], "draws": row["draws"],
+                }
+        return {"teams": teams, "hist": hist}
+
+    def _apply(self, contribution: dict, sign: int):
+        for team, values in contribution["teams"].items():
+            totals = self.teams.setdefault(team, _new_totals())
+            for key, value in values.items():
+                if key == "reported":
+                    continue
+                if isinstance(value, list):
+                    target = totals[key]
+                    for i, v in enumerate(value):
+                        target[i] += sign * v
+                else:
+                    totals[key] += sign * value
+            if totals["games"] == 0:
+                del self.teams[team]
+        for inning, bucket in contribution["hist"]:
+            self.inning_hist[inning][bucket] += sign
+
+    def ingest(self, game_id: str):
+        """경기 하나를 (다시) 반영합니다. GameDataStore.on_ingest 콜백"""
+        stale = set()  # 이 경기의 공식 전적을 쓰고 있던 팀
+        previous = self._contributions.pop(game_id, None)
+        if previous is not None:
+            self._apply(previous, -1)
+            for team, values in previous["teams"].items():
+                if "reported" in values and self.reported.get(team, {}).get("game") == game_id:
+                    del self.reported[team]
+                    stale.add(team)
+        contribution = self._contribution(game_id)
+        if contribution is None:
+            if self.store.linescores.game_rows(self.store.game_index(game_id)):
+                self.skipped += 1
+        else:
+            self._apply(contribution, +1)
+            self._contributions[game_id] = contribution
+            for team, values in contribution["teams"].items():
+                reported = values.get("reported")
+                if reported and reported["game"] >= self.reported.get(team, {}).get("game", ""):
+                    self.reported[team] = reported
+        for team in stale - self.reported.keys():
+            self._recompute_reported(team)
+        self.version += 1
+
+    def _recompute_reported(self, team: str):
+        """남은 경기 중 경기 ID가 가장 큰 것의 공식 전적 (없으면 비움)"""
+        candidates = [
+            c["teams"][team]["reported"] for c in self._contributions.values()
+            if "reported" in c["teams"].get(team, {})
+        ]
+        if candidates:
+            self.reported[team] = max(candidates, key=lambda r: r["game"])
+
+    # ============================================
+    # 조회 (version이 같으면 캐시된 스냅샷)
+    # ============================================
+
+    def snapshot(self) -> dict:
+        if self._snapshot is None or self._snapshot_version != self.version:
+            self._snapshot = self._build()
+            self._snapshot_version = self.version
+        return self._snapshot
+
+    def _build(self) -> dict:
+        rows = []
+        for team, t in self.teams.items():
+            decided = t["wins"] + t["losses"]
+            rows.append({
+                "team": team,
+                "games": t["games"], "wins": t["wins"], "losses": t["losses"], "draws": t["draws"],
+                "pct": round(t["wins"] / decided, 3) if decided else 0.0,
+                "runs_for": t["runs_for"], "runs_against": t["runs_against"],
+                "run_differential": t["runs_for"] - t["runs_against"],
+                "runs_per_game": round(t["runs_for"] / t["games"], 2),
+                "hits": t["hits"], "errors": t["errors"], "walks": t["walks"],
+                "innings_for": list(t["innings_for"]),
+                "innings_against": list(t["innings_against"]),
+                "reported": self.reported.get(team),
+            })
+        rows.sort(key=lambda r: (-r["pct"], -r["wins"], r["team"]))
+        if rows:
+            leader = rows[0]
+            for rank, row in enumerate(rows, 1):
+                row["rank"] = rank
+                row["games_behind"] = ((leader["wins"] - row["wins"]) + (row["losses"] - leader["losses"])) / 2
+
+        innings = []
+        for n, hist in enumerate(self.inning_hist, 1):
+            halves = sum(hist)
+            if not halves:
+                continue
+            innings.append({
+                "inning": n,
+                "half_innings": halves,
+                "runs": sum(t["innings_for"][n - 1] for t in self.teams.values()),
+                "scoring_rate": round(1 - hist[0] / halves, 3),
+                "histogram": {("5+" if b == HIST_BUCKETS - 1 else str(b)): c for b, c in enumerate(hist)},
+            })
+        return {"version": self.version, "games": len(self._contributions), "standings": rows, "innings": innings}
+
+    def stats(self) -> dict:
+        return {"games": len(self._contributions), "teams": len(self.teams), "version": self.version, "skipped": self.skipped}
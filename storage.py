@@ -0,0 +1,174 @@
+"""
+영속 저장소 계층
+사용자 / 기사 저장소의 공통 인터페이스(리포지토리)와 백엔드 선택 팩토리입니다.
+
+백엔드 (STORAGE_BACKEND 환경 변수):
+- sqlite (기본, SQLAlchemy 설치 시): DATABASE_URL(기본 sqlite:///./data/sports.db)에 저장.
+  재시작해도 데이터가 남고 여러 uvicorn 워커가 같은 DB를 공유합니다. sql_storage 참고.
+- memory: 프로세스 메모리 dict (article_store / user_store). 테스트·로컬 실험용.
+
+레코드는 두 백엔드 모두 dict로 주고받으므로 엔드포인트 코드는 백엔드와 무관합니다.
+스크래핑 결과 같은 워커 간 공유 캐시와 리스(lease)는 KeyValueStore로 같은 백엔드에 둡니다.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import os
+
+try:
+    import sqlalchemy  # noqa: F401
+    SQLALCHEMY_AVAILABLE = True
+except ImportError:
+    SQLALCHEMY_AVAILABLE = False
+
+DEFAULT_DATABASE_URL = "sqlite:///./data/sports.db"
+
+
+class UserRepository(ABC):
+    """사용자 저장소. email / username / kakaoId는 고유하며 중복이면 DuplicateUserError."""
+
+    @abstractmethod
+    def add(self, data: dict) -> dict: ...
+
+    @abstractmethod
+    def get_or_create(self, field: str, value: str, factory: Callable[[], dict]) -> dict: ...
+
+    @abstractmethod
+    def on_delete(self, listener: Callable[[dict], None]): ...
+
+    @abstractmethod
+    def delete(self, user_id: int) -> Optional[dict]: ...
+
+    @abstractmethod
+    def get(self, user_id: int) -> Optional[dict]: ...
+
+    @abstractmethod
+    def get_by_email(self, email: str) -> Optional[dict]: ...
+
+    @abstractmethod
+    def get_by_username(self, username: str) -> Optional[dict]: ...
+
+    @abstractmethod
+    def get_by_kakao_id(self, kakao_id: str) -> Optional[dict]: ...
+
+
+class ArticleRepository(ABC):
+    """기사 저장소. 목록은 (updated_at, id) 내림차순 키셋 페이지네이션."""
+
+    @abstractmethod
+    def add(self, data: dict) -> dict: ...
+
+    @abstractmethod
+    def get(self, article_id: int) -> Optional[dict]: ...
+
+    @abstractmethod
+    def update(self, article_id: int, changes: dict) -> Optional[dict]: ...
+
+    @abstractmethod
+    def delete(self, article_id: int) -> Optional[dict]: ...
+
+    @abstractmethod
+    def increment_views(self, article_id: int, amount: int = 1) -> Optional[int]: ...
+
+    @abstractmethod
+    def apply_view_deltas(self, deltas: Dict[int, int]) -> int: ...
+
+    @abstractmethod
+    def page(
+        self,
+        status: Optional[str] = None,
+        limit: int = 20,
+        after: Optional[Tuple[int, int]] = None,
+        skip: int = 0,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Tuple[List[dict], Optional[Tuple[int, int]]]:
+        """
+        fields는 응답에 담을 필드(None이면 요약 투영, article_projection 참고)입니다.
+        백엔드는 그 필드와 id / updated_at만 채워 반환해도 됩니다.
+        """
+
+    @abstractmethod
+    def count(self, status: Optional[str] = None) -> int: ...
+
+
+class KeyValueStore(ABC):
+    """
+    워커 간 공유 키-값 저장소 (JSON 직렬화 가능한 값) + 리스.
+    리스는 이름별로 한 소유자만 ttl 동안 가질 수 있어, 여러 워커 중 하나만 작업하게 할 때 씁니다.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """(값, 만료 시각(epoch 초))을 반환합니다. 만료된 항목도 반환하므로 신선도는 호출자가 판단합니다."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float): ...
+
+    @abstractmethod
+    def delete(self, key: str): ...
+
+    @abstractmethod
+    def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        """비어 있거나 만료됐거나 이미 owner 소유인 리스를 ttl 동안 잡습니다."""
+
+    @abstractmethod
+    def release_lease(self, name: str, owner: str): ...
+
+
+class Storage:
+    """선택된 백엔드의 사용자 / 기사 저장소와 공유 키-값 저장소 묶음"""
+
+    def __init__(
+        self,
+        backend: str,
+        users: UserRepository,
+        articles: ArticleRepository,
+        kv: KeyValueStore,
+        close: Callable[[], None] = None,
+    ):
+        self.backend = backend
+        self.users = users
+        self.articles = articles
+        self.kv = kv
+        self._close = close
+
+    def close(self):
+        if self._close is not None:
+            self._close()
+
+    @property
+    def shared(self) -> bool:
+        """여러 프로세스(uvicorn 워커)가 같은 데이터를 보는 백엔드인지"""
+        return self.backend != "memory"
+
+    def stats(self) -> dict:
+        return {"backend": self.backend, "shared": self.shared, "articles": self.articles.count()}
+
+
+def create_storage(backend: Optional[str] = None, url: Optional[str] = None) -> Storage:
+    """
+    설정에 맞는 저장소를 만듭니다.
+    backend가 없으면 STORAGE_BACKEND, 그것도 없으면 SQLAlchemy가 있을 때 sqlite, 없으면 memory.
+    """
+    backend = (backend or os.getenv("STORAGE_BACKEND") or ("sqlite" if SQLALCHEMY_AVAILABLE else "memory")).lower()
+
+    if backend == "memory":
+        from article_store import ArticleStore
+        from kv_store import MemoryKeyValueStore
+        from user_store import UserStore
+        return Storage("memory", UserStore(), ArticleStore(), MemoryKeyValueStore())
+
+    if backend in ("sqlite", "sql"):
+        if not SQLALCHEMY_AVAILABLE:
+            raise RuntimeError("STORAGE_BACKEND=sqlite requires SQLAlchemy (pip install SQLAlchemy)")
+        from sql_storage import SqlArticleRepository, SqlKeyValueStore, SqlUserRepository, shared_engine
+        engine = shared_engine(url or os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL))
+        return Storage(
+            backend,
+            SqlUserRepository(engine),
+            SqlArticleRepository(engine),
+            SqlKeyValueStore(engine),
+            close=engine.dispose,
+        )
+
+    raise ValueError(f"Unknown STORAGE_BACKEND: {backend}")
@@ -0,0 +1,88 @@
+"""
+검증된 JWT 캐시
+토큰 -> 디코딩된 사용자 정보(principal)를 LRU + TTL로 보관하여
+반복 요청에서 HMAC 검증과 클레임 파싱을 건너뜁니다.
+
+- 항목은 토큰의 exp 이전에 만료됩니다 (min(exp, 저장 시각 + ttl)).
+- 사용자 삭제 시 invalidate_user(), 비밀키 교체 시 clear()로 제거합니다.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional, Set
+import threading
+import time
+
+
+class TokenCache:
+    def __init__(self, maxsize: int = 10_000, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # token -> (principal, expires_at)
+        self._by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, token: str):
+        principal, _ = self._entries.pop(token)
+        tokens = self._by_user.get(principal["user_id"])
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._by_user[principal["user_id"]]
+
+    def get(self, token: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                self.misses += 1
+                return None
+            principal, expires_at = entry
+            if time.time() >= expires_at:
+                self._remove(token)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return principal
+
+    def put(self, token: str, principal: dict, exp: Optional[float] = None):
+        """principal을 저장합니다. exp(epoch 초)가 주어지면 그 이후로는 캐시하지 않습니다."""
+        expires_at = time.time() + self.ttl
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        with self._lock:
+            if token in self._entries:
+                self._remove(token)
+            self._entries[token] = (principal, expires_at)
+            self._by_user.setdefault(principal["user_id"], set()).add(token)
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate_user(self, user_id: int):
+        """해당 사용자의 모든 토큰 항목을 제거합니다."""
+        with self._lock:
+            for token in list(self._by_user.get(user_id, ())):
+                self._remove(token)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
@@ -0,0 +1,97 @@
+"""
+사용자 인메모리 저장소
+id / email / username / kakaoId 고유 해시 인덱스로 로그인·회원가입 조회를 O(1)로 처리합니다.
+"""
+
+from typing import Callable, Dict, List, Optional
+import threading
+
+from storage import UserRepository
+
+# 고유 인덱스를 유지할 필드 (id는 별도 기본 인덱스)
+UNIQUE_FIELDS = ("email", "username", "kakaoId")
+
+
+class DuplicateUserError(Exception):
+    """고유 필드 값이 이미 사용 중일 때 발생합니다."""
+
+    def __init__(self, field: str):
+        super().__init__(f"{field} already exists")
+        self.field = field
+
+
+class UserStore(UserRepository):
+    """
+    사용자 레코드(dict)를 보관하는 인메모리 저장소 (STORAGE_BACKEND=memory, 테스트용).
+
+    중복 검사와 삽입은 하나의 락 안에서 수행되므로
+    동시에 들어온 회원가입이 같은 email / username으로 중복 생성되지 않습니다.
+    값이 없는 필드(예: 카카오 사용자의 username)는 인덱스에 넣지 않습니다.
+    """
+
+    def __init__(self):
+        self._by_id: Dict[int, dict] = {}
+        self._unique: Dict[str, Dict[str, dict]] = {field: {} for field in UNIQUE_FIELDS}
+        self._next_id = 1
+        self._lock = threading.RLock()
+        self._delete_listeners: List[Callable[[dict], None]] = []
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def _check_unique(self, data: dict):
+        for field in UNIQUE_FIELDS:
+            value = data.get(field)
+            if value is not None and value in self._unique[field]:
+                raise DuplicateUserError(field)
+
+    def add(self, data: dict) -> dict:
+        """고유성 검사 후 새 id를 할당해 저장합니다. 중복이면 DuplicateUserError."""
+        with self._lock:
+            self._check_unique(data)
+            user = dict(data)
+            user["id"] = self._next_id
+            self._next_id += 1
+            self._by_id[user["id"]] = user
+            for field in UNIQUE_FIELDS:
+                value = user.get(field)
+                if value is not None:
+                    self._unique[field][value] = user
+            return user
+
+    def get_or_create(self, field: str, value: str, factory: Callable[[], dict]) -> dict:
+        """field 값으로 사용자를 찾고, 없으면 factory()로 만든 레코드를 원자적으로 추가합니다."""
+        with self._lock:
+            user = self._unique[field].get(value)
+            if user is None:
+                user = self.add(factory())
+            return user
+
+    def on_delete(self, listener: Callable[[dict], None]):
+        """사용자 삭제 시 호출될 콜백을 등록합니다 (예: 토큰 캐시 무효화)."""
+        self._delete_listeners.append(listener)
+
+    def delete(self, user_id: int) -> Optional[dict]:
+        with self._lock:
+            user = self._by_id.pop(user_id, None)
+            if user is not None:
+                for field in UNIQUE_FIELDS:
+                    value = user.get(field)
+                    if value is not None:
+                        self._unique[field].pop(value, None)
+        if user is not None:
+            for listener in self._delete_listeners:
+                listener(user)
+        return user
+
+    def get(self, user_id: int) -> Optional[dict]:
+        return self._by_id.get(user_id)
+
+    def get_by_email(self, email: str) -> Optional[dict]:
+        return self._unique["email"].get(email)
+
+    def get_by_username(self, username: str) -> Optional[dict]:
+        return self._unique["username"].get(username)
+
+    def get_by_kakao_id(self, kakao_id: str) -> Optional[dict]:
+        return self._unique["kakaoId"].get(kakao_id)
@@ -0,0 +1,155 @@
+"""
+쓰기 지연(write-behind) 조회수 카운터
+조회수 증가를 요청마다 저장소에 쓰지 않고 샤드별 메모리 카운터에 모았다가
+주기적으로 한 번의 배치 갱신(UPDATE ... SET views = views + delta)으로 반영합니다.
+
+- 샤드(기본 16개)마다 잠금이 따로 있어 증가 경로의 잠금 경합이 적음
+- 읽기는 저장된 값 + 아직 반영되지 않은 증가분(pending)을 돌려줌
+- 종료 시(stop) 남은 증가분을 모두 반영
+- 반영(sink)이 실패하면 증가분을 되돌려 다음 주기에 다시 시도
+- 주기 반영은 스레드풀에서 실행해 DB 쓰기가 이벤트 루프를 막지 않음
+"""
+
+from typing import Callable, Dict, List, Optional
+import asyncio
+import os
+import threading
+
+from starlette.concurrency import run_in_threadpool
+
+
+class _Shard:
+    __slots__ = ("lock", "deltas")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.deltas: Dict[int, int] = {}
+
+
+class ViewCounter:
+    def __init__(
+        self,
+        sink: Callable[[Dict[int, int]], object],
+        shards: int = 16,
+        interval: float = 1.0,
+    ):
+        """
+        sink: {id: 증가분}을 받아 한 번에 저장소에 반영하는 함수
+              (예: ArticleStore.apply_view_deltas, SQL executemany UPDATE)
+        """
+        self.sink = sink
+        self.interval = interval
+        self._shards: List[_Shard] = [_Shard() for _ in range(max(1, shards))]
+        self._flush_lock = threading.Lock()
+        self._loop_task: Optional[asyncio.Task] = None
+        self.increments = 0
+        self.flushes = 0
+        self.flushed_rows = 0
+        self.failures = 0
+
+    @classmethod
+    def from_env(cls, sink: Callable[[Dict[int, int]], object]) -> "ViewCounter":
+        return cls(
+            sink,
+            shards=int(os.getenv("VIEW_COUNTER_SHARDS", 16)),
+            interval=float(os.getenv("VIEW_FLUSH_INTERVAL", 1.0)),
+        )
+
+    def _shard(self, key: int) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    # ============================================
+    # 증가 / 읽기
+    # ============================================
+
+    def incr(self, key: int, amount: int = 1) -> int:
+        """증가분을 쌓고 해당 키의 미반영 합계를 반환합니다."""
+        shard = self._shard(key)
+        with shard.lock:
+            pending = shard.deltas.get(key, 0) + amount
+            shard.deltas[key] = pending
+        self.increments += amount
+        return pending
+
+    def pending(self, key: int) -> int:
+        """아직 저장소에 반영되지 않은 증가분"""
+        return self._shard(key).deltas.get(key, 0)
+
+    def discard(self, key: int):
+        """삭제된 기사처럼 더 이상 반영할 필요가 없는 증가분을 버립니다."""
+        shard = self._shard(key)
+        with shard.lock:
+            shard.deltas.pop(key, None)
+
+    # ============================================
+    # 반영
+    # ============================================
+
+    def _drain(self) -> Dict[int, int]:
+        batch: Dict[int, int] = {}
+        for shard in self._shards:
+            if not shard.deltas:
+                continue
+            with shard.lock:
+                deltas, shard.deltas = shard.deltas, {}
+            batch.update(deltas)  # 키는 한 샤드에만 있으므로 겹치지 않음
+        return batch
+
+    def _restore(self, batch: Dict[int, int]):
+        for key, amount in batch.items():
+            shard = self._shard(key)
+            with shard.lock:
+                shard.deltas[key] = shard.deltas.get(key, 0) + amount
+
+    def flush(self) -> int:
+        """
+        쌓인 증가분을 한 번의 sink 호출로 반영하고 반영한 키 수를 반환합니다.
+        flush 사이에 들어온 증가는 다음 flush에 포함됩니다.
+        """
+        with self._flush_lock:
+            batch = self._drain()
+            if not batch:
+                return 0
+            try:
+                self.sink(batch)
+            except Exception:
+                self.failures += 1
+                self._restore(batch)
+                raise
+            self.flushes += 1
+            self.flushed_rows += len(batch)
+            return len(batch)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await run_in_threadpool(self.flush)
+            except Exception:
+                pass  # 증가분은 되돌려졌으므로 다음 주기에 재시도
+
+    def start(self):
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """주기 작업을 멈추고 남은 증가분을 모두 반영합니다."""
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
+        await run_in_threadpool(self.flush)
+
+    def stats(self) -> dict:
+        return {
+            "shards": len(self._shards),
+            "interval": self.interval,
+            "pending_keys": sum(len(shard.deltas) for shard in self._shards),
+            "increments": self.increments,
+            "flushes": self.flushes,
+            "flushed_rows": self.flushed_rows,
+            "failures": self.failures,
+        }